@@ -2,13 +2,38 @@
 Configuração do pytest para carregar variáveis de ambiente de teste.
 """
 import os
+import sys
 from pathlib import Path
-from dotenv import load_dotenv
 
-# Carrega as variáveis de ambiente do arquivo .env.test
-env_path = Path(__file__).parent / ".env.test"
-load_dotenv(dotenv_path=env_path)
+ROOT_DIR = Path(__file__).parent.absolute()
 
-# Configura o ambiente para teste
-os.environ["ENVIRONMENT"] = "test"
-os.environ["PYTHONPATH"] = str(Path(__file__).parent.absolute())
+
+def _load_env_file(path: Path) -> None:
+    """Carrega variáveis no formato CHAVE=valor sem sobrescrever as existentes."""
+    if not path.exists():
+        return
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        if line.startswith("export "):
+            line = line[len("export "):]
+        key, value = line.split("=", 1)
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+            value = value[1:-1]
+        os.environ.setdefault(key.strip(), value)
+
+
+# Carrega as variáveis de ambiente do arquivo .env.test uma única vez; processos
+# filhos herdam o ambiente já preparado
+if os.environ.get("_CONFTEST_LOADED") != "1":
+    _load_env_file(ROOT_DIR / ".env.test")
+
+    # Configura o ambiente para teste
+    os.environ["ENVIRONMENT"] = "test"
+    os.environ["_CONFTEST_LOADED"] = "1"
+
+# Alterar PYTHONPATH depois da inicialização não afeta o sys.path
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
@@ -10,13 +10,11 @@ from pathlib import Path
 # Caminho para o diretório de exemplos
 EXAMPLES_DIR = Path(__file__).parent.absolute()
 
-# Lista de exemplos disponíveis
-AVAILABLE_EXAMPLES = [
+# Exemplos disponíveis; consultados sem acessar o sistema de arquivos
+AVAILABLE_EXAMPLES = frozenset({
     'web_automation_example.py',
     'desktop_automation_example.py',
-    'llm_integration_example.py',
-    'security_example.py'
-]
+})
 
 def get_example_path(example_name: str) -> Path:
     """
@@ -36,8 +34,9 @@ def get_example_path(example_name: str) -> Path:
     
     example_path = EXAMPLES_DIR / example_name
     
-    if not example_path.exists():
-        available = '\n  - '.join(AVAILABLE_EXAMPLES)
+    # Exemplos conhecidos dispensam a verificação no disco
+    if example_name not in AVAILABLE_EXAMPLES and not example_path.exists():
+        available = '\n  - '.join(sorted(AVAILABLE_EXAMPLES))
         raise FileNotFoundError(
             f"Exemplo '{example_name}' não encontrado.\n"
             f"Exemplos disponíveis:\n  - {available}"
@@ -8,10 +8,11 @@ e interação com janelas.
 
 import asyncio
 import logging
+import logging.handlers
 import os
 import sys
 from pathlib import Path
-from time import sleep
+from time import monotonic, sleep
 
 # Adiciona o diretório raiz ao path do Python
 sys.path.append(str(Path(__file__).parent.parent.absolute()))
@@ -19,12 +20,21 @@ sys.path.append(str(Path(__file__).parent.parent.absolute()))
 from src.automation.desktop import DesktopController, MouseButton, KeyAction
 
 # Configuração básica de logging
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# O arquivo só é aberto na primeira gravação, e as mensagens são acumuladas em
+# memória e gravadas em lote (imediatamente em caso de erro ou ao encerrar)
+file_handler = logging.FileHandler('desktop_automation.log', encoding='utf-8', delay=True)
+file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler('desktop_automation.log')
+        logging.handlers.MemoryHandler(
+            capacity=1000, flushLevel=logging.ERROR, target=file_handler
+        )
     ]
 )
 
@@ -32,6 +42,25 @@ logger = logging.getLogger(__name__)
 
 # Funções de exemplo
 
+def wait_for_focus(desktop: DesktopController, timeout: float = 1.0) -> None:
+    """Aguarda o foco se estabilizar após uma ação, em vez de uma pausa fixa.
+    
+    Consulta a janela ativa com intervalos crescentes (de 5 ms a 50 ms) até
+    que duas leituras seguidas coincidam. Se a ação não muda o foco, a espera
+    termina na primeira verificação.
+    """
+    deadline = monotonic() + timeout
+    delay = 0.005
+    previous = desktop.get_active_window()
+    while monotonic() < deadline:
+        sleep(delay)
+        current = desktop.get_active_window()
+        if current == previous:
+            return
+        previous = current
+        delay = min(delay * 2, 0.05)
+
+
 def example_mouse_control(desktop: DesktopController):
     """Demonstra o controle do mouse."""
     logger.info("=== Exemplo: Controle do Mouse ===")
@@ -39,31 +68,28 @@ def example_mouse_control(desktop: DesktopController):
     # Move o mouse para uma posição específica
     desktop.move_mouse(100, 100)
     logger.info("Mouse movido para (100, 100)")
-    sleep(1)
     
     # Clique simples
     desktop.click(200, 200)
+    wait_for_focus(desktop)
     logger.info("Clique simples em (200, 200)")
-    sleep(1)
     
     # Clique com o botão direito
     desktop.click(300, 200, button=MouseButton.RIGHT)
+    wait_for_focus(desktop)
     logger.info("Clique com botão direito em (300, 200)")
-    sleep(1)
     
     # Duplo clique
     desktop.click(400, 200, clicks=2, interval=0.2)
+    wait_for_focus(desktop)
     logger.info("Duplo clique em (400, 200)")
-    sleep(1)
     
     # Roda do mouse
     desktop.scroll(5)  # Rola para cima
     logger.info("Rolagem para cima")
-    sleep(1)
     
     desktop.scroll(-5)  # Rola para baixo
     logger.info("Rolagem para baixo")
-    sleep(1)
 
 
 def example_keyboard_control(desktop: DesktopController):
@@ -73,22 +99,19 @@ def example_keyboard_control(desktop: DesktopController):
     # Digita um texto
     desktop.type_text("Olá, mundo!")
     logger.info("Texto digitado: 'Olá, mundo!'")
-    sleep(1)
     
     # Pressiona a tecla Enter
     desktop.press_key("enter")
+    wait_for_focus(desktop)
     logger.info("Tecla Enter pressionada")
-    sleep(1)
     
     # Combinação de teclas (Ctrl+A para selecionar tudo)
     desktop.press_key(["ctrl", "a"])
     logger.info("Ctrl+A pressionado")
-    sleep(1)
     
     # Pressiona a tecla Delete
     desktop.press_key("delete")
     logger.info("Tecla Delete pressionada")
-    sleep(1)
 
 def example_window_management(desktop: DesktopController):
     """Demonstra o gerenciamento de janelas."""
@@ -125,20 +148,20 @@ def example_screen_capture(desktop: DesktopController):
     screenshots_dir = Path("screenshots")
     screenshots_dir.mkdir(exist_ok=True)
     
-    # Captura a tela inteira
-    screenshot_path = screenshots_dir / "tela_inteira.png"
-    desktop.capture_screen(save_path=screenshot_path)
-    logger.info(f"Captura de tela salva em: {screenshot_path}")
-    
-    # Captura uma região específica (canto superior esquerdo)
+    # Inicia o OCR de uma região específica (canto superior esquerdo); o texto é
+    # reconhecido em segundo plano enquanto as capturas abaixo são feitas
     region = (0, 0, 400, 300)
-    region_path = screenshots_dir / "regiao_especifica.png"
-    desktop.capture_screen(region=region, save_path=region_path)
-    logger.info(f"Captura de região salva em: {region_path}")
+    ocr = desktop.extract_text_from_screen_async(region=region)
+    
+    # Captura a tela inteira e a região; os PNGs são gravados em segundo plano
+    for name, capture_region in (("tela_inteira", None), ("regiao_especifica", region)):
+        image_path = screenshots_dir / f"{name}.png"
+        desktop.capture_screen(region=capture_region, save_path=image_path, async_save=True)
+        logger.info(f"Captura enviada para gravação em: {image_path}")
     
-    # Tenta extrair texto da região capturada
+    # Aguarda o texto somente depois de enfileirados o OCR e as gravações
     try:
-        text = desktop.extract_text_from_screen(region=region)
+        text = ocr.result()
         if text:
             logger.info("\nTexto extraído da região:")
             logger.info(text)
@@ -146,6 +169,9 @@ def example_screen_capture(desktop: DesktopController):
             logger.info("Nenhum texto encontrado na região.")
     except Exception as e:
         logger.warning(f"Não foi possível extrair texto: {e}")
+    
+    desktop.flush_pending_saves()
+    logger.info(f"Capturas salvas em: {screenshots_dir}")
 
 def main():
     """Função principal que executa os exemplos."""
@@ -8,21 +8,31 @@ como navegar para um site, preencher um formulário e extrair dados.
 import asyncio
 import json
 import logging
+import logging.handlers
 from pathlib import Path
 
 # Adiciona o diretório raiz ao path do Python
 import sys
 sys.path.append(str(Path(__file__).parent.parent.absolute()))
 
-from src.automation.web.browser import BrowserManager
+from src.automation.web.browser import BrowserManager, shutdown_playwright
 
 # Configuração básica de logging
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# O arquivo só é aberto na primeira gravação, e as mensagens são acumuladas em
+# memória e gravadas em lote (imediatamente em caso de erro ou ao encerrar)
+file_handler = logging.FileHandler('web_automation.log', encoding='utf-8', delay=True)
+file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler('web_automation.log')
+        logging.handlers.MemoryHandler(
+            capacity=1000, flushLevel=logging.ERROR, target=file_handler
+        )
     ]
 )
 
@@ -95,5 +105,12 @@ async def example_automation():
             logger.error(f"Erro durante a execução: {str(e)}", exc_info=True)
             raise
 
+async def main():
+    """Executa o exemplo e encerra o Playwright compartilhado ao final."""
+    try:
+        await example_automation()
+    finally:
+        await shutdown_playwright()
+
 if __name__ == "__main__":
-    asyncio.run(example_automation())
+    asyncio.run(main())
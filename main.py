@@ -15,7 +15,14 @@ from loguru import logger
 # Adiciona o diretório raiz ao path do Python
 sys.path.append(str(Path(__file__).parent.absolute()))
 
-# Configuração básica de logging
+from src.config import setup_logging
+
+# Tamanho do buffer do arquivo de log; o loguru grava linha a linha por padrão
+LOG_BUFFER_SIZE = 256 * 1024
+
+# Configuração básica de logging. Com `enqueue=True` a formatação e a escrita
+# ocorrem em uma thread separada; o buffer agrupa as escritas em disco, que são
+# descarregadas na rotação do arquivo e no encerramento do programa
 logger.add(
     "logs/automation.log",
     rotation="10 MB",
@@ -23,6 +30,7 @@ logger.add(
     level="INFO",
     format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}",
     enqueue=True,
+    buffering=LOG_BUFFER_SIZE,
 )
 
 class AutomationAgent:
@@ -49,6 +57,9 @@ class AutomationAgent:
 
 async def main():
     """Função principal de inicialização."""
+    # As mensagens do logging padrão, usado pelos módulos de automação, são
+    # escritas na thread do QueueListener, fora do laço de eventos
+    setup_logging()
     try:
         agent = AutomationAgent()
         await agent.run()
@@ -7,9 +7,14 @@ com interface de voz/texto e segurança robusta.
 
 __version__ = "0.1.0"
 
-# Importações principais para facilitar o acesso aos módulos
-from .config import settings
-
 __all__ = [
     'settings',
 ]
+
+
+def __getattr__(name):
+    """Carrega as configurações somente quando `settings` é acessado."""
+    if name == "settings":
+        from .config import get_settings
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
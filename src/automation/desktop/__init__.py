@@ -9,14 +9,18 @@ from .controller import (
     DesktopAutomationError,
     DesktopController,
     WindowInfo,
+    WindowTable,
     MouseButton,
     KeyAction,
+    TextRegion,
 )
 
 __all__ = [
     'DesktopAutomationError',
     'DesktopController',
     'WindowInfo',
+    'WindowTable',
     'MouseButton',
     'KeyAction',
+    'TextRegion',
 ]
@@ -0,0 +1,215 @@
+"""
+Acesso direto à API Win32 para o controlador de desktop.
+
+As funções deste módulo só podem ser usadas no Windows. Em outros sistemas
+`AVAILABLE` é False e o controlador recorre ao PyAutoGUI e ao PyGetWindow.
+"""
+
+import ctypes
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+
+AVAILABLE = sys.platform == "win32"
+
+# Códigos de tecla virtual (VK) para os nomes de tecla usados pelo PyAutoGUI
+KEY_NAME_TO_VK: Dict[str, int] = {
+    "backspace": 0x08, "tab": 0x09, "enter": 0x0D, "return": 0x0D,
+    "shift": 0x10, "ctrl": 0x11, "alt": 0x12, "pause": 0x13, "capslock": 0x14,
+    "esc": 0x1B, "escape": 0x1B, "space": 0x20, " ": 0x20,
+    "pageup": 0x21, "pgup": 0x21, "pagedown": 0x22, "pgdn": 0x22,
+    "end": 0x23, "home": 0x24, "left": 0x25, "up": 0x26, "right": 0x27, "down": 0x28,
+    "printscreen": 0x2C, "insert": 0x2D, "delete": 0x2E, "del": 0x2E,
+    "win": 0x5B, "winleft": 0x5B, "winright": 0x5C, "apps": 0x5D,
+    "shiftleft": 0xA0, "shiftright": 0xA1, "ctrlleft": 0xA2, "ctrlright": 0xA3,
+    "altleft": 0xA4, "altright": 0xA5,
+    **{chr(code): code for code in range(ord("0"), ord("9") + 1)},
+    **{chr(code).lower(): code for code in range(ord("A"), ord("Z") + 1)},
+    **{f"f{number}": 0x6F + number for number in range(1, 25)},
+}
+
+# Teclas que precisam do sinalizador KEYEVENTF_EXTENDEDKEY
+_EXTENDED_VKS = frozenset({
+    0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27, 0x28, 0x2C, 0x2D, 0x2E,
+    0x5B, 0x5C, 0x5D, 0xA3, 0xA5,
+})
+
+if AVAILABLE:
+    from ctypes import wintypes
+
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+
+    class WINDOWPLACEMENT(ctypes.Structure):
+        """Estrutura WINDOWPLACEMENT da API Win32."""
+        _fields_ = [
+            ("length", wintypes.UINT),
+            ("flags", wintypes.UINT),
+            ("showCmd", wintypes.UINT),
+            ("ptMinPosition", wintypes.POINT),
+            ("ptMaxPosition", wintypes.POINT),
+            ("rcNormalPosition", wintypes.RECT),
+        ]
+
+    WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+    
+    class MOUSEINPUT(ctypes.Structure):
+        """Estrutura MOUSEINPUT da API Win32 (necessária para o tamanho de INPUT)."""
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class KEYBDINPUT(ctypes.Structure):
+        """Estrutura KEYBDINPUT da API Win32."""
+        _fields_ = [
+            ("wVk", wintypes.WORD),
+            ("wScan", wintypes.WORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class HARDWAREINPUT(ctypes.Structure):
+        """Estrutura HARDWAREINPUT da API Win32 (necessária para o tamanho de INPUT)."""
+        _fields_ = [
+            ("uMsg", wintypes.DWORD),
+            ("wParamL", wintypes.WORD),
+            ("wParamH", wintypes.WORD),
+        ]
+
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT), ("hi", HARDWAREINPUT)]
+
+    class INPUT(ctypes.Structure):
+        """Estrutura INPUT da API Win32."""
+        _anonymous_ = ("u",)
+        _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+    INPUT_KEYBOARD = 1
+    KEYEVENTF_EXTENDEDKEY = 0x0001
+    KEYEVENTF_KEYUP = 0x0002
+
+    SW_SHOWMINIMIZED = 2
+    SW_SHOWMAXIMIZED = 3
+
+    user32.GetWindowTextLengthW.argtypes = [wintypes.HWND]
+    user32.GetWindowTextLengthW.restype = ctypes.c_int
+    user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+    user32.GetWindowTextW.restype = ctypes.c_int
+    user32.GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+    user32.GetWindowRect.restype = wintypes.BOOL
+    user32.GetWindowPlacement.argtypes = [wintypes.HWND, ctypes.POINTER(WINDOWPLACEMENT)]
+    user32.GetWindowPlacement.restype = wintypes.BOOL
+    user32.EnumWindows.argtypes = [WNDENUMPROC, wintypes.LPARAM]
+    user32.EnumWindows.restype = wintypes.BOOL
+    user32.IsWindowVisible.argtypes = [wintypes.HWND]
+    user32.IsWindowVisible.restype = wintypes.BOOL
+    user32.GetForegroundWindow.argtypes = []
+    user32.GetForegroundWindow.restype = wintypes.HWND
+    user32.SendInput.argtypes = [wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int]
+    user32.SendInput.restype = wintypes.UINT
+    user32.GetCursorPos.argtypes = [ctypes.POINTER(wintypes.POINT)]
+    user32.GetCursorPos.restype = wintypes.BOOL
+    user32.SetCursorPos.argtypes = [ctypes.c_int, ctypes.c_int]
+    user32.SetCursorPos.restype = wintypes.BOOL
+
+
+def enum_windows() -> List[int]:
+    """Retorna os handles das janelas de nível superior visíveis, com um único EnumWindows."""
+    handles: List[int] = []
+    
+    def collect(hwnd: int, _lparam: int) -> bool:
+        if user32.IsWindowVisible(hwnd):
+            handles.append(hwnd)
+        return True
+    
+    if not user32.EnumWindows(WNDENUMPROC(collect), 0):
+        raise ctypes.WinError(ctypes.get_last_error())
+    return handles
+
+
+def get_foreground_window() -> Optional[int]:
+    """Retorna o handle da janela em primeiro plano ou None se não houver."""
+    return user32.GetForegroundWindow() or None
+
+
+def get_window_title(hwnd: int) -> str:
+    """Retorna o título de uma janela com uma única leitura de texto."""
+    length = user32.GetWindowTextLengthW(hwnd)
+    buffer = ctypes.create_unicode_buffer(length + 1)
+    user32.GetWindowTextW(hwnd, buffer, length + 1)
+    return buffer.value
+
+
+def get_window_rect(hwnd: int) -> Tuple[int, int, int, int]:
+    """Retorna (left, top, width, height) de uma janela com uma única chamada."""
+    rect = wintypes.RECT()
+    if not user32.GetWindowRect(hwnd, ctypes.byref(rect)):
+        raise ctypes.WinError(ctypes.get_last_error())
+    return rect.left, rect.top, rect.right - rect.left, rect.bottom - rect.top
+
+
+def get_window_state(hwnd: int) -> Tuple[bool, bool]:
+    """Retorna (is_maximized, is_minimized) de uma janela com uma única chamada."""
+    placement = WINDOWPLACEMENT()
+    placement.length = ctypes.sizeof(WINDOWPLACEMENT)
+    if not user32.GetWindowPlacement(hwnd, ctypes.byref(placement)):
+        raise ctypes.WinError(ctypes.get_last_error())
+    return (
+        placement.showCmd == SW_SHOWMAXIMIZED,
+        placement.showCmd == SW_SHOWMINIMIZED,
+    )
+
+
+def get_cursor_pos() -> Tuple[int, int]:
+    """Retorna a posição (x, y) do cursor com uma única chamada."""
+    point = wintypes.POINT()
+    if not user32.GetCursorPos(ctypes.byref(point)):
+        raise ctypes.WinError(ctypes.get_last_error())
+    return point.x, point.y
+
+
+def set_cursor_pos(x: int, y: int) -> None:
+    """Move o cursor instantaneamente para (x, y)."""
+    if not user32.SetCursorPos(int(x), int(y)):
+        raise ctypes.WinError(ctypes.get_last_error())
+
+
+def virtual_keys(keys: Sequence[str]) -> Optional[List[int]]:
+    """Converte nomes de teclas em códigos VK, ou None se algum não for conhecido.
+    
+    Letras maiúsculas e símbolos que exigem shift (ex.: "!") também retornam
+    None: o código VK envia apenas a tecla sem shift, enquanto o PyAutoGUI
+    pressiona shift para eles.
+    """
+    codes = []
+    for key in keys:
+        if key != key.lower():
+            return None
+        code = KEY_NAME_TO_VK.get(key)
+        if code is None:
+            return None
+        codes.append(code)
+    return codes
+
+
+def send_key_combo(vks: Sequence[int], presses: int = 1) -> None:
+    """Pressiona uma combinação de teclas `presses` vezes com um único SendInput.
+    
+    Em cada repetição as teclas são pressionadas na ordem dada e soltas na
+    ordem inversa, como no `pyautogui.hotkey`.
+    """
+    sequence = [(vk, 0) for vk in vks] + [(vk, KEYEVENTF_KEYUP) for vk in reversed(vks)]
+    events = (INPUT * (len(sequence) * presses))()
+    for index, (vk, flags) in enumerate(sequence * presses):
+        event = events[index]
+        event.type = INPUT_KEYBOARD
+        event.ki.wVk = vk
+        event.ki.dwFlags = flags | (KEYEVENTF_EXTENDEDKEY if vk in _EXTENDED_VKS else 0)
+    
+    sent = user32.SendInput(len(events), events, ctypes.sizeof(INPUT))
+    if sent != len(events):
+        raise ctypes.WinError(ctypes.get_last_error())
@@ -8,27 +8,116 @@ Fornece funcionalidades para automação de aplicativos desktop, incluindo:
 - Reconhecimento de imagens na tela
 """
 
+import asyncio
+import importlib
 import logging
+import operator
 import os
+import queue
+import re
+import shutil
+import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Protocol, Set,
+    Tuple, Union,
+)
 
-import pyautogui
-import pygetwindow as gw
-import pytesseract
-from PIL import Image, ImageGrab
+# Dependências opcionais para localização de imagens com OpenCV
+try:
+    import cv2
+    import numpy as np
+except ImportError:  # pragma: no cover - usa o PyAutoGUI como alternativa
+    cv2 = None
+    np = None
 
-from src.config import settings
+try:
+    import mss
+except ImportError:  # pragma: no cover - usa o PIL.ImageGrab como alternativa
+    mss = None
+
+try:
+    import tesserocr
+except ImportError:  # pragma: no cover - usa o pytesseract como alternativa
+    tesserocr = None
+
+from src.automation.desktop import _win32
+from src.config import get_settings
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Dependências pesadas, importadas somente no primeiro uso (ver `_lazy`).
+# Importar o PyAutoGUI, o PIL e o PyGetWindow custa centenas de milissegundos,
+# o que não deve ser pago por quem só precisa de `WindowInfo` ou das enumerações.
+pyautogui = None
+pyperclip = None
+gw = None
+pytesseract = None
+paddleocr = None
+Image = None
+ImageGrab = None
+
+_LAZY_MODULES = {
+    "pyautogui": "pyautogui",
+    "pyperclip": "pyperclip",
+    "gw": "pygetwindow",
+    "pytesseract": "pytesseract",
+    "paddleocr": "paddleocr",
+    "Image": "PIL.Image",
+    "ImageGrab": "PIL.ImageGrab",
+}
 
 # Configuração de logging
 logger = logging.getLogger(__name__)
 
-# Configura o PyAutoGUI
-pyautogui.FAILSAFE = True
-pyautogui.PAUSE = 0.1
+# Intervalos da espera adaptativa (em segundos)
+_POLL_INITIAL_INTERVAL = 0.005
+_POLL_MAX_INTERVAL = 0.05
+_CURSOR_SETTLE_TIMEOUT = 0.5
+
+# Geometria e estado de uma janela do PyGetWindow, lidos em uma única chamada
+_WINDOW_ATTRS = operator.attrgetter(
+    "left", "top", "width", "height", "isMaximized", "isMinimized"
+)
+
+# `slots=True` só é aceito pelo dataclass a partir do Python 3.10
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Textos maiores que este limite são colados pela área de transferência
+_CLIPBOARD_MIN_LENGTH = 8
+_PASTE_MODIFIER = "command" if sys.platform == "darwin" else "ctrl"
+
+# Histograma usado para descartar buscas de imagem impossíveis (32 faixas de 8 níveis)
+_HISTOGRAM_SHIFT = 3
+_HISTOGRAM_BINS = 256 >> _HISTOGRAM_SHIFT
+
+# Busca em pirâmide: a tela e a imagem são reduzidas por _PYRAMID_FACTOR, e a busca
+# completa só é feita se a correspondência grosseira atingir _PYRAMID_RATIO da
+# confiança pedida. Imagens menores que _PYRAMID_MIN_SIZE pixels não são reduzidas.
+_PYRAMID_FACTOR = 4
+_PYRAMID_RATIO = 0.9
+_PYRAMID_MIN_SIZE = 32
+
+# Local de instalação padrão do Tesseract no Windows
+_TESSERACT_WINDOWS_CMD = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
+
+# Configurações do Tesseract que o tesserocr sabe reproduzir (apenas o modo de página)
+_TESSEROCR_CONFIG = re.compile(r"^\s*(?:--psm\s+(\d+))?\s*$")
+
+# Threads para gravação de capturas e OCR em segundo plano
+_IO_MAX_WORKERS = 2
+
+# Quadros aguardando OCR em `stream_text`; a captura espera quando a fila enche
+_STREAM_QUEUE_SIZE = 2
+_STREAM_PUT_TIMEOUT = 0.1
 
 
 class DesktopAutomationError(Exception):
@@ -50,9 +139,13 @@ class KeyAction(Enum):
     UP = auto()
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class WindowInfo:
-    """Classe para armazenar informações sobre uma janela."""
+    """Classe para armazenar informações sobre uma janela.
+    
+    As instâncias são imutáveis e, a partir do Python 3.10, não possuem
+    `__dict__`, o que reduz o custo de listas grandes como a de `get_windows`.
+    """
     title: str
     left: int
     top: int
@@ -80,41 +173,449 @@ class WindowInfo:
         return (self.left + self.width // 2, self.top + self.height // 2)
     
     def contains_point(self, x: int, y: int) -> bool:
-        """Verifica se um ponto (x, y) está dentro da janela."""
-        return (self.left <= x <= self.right and 
-                self.top <= y <= self.bottom)
+        """Verifica se um ponto (x, y) está dentro da janela.
+        
+        As coordenadas devem ser inteiras: as quatro diferenças são combinadas
+        com OU bit a bit, que só é não negativo se todas forem, evitando
+        comparações encadeadas em laços de rastreamento do cursor.
+        """
+        left, top = self.left, self.top
+        return (
+            (x - left) | (left + self.width - x) | (y - top) | (top + self.height - y)
+        ) >= 0
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class WindowTable:
+    """Informações de várias janelas organizadas em colunas (arrays NumPy).
+    
+    Cada atributo guarda o mesmo campo de todas as janelas, na ordem de
+    `get_windows`, o que permite filtrar as janelas com operações vetorizadas
+    em vez de percorrer uma lista de `WindowInfo`. Os estados ficam em
+    `flags`, combinando os bits `ACTIVE`, `MAXIMIZED` e `MINIMIZED`.
+    """
+    titles: List[str]
+    left: "np.ndarray"
+    top: "np.ndarray"
+    width: "np.ndarray"
+    height: "np.ndarray"
+    flags: "np.ndarray"
+    
+    ACTIVE = 1
+    MAXIMIZED = 2
+    MINIMIZED = 4
+    
+    def __len__(self) -> int:
+        return len(self.titles)
+    
+    def contains_point(self, x: int, y: int) -> "np.ndarray":
+        """Retorna uma máscara booleana das janelas que contêm o ponto (x, y)."""
+        left, top = self.left, self.top
+        return (
+            (x - left) | (left + self.width - x) | (y - top) | (top + self.height - y)
+        ) >= 0
+    
+    def has_flag(self, flag: int) -> "np.ndarray":
+        """Retorna uma máscara booleana das janelas com o estado `flag`."""
+        return (self.flags & flag) != 0
+    
+    def window(self, index: int) -> WindowInfo:
+        """Retorna as informações de uma janela da tabela como `WindowInfo`."""
+        flags = int(self.flags[index])
+        return WindowInfo(
+            title=self.titles[index],
+            left=int(self.left[index]),
+            top=int(self.top[index]),
+            width=int(self.width[index]),
+            height=int(self.height[index]),
+            is_active=bool(flags & self.ACTIVE),
+            is_maximized=bool(flags & self.MAXIMIZED),
+            is_minimized=bool(flags & self.MINIMIZED),
+        )
+
+
+def _windows_to_table(windows: List[WindowInfo]) -> WindowTable:
+    """Converte uma lista de `WindowInfo` em uma `WindowTable`."""
+    count = len(windows)
+    return WindowTable(
+        titles=[w.title for w in windows],
+        left=np.fromiter((w.left for w in windows), dtype=np.int32, count=count),
+        top=np.fromiter((w.top for w in windows), dtype=np.int32, count=count),
+        width=np.fromiter((w.width for w in windows), dtype=np.int32, count=count),
+        height=np.fromiter((w.height for w in windows), dtype=np.int32, count=count),
+        flags=np.fromiter(
+            (
+                w.is_active * WindowTable.ACTIVE
+                | w.is_maximized * WindowTable.MAXIMIZED
+                | w.is_minimized * WindowTable.MINIMIZED
+                for w in windows
+            ),
+            dtype=np.uint8,
+            count=count,
+        ),
+    )
+
+
+def _lazy(name: str) -> Any:
+    """Retorna a dependência global `name`, importando-a no primeiro uso."""
+    module = globals()[name]
+    if module is None:
+        module = importlib.import_module(_LAZY_MODULES[name])
+        globals()[name] = module
+    return module
+
+
+@lru_cache(maxsize=1)
+def _resolve_tesseract() -> Optional[str]:
+    """Localiza o executável do Tesseract uma única vez por processo.
+    
+    Usa `TESSERACT_CMD` das configurações, se definido, depois o executável
+    encontrado no PATH e, por fim, o local de instalação padrão no Windows.
+    
+    Returns:
+        Caminho do executável ou None se o Tesseract não for encontrado.
+    """
+    tesseract_cmd = get_settings().TESSERACT_CMD
+    if tesseract_cmd:
+        return tesseract_cmd
+    found = shutil.which("tesseract")
+    if found:
+        return found
+    if os.path.isfile(_TESSERACT_WINDOWS_CMD):
+        return _TESSERACT_WINDOWS_CMD
+    logger.warning("Tesseract OCR não encontrado")
+    return None
+
+
+@lru_cache(maxsize=1)
+def _configure_pytesseract() -> None:
+    """Aponta o pytesseract para o Tesseract localizado, uma única vez.
+    
+    Um caminho já configurado pelo usuário no pytesseract é mantido.
+    """
+    module = _lazy("pytesseract").pytesseract
+    tesseract_cmd = _resolve_tesseract()
+    if tesseract_cmd and module.tesseract_cmd == "tesseract":
+        module.tesseract_cmd = tesseract_cmd
+
+
+class TextRegion(NamedTuple):
+    """Trecho de texto reconhecido pelo OCR e a sua posição na tela."""
+    text: str
+    left: int
+    top: int
+    width: int
+    height: int
+    confidence: float  # Entre 0 e 1
+
+
+class _OCRBackend(Protocol):
+    """Interface dos mecanismos de OCR usados pelo controlador."""
+    
+    def extract(self, image: Union["Image.Image", "np.ndarray"], lang: str, config: str) -> str:
+        """Retorna o texto reconhecido na imagem."""
+        ...
+    
+    def extract_regions(
+        self, image: Union["Image.Image", "np.ndarray"], lang: str, config: str
+    ) -> List[TextRegion]:
+        """Retorna os trechos de texto reconhecidos, com coordenadas relativas à imagem."""
+        ...
+    
+    def close(self) -> None:
+        """Libera os recursos do mecanismo."""
+        ...
+
+
+class _TesseractBackend:
+    """OCR com o Tesseract.
+    
+    Com o tesserocr instalado, o Tesseract roda no próprio processo e os dados
+    de idioma são carregados uma única vez. Caso contrário, ou se a configuração
+    tiver opções além de `--psm`, usa o pytesseract, que inicia um novo processo
+    do Tesseract a cada chamada.
+    """
+    
+    def __init__(self):
+        # Instâncias do tesserocr por idioma e modo de página
+        self._apis: Dict[Tuple[str, int], Any] = {}
+        self._lock = threading.Lock()
+    
+    def extract(self, image: Union["Image.Image", "np.ndarray"], lang: str, config: str) -> str:
+        match = _TESSEROCR_CONFIG.match(config) if tesserocr is not None else None
+        if match is None:
+            _configure_pytesseract()
+            return _lazy("pytesseract").image_to_string(image, lang=lang, config=config)
+        
+        psm = int(match.group(1)) if match.group(1) else tesserocr.PSM.AUTO
+        if not isinstance(image, _lazy("Image").Image):
+            image = _lazy("Image").fromarray(image)
+        with self._lock:
+            api = self._apis.get((lang, psm))
+            if api is None:
+                api = tesserocr.PyTessBaseAPI(lang=lang, psm=psm)
+                self._apis[(lang, psm)] = api
+            api.SetImage(image)
+            return api.GetUTF8Text()
+    
+    def extract_regions(
+        self, image: Union["Image.Image", "np.ndarray"], lang: str, config: str
+    ) -> List[TextRegion]:
+        _configure_pytesseract()
+        pytesseract = _lazy("pytesseract")
+        data = pytesseract.image_to_data(
+            image, lang=lang, config=config, output_type=pytesseract.Output.DICT
+        )
+        return [
+            TextRegion(text.strip(), left, top, width, height, float(conf) / 100)
+            for text, left, top, width, height, conf in zip(
+                data["text"], data["left"], data["top"], data["width"], data["height"], data["conf"]
+            )
+            if text.strip() and float(conf) >= 0
+        ]
+    
+    def close(self) -> None:
+        with self._lock:
+            for api in self._apis.values():
+                api.End()
+            self._apis.clear()
+
+
+class _PaddleBackend:
+    """OCR com o PaddleOCR, mantendo o modelo carregado entre chamadas.
+    
+    O idioma é definido na criação do modelo; os argumentos `lang` e `config`
+    do Tesseract são ignorados.
+    """
+    
+    def __init__(self, lang: str = "pt"):
+        self._lang = lang
+        self._ocr = None
+        self._lock = threading.Lock()
+    
+    def extract(self, image: Union["Image.Image", "np.ndarray"], lang: str, config: str) -> str:
+        return "\n".join(region.text for region in self.extract_regions(image, lang, config))
+    
+    def extract_regions(
+        self, image: Union["Image.Image", "np.ndarray"], lang: str, config: str
+    ) -> List[TextRegion]:
+        array = np.asarray(image)
+        if array.ndim == 2:
+            array = cv2.cvtColor(array, cv2.COLOR_GRAY2BGR)
+        elif not isinstance(image, np.ndarray):
+            # O PIL usa a ordem RGB; o PaddleOCR espera BGR
+            array = array[..., ::-1]
+        
+        with self._lock:
+            if self._ocr is None:
+                self._ocr = _lazy("paddleocr").PaddleOCR(
+                    use_angle_cls=False, lang=self._lang, show_log=False
+                )
+            result = self._ocr.ocr(array, cls=False)
+        
+        regions = []
+        for box, (text, score) in (result[0] if result else None) or []:
+            xs = [point[0] for point in box]
+            ys = [point[1] for point in box]
+            left, top = int(min(xs)), int(min(ys))
+            regions.append(TextRegion(
+                text, left, top, int(max(xs)) - left, int(max(ys)) - top, float(score)
+            ))
+        return regions
+    
+    def close(self) -> None:
+        self._ocr = None
+
+
+_OCR_BACKENDS: Dict[str, Callable[[], _OCRBackend]] = {
+    "tesseract": _TesseractBackend,
+    "paddle": _PaddleBackend,
+}
+
+
+class _Template(NamedTuple):
+    """Imagem de referência decodificada e o seu histograma de intensidades."""
+    image: "np.ndarray"
+    histogram: "np.ndarray"
+
+
+def _template_key(
+    image_path: Union[str, Path], grayscale: bool, scale: float
+) -> Tuple[str, int, bool, float]:
+    """Monta a chave de cache de uma imagem de referência.
+    
+    A chave inclui a data de modificação do arquivo, de modo que um arquivo
+    alterado não reaproveita a versão em cache (ver `_load_template`).
+    """
+    path = os.path.abspath(image_path)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        raise DesktopAutomationError(f"Não foi possível carregar a imagem: {path}")
+    return path, mtime_ns, grayscale, scale
+
+
+@lru_cache(maxsize=64)
+def _load_template(path: str, mtime_ns: int, grayscale: bool, scale: float) -> _Template:
+    """Carrega e prepara uma imagem de referência para busca com OpenCV.
+    
+    O resultado é mantido em cache para que buscas repetidas pela mesma imagem
+    não decodifiquem o arquivo novamente. A data de modificação faz parte da
+    chave, de modo que um arquivo alterado é decodificado de novo.
+    """
+    flags = cv2.IMREAD_GRAYSCALE if grayscale else cv2.IMREAD_COLOR
+    template = cv2.imread(path, flags)
+    if template is None:
+        raise DesktopAutomationError(f"Não foi possível carregar a imagem: {path}")
+    if scale != 1.0:
+        template = cv2.resize(template, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    template = np.ascontiguousarray(template, dtype=np.uint8)
+    return _Template(template, _histogram(template))
+
+
+@lru_cache(maxsize=64)
+def _load_coarse_template(
+    path: str, mtime_ns: int, grayscale: bool, scale: float
+) -> Optional["np.ndarray"]:
+    """Retorna a versão reduzida de uma imagem de referência para a busca em pirâmide.
+    
+    Calculada apenas nas buscas com `pyramid=True` e mantida em cache com a
+    mesma chave de `_load_template`. Retorna None se a imagem for pequena.
+    """
+    return _pyramid_down(_load_template(path, mtime_ns, grayscale, scale).image)
+
+
+def _pyramid_down(image: "np.ndarray") -> Optional["np.ndarray"]:
+    """Reduz uma imagem por `_PYRAMID_FACTOR` para a etapa grosseira da busca.
+    
+    Retorna None quando a imagem é pequena demais para manter detalhes
+    suficientes após a redução.
+    """
+    height, width = image.shape[:2]
+    if min(height, width) < _PYRAMID_MIN_SIZE:
+        return None
+    return cv2.resize(
+        image, (width // _PYRAMID_FACTOR, height // _PYRAMID_FACTOR),
+        interpolation=cv2.INTER_AREA
+    )
+
+
+def _histogram(image: "np.ndarray") -> "np.ndarray":
+    """Conta os pixels de uma imagem de 8 bits em `_HISTOGRAM_BINS` faixas."""
+    return np.bincount(
+        (image >> _HISTOGRAM_SHIFT).ravel(), minlength=_HISTOGRAM_BINS
+    )
+
+
+def _histogram_can_match(
+    screen_hist: "np.ndarray", template_hist: "np.ndarray", confidence: float
+) -> bool:
+    """Verifica se a tela tem pixels suficientes de cada faixa para conter a imagem.
+    
+    Conta os pixels da imagem de referência que não encontram correspondentes
+    na mesma faixa de intensidade da tela. Se essa fração supera a margem
+    permitida pela confiança, o template matching não precisa ser executado.
+    """
+    missing = np.maximum(template_hist - screen_hist, 0).sum()
+    return missing <= (1.0 - confidence) * template_hist.sum()
 
 
 class DesktopController:
     """Classe para controle de automação de desktop."""
     
-    def __init__(self, fail_safe: bool = True, pause: float = 0.1):
+    def __init__(
+        self,
+        fail_safe: bool = True,
+        pause: float = 0.0,
+        ocr_backend: str = "tesseract",
+        mouse_position_ttl: float = 0.002,
+    ):
         """Inicializa o controlador de desktop.
         
         Args:
             fail_safe: Se True, permite interromper o movimento do mouse para um canto da tela.
-            pause: Tempo de pausa entre ações do PyAutoGUI.
+            pause: Intervalo mínimo, em segundos, entre o início de ações consecutivas.
+                Por padrão nenhuma pausa é aplicada; as ações aguardam o seu
+                efeito observável.
+            ocr_backend: Mecanismo de OCR: 'tesseract' (padrão) ou 'paddle'
+                (PaddleOCR, que mantém o modelo carregado entre chamadas).
+            mouse_position_ttl: Tempo, em segundos, durante o qual
+                `get_mouse_position` reaproveita a última leitura do cursor.
+                Use 0 para sempre consultar o sistema.
+        
+        As configurações valem apenas para as ações deste controlador; os valores
+        globais do PyAutoGUI são restaurados ao final de cada ação.
         """
-        pyautogui.FAILSAFE = fail_safe
-        pyautogui.PAUSE = pause
+        if ocr_backend not in _OCR_BACKENDS:
+            raise DesktopAutomationError(
+                f"Mecanismo de OCR não suportado: {ocr_backend}. "
+                f"Use um destes: {', '.join(_OCR_BACKENDS)}"
+            )
         
-        # Configura o caminho para o Tesseract OCR, se disponível
-        try:
-            pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
-        except Exception as e:
-            logger.warning(f"Tesseract OCR não encontrado: {e}")
+        self.fail_safe = fail_safe
+        self.pause = pause
+        self.mouse_position_ttl = mouse_position_ttl
+        
+        # Última posição lida do cursor e o instante (time.monotonic) da leitura
+        self._mouse_position: Optional[Tuple[int, int]] = None
+        self._mouse_position_time = 0.0
+        
+        # Instante (time.perf_counter) do fim da última ação, usado no espaçamento
+        self._last_action = 0.0
+        
+        # Captura de tela com MSS, criada sob demanda
+        self._mss = None
+        
+        # Gravação de capturas e OCR em segundo plano, criados sob demanda
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._pending_saves: List[Future] = []
+        
+        # Diretórios de gravação já criados, para não consultá-los a cada captura
+        self._ensured_dirs: Set[str] = set()
+        
+        # Mecanismo de OCR; os modelos são carregados no primeiro uso
+        self._ocr_backend: _OCRBackend = _OCR_BACKENDS[ocr_backend]()
+        
+        # Indica se algum recurso foi criado desde o último close()
+        self._resources_open = False
     
     # Métodos de controle de mouse
-    def move_mouse(self, x: int, y: int, duration: float = 0.5) -> None:
+    def move_mouse(self, x: int, y: int, duration: float = 0.0) -> None:
         """Move o mouse para as coordenadas (x, y).
         
+        Sem animação o cursor é posicionado diretamente (no Windows, com
+        SetCursorPos), sem passar pela interpolação do PyAutoGUI. Fora do
+        SetCursorPos, que é síncrono, aguarda-se o cursor chegar ao destino ou
+        parar em outra posição (quando o sistema o limita às bordas).
+        
         Args:
             x: Coordenada x.
             y: Coordenada y.
-            duration: Duração da animação do movimento em segundos.
+            duration: Duração da animação do movimento em segundos. Se 0
+                (padrão), o movimento é instantâneo.
         """
+        pyautogui = _lazy("pyautogui")
         try:
-            pyautogui.moveTo(x, y, duration=duration, tween=pyautogui.easeInOutQuad)
+            with self._pause_block():
+                if duration > 0:
+                    pyautogui.moveTo(x, y, duration=duration, tween=pyautogui.easeInOutQuad)
+                elif _win32.AVAILABLE:
+                    _win32.set_cursor_pos(x, y)
+                else:
+                    pyautogui.moveTo(x, y, duration=0)
+            # Ao retornar, o SetCursorPos já deixou o cursor no destino (ou onde o
+            # sistema o limitou); com escala de DPI a leitura pode nem coincidir com (x, y)
+            if duration > 0 or not _win32.AVAILABLE:
+                # O sistema pode limitar o destino às bordas de qualquer monitor:
+                # a espera termina quando duas leituras seguidas coincidem
+                readings: List[Tuple[int, int]] = []
+                
+                def settled() -> bool:
+                    readings.append(self._get_mouse_position())
+                    return readings[-1] == (x, y) or readings[-2:-1] == readings[-1:]
+                
+                if not self._wait_until(settled, timeout=_CURSOR_SETTLE_TIMEOUT):
+                    logger.debug(f"Mouse não estabilizou em ({x}, {y}) dentro do tempo limite")
             logger.debug(f"Mouse movido para ({x}, {y})")
         except Exception as e:
             raise DesktopAutomationError(f"Falha ao mover o mouse: {e}")
@@ -125,7 +626,8 @@ class DesktopController:
         y: Optional[int] = None, 
         button: MouseButton = MouseButton.LEFT,
         clicks: int = 1,
-        interval: float = 0.1
+        interval: float = 0.1,
+        move_duration: float = 0.0
     ) -> None:
         """Realiza um clique do mouse.
         
@@ -135,18 +637,20 @@ class DesktopController:
             button: Botão do mouse a ser clicado.
             clicks: Número de cliques.
             interval: Intervalo entre cliques em segundos.
+            move_duration: Duração do movimento até (x, y) em segundos.
         """
+        pyautogui = _lazy("pyautogui")
         try:
-            if x is not None and y is not None:
-                self.move_mouse(x, y)
-            
-            pyautogui.click(
-                x=x, 
-                y=y, 
-                button=button.value,
-                clicks=clicks,
-                interval=interval
-            )
+            # O PyAutoGUI já move o mouse até (x, y) antes de clicar
+            with self._pause_block():
+                pyautogui.click(
+                    x=x, 
+                    y=y, 
+                    button=button.value,
+                    clicks=clicks,
+                    interval=interval,
+                    duration=move_duration
+                )
             logger.debug(f"Clicado no botão {button.value} em ({x or 'current'}, {y or 'current'})")
         except Exception as e:
             raise DesktopAutomationError(f"Falha ao clicar: {e}")
@@ -159,25 +663,39 @@ class DesktopController:
             x: Coordenada x. Se None, usa a posição atual do mouse.
             y: Coordenada y. Se None, usa a posição atual do mouse.
         """
+        pyautogui = _lazy("pyautogui")
         try:
-            if x is not None and y is not None:
-                self.move_mouse(x, y)
-            
-            pyautogui.scroll(clicks)
+            # O PyAutoGUI já move o mouse até (x, y) antes de rolar
+            with self._pause_block():
+                pyautogui.scroll(clicks, x=x, y=y)
             logger.debug(f"Rolado {clicks} cliques")
         except Exception as e:
             raise DesktopAutomationError(f"Falha ao rolar: {e}")
     
     # Métodos de controle de teclado
-    def type_text(self, text: str, interval: float = 0.1) -> None:
+    def type_text(self, text: str, interval: float = 0.1, use_clipboard: bool = True) -> None:
         """Digita um texto.
         
+        Textos com caracteres não ASCII (que o PyAutoGUI não consegue digitar) e
+        textos longos sem intervalo entre as teclas são colados de uma só vez pela
+        área de transferência, substituindo o seu conteúdo atual.
+        
         Args:
             text: Texto a ser digitado.
             interval: Intervalo entre as teclas em segundos.
+            use_clipboard: Se False, sempre digita tecla por tecla.
         """
+        pyautogui = _lazy("pyautogui")
         try:
-            pyautogui.write(text, interval=interval)
+            with self._pause_block():
+                if use_clipboard and (
+                    not text.isascii()
+                    or (interval <= 0 and len(text) > _CLIPBOARD_MIN_LENGTH)
+                ):
+                    _lazy("pyperclip").copy(text)
+                    pyautogui.hotkey(_PASTE_MODIFIER, "v")
+                else:
+                    pyautogui.write(text, interval=interval)
             logger.debug(f"Texto digitado: '{text}'")
         except Exception as e:
             raise DesktopAutomationError(f"Falha ao digitar texto: {e}")
@@ -191,27 +709,51 @@ class DesktopController:
     ) -> None:
         """Pressiona uma tecla ou combinação de teclas.
         
+        No Windows, sem intervalo entre as repetições, todas as pressões são
+        enviadas ao sistema com uma única chamada SendInput.
+        
         Args:
             keys: Tecla ou lista de teclas a serem pressionadas.
             action: Ação a ser realizada (pressionar, segurar ou soltar).
             presses: Número de vezes que a tecla será pressionada.
             interval: Intervalo entre as pressões em segundos.
         """
+        pyautogui = _lazy("pyautogui")
         try:
-            if isinstance(keys, str):
-                keys = [keys]
+            # Tecla única é o caso mais comum: evita criar uma lista a cada chamada
+            single = isinstance(keys, str)
+            
+            with self._pause_block():
+                if action == KeyAction.PRESS:
+                    vks = (
+                        _win32.virtual_keys((keys,) if single else keys)
+                        if _win32.AVAILABLE else None
+                    )
+                    if vks is not None and (presses == 1 or interval <= 0):
+                        _win32.send_key_combo(vks, presses)
+                    elif single:
+                        pyautogui.press(keys, presses=presses, interval=interval)
+                    else:
+                        for press in range(presses):
+                            if press and interval > 0:
+                                time.sleep(interval)
+                            pyautogui.hotkey(*keys)
+                elif action == KeyAction.DOWN:
+                    if single:
+                        pyautogui.keyDown(keys)
+                    else:
+                        for key in keys:
+                            pyautogui.keyDown(key)
+                elif action == KeyAction.UP:
+                    if single:
+                        pyautogui.keyUp(keys)
+                    else:
+                        for key in reversed(keys):
+                            pyautogui.keyUp(key)
             
-            if action == KeyAction.PRESS:
-                pyautogui.hotkey(*keys)
-                logger.debug(f"Teclas pressionadas: {'+'.join(keys)}")
-            elif action == KeyAction.DOWN:
-                for key in keys:
-                    pyautogui.keyDown(key)
-                logger.debug(f"Teclas pressionadas (segurando): {'+'.join(keys)}")
-            elif action == KeyAction.UP:
-                for key in reversed(keys):
-                    pyautogui.keyUp(key)
-                logger.debug(f"Teclas liberadas: {'+'.join(keys)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                label = keys if single else '+'.join(keys)
+                logger.debug(f"Teclas ({action.name}): {label}")
         except Exception as e:
             raise DesktopAutomationError(f"Falha ao pressionar teclas: {e}")
     
@@ -223,7 +765,7 @@ class DesktopController:
             Informações sobre a janela ativa ou None se não houver janela ativa.
         """
         try:
-            window = gw.getActiveWindow()
+            window = _lazy("gw").getActiveWindow()
             if window:
                 return self._convert_to_window_info(window, is_active=True)
             return None
@@ -239,36 +781,163 @@ class DesktopController:
         Returns:
             Lista de janelas que correspondem ao filtro.
         """
+        if _win32.AVAILABLE:
+            return self._get_windows_win32(title)
+        
+        gw = _lazy("gw")
         try:
             windows = gw.getWindowsWithTitle(title) if title else gw.getAllWindows()
             active_window = gw.getActiveWindow()
+            # Compara handles em vez de objetos: a igualdade do PyGetWindow
+            # consulta o Win32 novamente a cada comparação
+            active_handle = getattr(active_window, "_hWnd", None)
+            # Erros de janelas fechadas durante a enumeração
+            window_errors = (OSError, AttributeError, gw.PyGetWindowException)
             
             result = []
             for window in windows:
-                if window and window.title:  # Filtra janelas inválidas
-                    is_active = (window == active_window)
-                    result.append(self._convert_to_window_info(window, is_active))
+                if not window:
+                    continue
+                try:
+                    window_title = window.title
+                    if not window_title:  # Filtra janelas inválidas
+                        continue
+                    if active_handle is not None:
+                        is_active = getattr(window, "_hWnd", None) == active_handle
+                    else:
+                        is_active = (window == active_window)
+                    result.append(
+                        self._convert_to_window_info(window, is_active, title=window_title)
+                    )
+                except window_errors as e:
+                    # Ignora a janela em vez de consultá-la novamente
+                    logger.debug(f"Janela ignorada durante a enumeração: {e}")
+            
+            return result
+        except Exception as e:
+            raise DesktopAutomationError(f"Falha ao obter janelas: {e}")
+    
+    def _get_windows_win32(self, title: Optional[str]) -> List[WindowInfo]:
+        """Lista as janelas diretamente pelo Win32, sem o PyGetWindow.
+        
+        Os handles são obtidos com um único EnumWindows e, para cada janela,
+        título, retângulo e estado são lidos com uma chamada cada.
+        """
+        try:
+            active_handle = _win32.get_foreground_window()
+            # Mesmo critério do PyGetWindow: trecho do título, sem diferenciar maiúsculas
+            needle = title.upper() if title else None
+            
+            result = []
+            for hwnd in _win32.enum_windows():
+                try:
+                    window_title = _win32.get_window_title(hwnd)
+                    if not window_title or (needle and needle not in window_title.upper()):
+                        continue
+                    result.append(
+                        self._window_info_from_handle(hwnd, hwnd == active_handle, window_title)
+                    )
+                except OSError as e:
+                    # Janela fechada durante a enumeração
+                    logger.debug(f"Janela ignorada durante a enumeração: {e}")
             
             return result
         except Exception as e:
             raise DesktopAutomationError(f"Falha ao obter janelas: {e}")
     
-    def activate_window(self, title: str) -> bool:
+    def get_windows_rects(self) -> Tuple[List[str], "np.ndarray"]:
+        """Obtém os títulos e os retângulos das janelas abertas em forma de array.
+        
+        Os retângulos ficam em um único array NumPy, o que permite consultas
+        espaciais vetorizadas sobre todas as janelas de uma vez. A ordem é a
+        da enumeração do sistema (da janela mais à frente para a mais atrás).
+        
+        Returns:
+            Tupla com a lista de títulos e um array (N, 4) int32 com
+            [left, top, right, bottom] de cada janela.
+        """
+        if np is None:
+            raise DesktopAutomationError("NumPy não instalado")
+        
+        if not _win32.AVAILABLE:
+            windows = self.get_windows()
+            rects = np.array(
+                [(w.left, w.top, w.right, w.bottom) for w in windows], dtype=np.int32
+            ).reshape(-1, 4)
+            return [w.title for w in windows], rects
+        
+        try:
+            handles = _win32.enum_windows()
+            titles = []
+            rects = np.empty((len(handles), 4), dtype=np.int32)
+            for hwnd in handles:
+                try:
+                    title = _win32.get_window_title(hwnd)
+                    if not title:
+                        continue
+                    left, top, width, height = _win32.get_window_rect(hwnd)
+                except OSError as e:
+                    logger.debug(f"Janela ignorada durante a enumeração: {e}")
+                    continue
+                rects[len(titles)] = (left, top, left + width, top + height)
+                titles.append(title)
+            return titles, rects[:len(titles)]
+        except Exception as e:
+            raise DesktopAutomationError(f"Falha ao obter janelas: {e}")
+    
+    def get_window_table(self, title: Optional[str] = None) -> WindowTable:
+        """Obtém as janelas abertas organizadas em colunas para consultas vetorizadas.
+        
+        Args:
+            title: Filtro opcional pelo título da janela, como em `get_windows`.
+            
+        Returns:
+            Tabela com os títulos, as posições, os tamanhos e os estados das janelas.
+        """
+        if np is None:
+            raise DesktopAutomationError("NumPy não instalado")
+        return _windows_to_table(self.get_windows(title))
+    
+    def find_window_at(self, x: int, y: int) -> Optional[str]:
+        """Encontra a janela mais à frente que contém o ponto (x, y).
+        
+        Args:
+            x: Coordenada x.
+            y: Coordenada y.
+            
+        Returns:
+            Título da janela ou None se nenhuma janela contiver o ponto.
+        """
+        titles, rects = self.get_windows_rects()
+        point = np.array((x, y), dtype=np.int32)
+        inside = np.all((point >= rects[:, :2]) & (point <= rects[:, 2:]), axis=1)
+        matches = np.flatnonzero(inside)
+        return titles[matches[0]] if matches.size else None
+    
+    def activate_window(self, title: str, timeout: float = 1.0) -> bool:
         """Ativa uma janela pelo título.
         
+        Após pedir a ativação, aguarda até que o sistema confirme que a janela
+        está em primeiro plano, verificando com intervalos crescentes em vez de
+        uma pausa fixa.
+        
         Args:
             title: Título da janela a ser ativada.
+            timeout: Tempo máximo de espera pela confirmação em segundos.
             
         Returns:
             True se a janela foi ativada com sucesso, False caso contrário.
         """
         try:
-            windows = gw.getWindowsWithTitle(title)
+            windows = _lazy("gw").getWindowsWithTitle(title)
             if windows:
                 window = windows[0]
                 if window.isMinimized:
                     window.restore()
                 window.activate()
+                if not self._wait_until(lambda: window.isActive, timeout=timeout):
+                    logger.warning(f"Janela não foi ativada a tempo: {title}")
+                    return False
                 logger.debug(f"Janela ativada: {title}")
                 return True
             return False
@@ -279,49 +948,205 @@ class DesktopController:
     def capture_screen(
         self, 
         region: Optional[Tuple[int, int, int, int]] = None, 
-        save_path: Optional[Union[str, Path]] = None
-    ) -> Image.Image:
+        save_path: Optional[Union[str, Path]] = None,
+        return_pil: bool = True,
+        async_save: bool = True
+    ) -> Union["Image.Image", "np.ndarray"]:
         """Captura a tela ou uma região da tela.
         
+        Usa o MSS quando disponível, que reaproveita o mesmo contexto de
+        dispositivo entre capturas, e recorre ao PIL.ImageGrab caso contrário.
+        
+        Por padrão a gravação em `save_path` é feita em segundo plano: o método
+        retorna assim que a imagem é capturada, enquanto a codificação do PNG e
+        a escrita em disco ocorrem em outra thread. Use `flush_pending_saves()`
+        para aguardar as gravações; `close()` também as aguarda.
+        
         Args:
             region: Região a ser capturada (left, top, width, height). Se None, captura a tela inteira.
             save_path: Caminho para salvar a captura de tela (opcional).
+            return_pil: Se False, retorna os pixels como um array NumPy BGRA,
+                evitando a conversão para PIL quando a imagem não será salva.
+            async_save: Se False, salva a captura antes de retornar.
             
         Returns:
-            Imagem capturada como um objeto PIL.Image.
+            Imagem capturada como um objeto PIL.Image ou array NumPy (BGRA).
         """
         try:
-            # Always pass bbox to maintain consistent behavior in tests
-            screenshot = ImageGrab.grab(bbox=region) if region is not None else ImageGrab.grab(bbox=None)
+            if mss is not None:
+                shot = self._get_mss().grab(self._monitor_for(region))
+                frame = np.asarray(shot) if not return_pil else None
+                if return_pil or save_path:
+                    screenshot = _lazy("Image").frombytes("RGB", shot.size, shot.bgra, "raw", "BGRX")
+            else:
+                ImageGrab = _lazy("ImageGrab")
+                if region is None:
+                    screenshot = ImageGrab.grab(bbox=None)
+                else:
+                    left, top, width, height = region
+                    screenshot = ImageGrab.grab(bbox=(left, top, left + width, top + height))
+                if not return_pil:
+                    if np is None:
+                        raise DesktopAutomationError("NumPy não instalado")
+                    frame = np.asarray(screenshot.convert("RGBA"))[..., [2, 1, 0, 3]]
             
             if save_path:
-                # Ensure the directory exists
-                os.makedirs(os.path.dirname(save_path), exist_ok=True)
-                screenshot.save(save_path)
-                logger.debug(f"Captura de tela salva em: {save_path}")
+                directory = os.path.dirname(save_path)
+                if directory and directory not in self._ensured_dirs:
+                    os.makedirs(directory, exist_ok=True)
+                    self._ensured_dirs.add(directory)
+                if not async_save:
+                    screenshot.save(save_path)
+                    logger.debug(f"Captura de tela salva em: {save_path}")
+                else:
+                    # A imagem retornada ao chamador pode ser alterada durante a gravação
+                    self._submit_save(screenshot.copy() if return_pil else screenshot, save_path)
+            
+            return screenshot if return_pil else frame
+        except DesktopAutomationError:
+            raise
+        except Exception as e:
+            raise DesktopAutomationError(f"Falha ao capturar tela: {e}")
+    
+    def capture_screen_gray(
+        self, region: Optional[Tuple[int, int, int, int]] = None
+    ) -> "np.ndarray":
+        """Captura a tela ou uma região da tela em tons de cinza.
+        
+        Com o MSS e o OpenCV, o buffer BGRA capturado é convertido diretamente
+        em um array de 8 bits por pixel, sem passar por uma imagem PIL. O
+        resultado ocupa um quarto da memória de uma captura colorida e é o
+        formato usado pelo OCR e pela busca de imagens.
+        
+        Args:
+            region: Região a ser capturada (left, top, width, height). Se None, captura a tela inteira.
             
-            return screenshot
+        Returns:
+            Array NumPy (altura, largura) do tipo uint8, contíguo na memória.
+        """
+        if np is None:
+            raise DesktopAutomationError("NumPy não instalado")
+        try:
+            if mss is not None and cv2 is not None:
+                shot = self._get_mss().grab(self._monitor_for(region))
+                gray = cv2.cvtColor(np.asarray(shot), cv2.COLOR_BGRA2GRAY)
+            else:
+                gray = np.asarray(self.capture_screen(region=region).convert("L"))
+            return np.ascontiguousarray(gray, dtype=np.uint8)
+        except DesktopAutomationError:
+            raise
         except Exception as e:
             raise DesktopAutomationError(f"Falha ao capturar tela: {e}")
     
+    def capture_screen_and_regions(
+        self,
+        regions: Dict[str, Optional[Tuple[int, int, int, int]]],
+        return_pil: bool = True
+    ) -> Dict[str, Union["Image.Image", "np.ndarray"]]:
+        """Captura a tela inteira uma única vez e recorta várias regiões dela.
+        
+        Evita uma captura por região quando várias partes da tela são
+        necessárias ao mesmo tempo, e garante que todas venham do mesmo quadro.
+        
+        Args:
+            regions: Dicionário de nome para região (left, top, width, height).
+                Uma região None corresponde à tela inteira.
+            return_pil: Se False, retorna as regiões como arrays NumPy BGRA
+                (visões do mesmo array, sem cópia).
+            
+        Returns:
+            Dicionário com a imagem capturada de cada região, pelo mesmo nome.
+        """
+        try:
+            screen = self.capture_screen(return_pil=return_pil)
+            origin_x, origin_y = self._capture_origin(None)
+            
+            captures = {}
+            for name, region in regions.items():
+                if region is None:
+                    captures[name] = screen
+                    continue
+                left, top, width, height = region
+                left -= origin_x
+                top -= origin_y
+                if return_pil:
+                    captures[name] = screen.crop((left, top, left + width, top + height))
+                else:
+                    captures[name] = screen[top:top + height, left:left + width]
+            return captures
+        except DesktopAutomationError:
+            raise
+        except Exception as e:
+            raise DesktopAutomationError(f"Falha ao capturar regiões da tela: {e}")
+    
+    def _submit_save(self, screenshot: "Image.Image", save_path: Union[str, Path]) -> None:
+        """Agenda a gravação de uma captura de tela em segundo plano."""
+        def save() -> None:
+            screenshot.save(save_path)
+            logger.debug(f"Captura de tela salva em: {save_path}")
+        
+        def report(future: Future) -> None:
+            error = future.exception()
+            if error is not None:
+                logger.error(f"Falha ao salvar captura de tela em {save_path}: {error}")
+        
+        self._pending_saves = [f for f in self._pending_saves if not f.done()]
+        future = self._get_io_pool().submit(save)
+        future.add_done_callback(report)
+        self._pending_saves.append(future)
+    
+    def flush_pending_saves(self) -> None:
+        """Aguarda a conclusão das gravações de capturas de tela pendentes."""
+        pending, self._pending_saves = self._pending_saves, []
+        wait(pending)
+    
     def find_image_on_screen(
         self, 
         image_path: Union[str, Path], 
         confidence: float = 0.8,
         grayscale: bool = True,
-        region: Optional[Tuple[int, int, int, int]] = None
+        region: Optional[Tuple[int, int, int, int]] = None,
+        downscale: bool = False,
+        pyramid: bool = False,
+        histogram_filter: bool = False
     ) -> Optional[Tuple[int, int]]:
         """Localiza uma imagem na tela.
         
+        Usa o template matching do OpenCV quando disponível e recorre ao
+        PyAutoGUI caso contrário.
+        
+        Com o OpenCV, a tela e a imagem são arrays uint8 contíguos e o
+        `cv2.matchTemplate` libera o GIL durante a comparação; o método pode
+        ser chamado de uma thread de trabalho enquanto outra faz capturas.
+        
         Args:
             image_path: Caminho para a imagem a ser localizada.
             confidence: Nível de confiança para a correspondência (0 a 1).
             grayscale: Se True, converte a imagem para tons de cinza antes da busca.
             region: Região da tela para buscar (left, top, width, height).
+            downscale: Se True, reduz a tela e a imagem pela metade antes da busca,
+                trocando um pouco de precisão por velocidade (somente OpenCV).
+            pyramid: Se True, faz antes uma busca grosseira em versões reduzidas
+                da tela e da imagem e só faz a busca completa se ela indicar uma
+                possível correspondência (somente OpenCV). Acelera principalmente
+                buscas por imagens ausentes, mas imagens com detalhes muito finos
+                podem deixar de ser encontradas.
+            histogram_filter: Se True, descarta sem template matching as telas
+                cujos histogramas de intensidade não podem conter a imagem
+                (somente OpenCV). A comparação usa as intensidades absolutas:
+                uma imagem com brilho ou contraste alterado (ex.: outro tema)
+                pode ser descartada, embora o template matching a encontrasse.
             
         Returns:
             Coordenadas (x, y) do centro da imagem encontrada ou None se não encontrada.
         """
+        if cv2 is not None:
+            return self._find_images_opencv(
+                [image_path], confidence, grayscale, region, downscale, pyramid,
+                histogram_filter
+            )[str(image_path)]
+        
+        pyautogui = _lazy("pyautogui")
         try:
             location = pyautogui.locateOnScreen(
                 str(image_path),
@@ -340,11 +1165,217 @@ class DesktopController:
         except Exception as e:
             raise DesktopAutomationError(f"Falha ao localizar imagem: {e}")
     
+    def find_images_on_screen(
+        self,
+        image_paths: List[Union[str, Path]],
+        confidence: float = 0.8,
+        grayscale: bool = True,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        downscale: bool = False,
+        pyramid: bool = False,
+        histogram_filter: bool = False
+    ) -> Dict[str, Optional[Tuple[int, int]]]:
+        """Localiza várias imagens na tela a partir de uma única captura.
+        
+        Com o OpenCV, a tela é capturada e convertida uma única vez e todas as
+        imagens são procuradas no mesmo quadro. Sem ele, cada imagem é buscada
+        separadamente com o PyAutoGUI.
+        
+        Args:
+            image_paths: Caminhos das imagens a serem localizadas.
+            confidence: Nível de confiança para a correspondência (0 a 1).
+            grayscale: Se True, converte as imagens para tons de cinza antes da busca.
+            region: Região da tela para buscar (left, top, width, height).
+            downscale: Se True, reduz a tela e as imagens pela metade antes da busca
+                (somente OpenCV).
+            pyramid: Se True, faz antes uma busca grosseira em versões reduzidas
+                da tela e das imagens (somente OpenCV). Veja `find_image_on_screen`.
+            histogram_filter: Se True, descarta pelos histogramas as imagens que
+                a tela não pode conter (somente OpenCV). Veja `find_image_on_screen`.
+            
+        Returns:
+            Dicionário com o caminho de cada imagem (como str) e as coordenadas
+            (x, y) do seu centro, ou None se ela não foi encontrada.
+        """
+        if cv2 is not None:
+            return self._find_images_opencv(
+                image_paths, confidence, grayscale, region, downscale, pyramid,
+                histogram_filter
+            )
+        return {
+            str(path): self.find_image_on_screen(path, confidence, grayscale, region)
+            for path in image_paths
+        }
+    
+    def _find_images_opencv(
+        self,
+        image_paths: List[Union[str, Path]],
+        confidence: float,
+        grayscale: bool,
+        region: Optional[Tuple[int, int, int, int]],
+        downscale: bool,
+        pyramid: bool = False,
+        histogram_filter: bool = False,
+    ) -> Dict[str, Optional[Tuple[int, int]]]:
+        """Localiza imagens em uma única captura da tela com `cv2.matchTemplate`."""
+        try:
+            scale = 0.5 if downscale else 1.0
+            keys = {str(path): _template_key(path, grayscale, scale) for path in image_paths}
+            templates = {path: _load_template(*key) for path, key in keys.items()}
+            coarse_templates = (
+                {path: _load_coarse_template(*key) for path, key in keys.items()}
+                if pyramid else {}
+            )
+            screen, origin = self._grab_screen_array(region, grayscale)
+            if scale != 1.0:
+                screen = cv2.resize(screen, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            screen_hist = _histogram(screen) if histogram_filter else None
+            coarse_screen = None
+            if any(coarse is not None for coarse in coarse_templates.values()):
+                coarse_screen = cv2.resize(
+                    screen,
+                    (screen.shape[1] // _PYRAMID_FACTOR, screen.shape[0] // _PYRAMID_FACTOR),
+                    interpolation=cv2.INTER_AREA
+                )
+            
+            return {
+                path: self._match_template(
+                    screen, screen_hist, template, confidence, origin, scale,
+                    coarse_screen, coarse_templates.get(path)
+                )
+                for path, template in templates.items()
+            }
+        except DesktopAutomationError:
+            raise
+        except Exception as e:
+            raise DesktopAutomationError(f"Falha ao localizar imagem: {e}")
+    
+    @staticmethod
+    def _match_template(
+        screen: "np.ndarray",
+        screen_hist: Optional["np.ndarray"],
+        template: _Template,
+        confidence: float,
+        origin: Tuple[int, int],
+        scale: float,
+        coarse_screen: Optional["np.ndarray"] = None,
+        coarse: Optional["np.ndarray"] = None,
+    ) -> Optional[Tuple[int, int]]:
+        """Procura uma imagem de referência em uma captura já preparada.
+        
+        Se `coarse_screen` e a versão reduzida da imagem (`coarse`) forem informadas,
+        a busca começa pela pirâmide: uma correspondência grosseira fraca
+        descarta a imagem, e uma forte limita a busca completa à vizinhança do
+        ponto encontrado (recorrendo à tela inteira se a confiança não for
+        atingida ali). Sem `screen_hist`, o filtro por histograma não é aplicado.
+        """
+        height, width = template.image.shape[:2]
+        if height > screen.shape[0] or width > screen.shape[1]:
+            logger.debug("Imagem maior que a região de busca")
+            return None
+        
+        # Descarta rapidamente telas cujas cores não podem conter a imagem
+        if screen_hist is not None and not _histogram_can_match(
+            screen_hist, template.histogram, confidence
+        ):
+            logger.debug("Imagem não encontrada na tela (descartada pelo histograma)")
+            return None
+        
+        max_val, max_loc = -1.0, (0, 0)
+        if (
+            coarse_screen is not None and coarse is not None
+            and coarse.shape[0] <= coarse_screen.shape[0]
+            and coarse.shape[1] <= coarse_screen.shape[1]
+        ):
+            result = cv2.matchTemplate(coarse_screen, coarse, cv2.TM_CCOEFF_NORMED)
+            _, coarse_val, _, coarse_loc = cv2.minMaxLoc(result)
+            if coarse_val < confidence * _PYRAMID_RATIO:
+                logger.debug("Imagem não encontrada na tela (descartada pela busca grosseira)")
+                return None
+            
+            # Refina apenas na vizinhança do ponto encontrado na pirâmide
+            left = max(coarse_loc[0] * _PYRAMID_FACTOR - _PYRAMID_FACTOR, 0)
+            top = max(coarse_loc[1] * _PYRAMID_FACTOR - _PYRAMID_FACTOR, 0)
+            window = screen[
+                top:top + height + 2 * _PYRAMID_FACTOR,
+                left:left + width + 2 * _PYRAMID_FACTOR
+            ]
+            result = cv2.matchTemplate(window, template.image, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            max_loc = (left + max_loc[0], top + max_loc[1])
+        
+        if max_val < confidence:
+            result = cv2.matchTemplate(screen, template.image, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        if max_val < confidence:
+            logger.debug("Imagem não encontrada na tela")
+            return None
+        
+        center = (
+            origin[0] + int((max_loc[0] + width // 2) / scale),
+            origin[1] + int((max_loc[1] + height // 2) / scale),
+        )
+        logger.debug(f"Imagem encontrada em: {center} (confiança {max_val:.2f})")
+        return center
+    
+    def _grab_screen_array(
+        self,
+        region: Optional[Tuple[int, int, int, int]],
+        grayscale: bool,
+    ) -> Tuple["np.ndarray", Tuple[int, int]]:
+        """Captura a tela como um array NumPy no formato esperado pelo OpenCV.
+        
+        Args:
+            region: Região a ser capturada (left, top, width, height). Se None, captura a tela inteira.
+            grayscale: Se True, retorna a imagem em tons de cinza; caso contrário, em BGR.
+            
+        Returns:
+            Tupla com o array capturado e as coordenadas (x, y) da sua origem na tela.
+        """
+        if grayscale:
+            return self.capture_screen_gray(region), self._capture_origin(region)
+        frame = self.capture_screen(region=region, return_pil=False)
+        return cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR), self._capture_origin(region)
+    
+    def _capture_origin(self, region: Optional[Tuple[int, int, int, int]]) -> Tuple[int, int]:
+        """Retorna as coordenadas de tela do pixel (0, 0) de uma captura."""
+        if region is not None:
+            return (region[0], region[1])
+        if mss is not None:
+            monitor = self._monitor_for(None)
+            return (monitor["left"], monitor["top"])
+        return (0, 0)
+    
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        """Retorna o executor de tarefas em segundo plano, criando-o no primeiro uso."""
+        if self._io_pool is None:
+            self._resources_open = True
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=_IO_MAX_WORKERS, thread_name_prefix="desktop-io"
+            )
+        return self._io_pool
+    
+    def _get_mss(self) -> Any:
+        """Retorna a instância do MSS do controlador, criando-a no primeiro uso."""
+        if self._mss is None:
+            self._resources_open = True
+            self._mss = mss.mss()
+        return self._mss
+    
+    def _monitor_for(self, region: Optional[Tuple[int, int, int, int]]) -> Dict[str, int]:
+        """Converte uma região (left, top, width, height) no formato de monitor do MSS."""
+        if region is None:
+            return self._get_mss().monitors[0]
+        left, top, width, height = region
+        return {"left": left, "top": top, "width": width, "height": height}
+    
     def extract_text_from_screen(
         self, 
         region: Optional[Tuple[int, int, int, int]] = None,
         lang: str = 'por+eng',
-        config: str = '--psm 6'
+        config: str = '--psm 6',
+        preprocess: bool = True,
+        upscale: float = 1.0
     ) -> str:
         """Extrai texto da tela usando OCR.
         
@@ -352,35 +1383,325 @@ class DesktopController:
             region: Região da tela para extrair texto (left, top, width, height).
             lang: Idiomas para reconhecimento (padrão: português + inglês).
             config: Configuração do Tesseract OCR.
+            preprocess: Se True e o OpenCV estiver disponível, converte a captura
+                para preto e branco antes do OCR, o que acelera o Tesseract.
+            upscale: Fator de ampliação aplicado no pré-processamento. Ampliar
+                2x melhora o reconhecimento de textos pequenos na tela.
             
         Returns:
             Texto extraído da imagem.
         """
         try:
-            # Captura a região da tela
-            screenshot = self.capture_screen(region=region)
+            screenshot = self._capture_for_ocr(region, preprocess, upscale)
+            return self._run_ocr(screenshot, lang, config)
+        except Exception as e:
+            raise DesktopAutomationError(f"Falha ao extrair texto da tela: {e}")
+    
+    def extract_text_from_screen_async(
+        self, 
+        region: Optional[Tuple[int, int, int, int]] = None,
+        lang: str = 'por+eng',
+        config: str = '--psm 6',
+        preprocess: bool = True,
+        upscale: float = 1.0
+    ) -> "Future[str]":
+        """Captura a tela e executa o OCR em segundo plano.
+        
+        A captura é feita imediatamente na thread atual; somente o Tesseract
+        roda em outra thread, permitindo que novas capturas e ações ocorram
+        enquanto o texto é reconhecido.
+        
+        Args:
+            region: Região da tela para extrair texto (left, top, width, height).
+            lang: Idiomas para reconhecimento (padrão: português + inglês).
+            config: Configuração do Tesseract OCR.
+            preprocess: Se True e o OpenCV estiver disponível, converte a captura
+                para preto e branco antes do OCR.
+            upscale: Fator de ampliação aplicado no pré-processamento.
+            
+        Returns:
+            Future cujo resultado é o texto extraído da imagem.
+        """
+        try:
+            screenshot = self._capture_for_ocr(region, preprocess, upscale)
+        except Exception as e:
+            raise DesktopAutomationError(f"Falha ao extrair texto da tela: {e}")
+        return self._get_io_pool().submit(self._run_ocr, screenshot, lang, config)
+    
+    def stream_text(
+        self,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        fps: float = 2.0,
+        lang: str = 'por+eng',
+        config: str = '--psm 6',
+        preprocess: bool = True,
+        upscale: float = 1.0
+    ) -> Iterator[str]:
+        """Extrai texto da tela continuamente, sobrepondo captura e OCR.
+        
+        Uma thread captura (e pré-processa) a região no ritmo pedido e entrega
+        os quadros por uma fila limitada, enquanto o OCR do quadro anterior
+        roda na thread que consome o gerador. Se o OCR for mais lento que a
+        captura, a fila enche e a captura espera, sem acumular quadros antigos.
+        
+        A thread de captura é encerrada quando o gerador é fechado, por exemplo
+        ao sair de um laço `for` com `break`.
+        
+        Args:
+            region: Região da tela para extrair texto (left, top, width, height).
+            fps: Número máximo de capturas por segundo.
+            lang: Idiomas para reconhecimento (padrão: português + inglês).
+            config: Configuração do Tesseract OCR.
+            preprocess: Se True e o OpenCV estiver disponível, converte a captura
+                para preto e branco antes do OCR.
+            upscale: Fator de ampliação aplicado no pré-processamento.
+            
+        Yields:
+            Texto extraído de cada captura, na ordem em que foram feitas.
+        """
+        if fps <= 0:
+            raise DesktopAutomationError("fps deve ser maior que zero")
+        interval = 1.0 / fps
+        frames: "queue.Queue[Any]" = queue.Queue(maxsize=_STREAM_QUEUE_SIZE)
+        stop = threading.Event()
+        
+        def produce() -> None:
+            while not stop.is_set():
+                started = time.monotonic()
+                try:
+                    item = self._capture_for_ocr(region, preprocess, upscale)
+                except Exception as e:
+                    item = e
+                while not stop.is_set():
+                    try:
+                        frames.put(item, timeout=_STREAM_PUT_TIMEOUT)
+                        break
+                    except queue.Full:
+                        continue
+                if isinstance(item, Exception):
+                    return
+                stop.wait(max(started + interval - time.monotonic(), 0.0))
+        
+        producer = threading.Thread(target=produce, name="desktop-stream-capture", daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = frames.get()
+                if isinstance(item, Exception):
+                    raise DesktopAutomationError(f"Falha ao extrair texto da tela: {item}")
+                try:
+                    text = self._run_ocr(item, lang, config)
+                except Exception as e:
+                    raise DesktopAutomationError(f"Falha ao extrair texto da tela: {e}")
+                yield text
+        finally:
+            stop.set()
+            producer.join()
+    
+    def extract_text_regions(
+        self, 
+        region: Optional[Tuple[int, int, int, int]] = None,
+        lang: str = 'por+eng',
+        config: str = '--psm 6',
+        preprocess: bool = True,
+        upscale: float = 1.0
+    ) -> List[TextRegion]:
+        """Extrai da tela os trechos de texto e as suas posições usando OCR.
+        
+        Args:
+            region: Região da tela para extrair texto (left, top, width, height).
+            lang: Idiomas para reconhecimento (padrão: português + inglês).
+            config: Configuração do Tesseract OCR.
+            preprocess: Se True e o OpenCV estiver disponível, converte a captura
+                para preto e branco antes do OCR.
+            upscale: Fator de ampliação aplicado no pré-processamento.
             
-            # Usa o Tesseract OCR para extrair o texto
-            text = pytesseract.image_to_string(screenshot, lang=lang, config=config)
+        Returns:
+            Lista de trechos de texto com as coordenadas em pixels da tela.
+        """
+        try:
+            screenshot = self._capture_for_ocr(region, preprocess, upscale)
+            self._resources_open = True
+            regions = self._ocr_backend.extract_regions(screenshot, lang, config)
             
-            logger.debug(f"Texto extraído: {text[:100]}...")
-            return text.strip()
+            # Converte as coordenadas da imagem para coordenadas da tela
+            if not (preprocess and cv2 is not None):
+                upscale = 1.0
+            origin_x, origin_y = self._capture_origin(region)
+            return [
+                text_region._replace(
+                    left=origin_x + int(text_region.left / upscale),
+                    top=origin_y + int(text_region.top / upscale),
+                    width=int(text_region.width / upscale),
+                    height=int(text_region.height / upscale),
+                )
+                for text_region in regions
+            ]
         except Exception as e:
             raise DesktopAutomationError(f"Falha ao extrair texto da tela: {e}")
     
+    def _capture_for_ocr(
+        self, region: Optional[Tuple[int, int, int, int]], preprocess: bool, upscale: float = 1.0
+    ) -> Union["Image.Image", "np.ndarray"]:
+        """Captura a região da tela no formato repassado ao OCR."""
+        if preprocess and cv2 is not None:
+            return self._prepare_for_ocr(self.capture_screen_gray(region), upscale)
+        return self.capture_screen(region=region)
+    
+    def _run_ocr(self, screenshot: Union["Image.Image", "np.ndarray"], lang: str, config: str) -> str:
+        """Extrai o texto de uma imagem com o mecanismo de OCR configurado."""
+        self._resources_open = True
+        text = self._ocr_backend.extract(screenshot, lang, config)
+        logger.debug(f"Texto extraído: {text[:100]}...")
+        return text.strip()
+    
+    @staticmethod
+    def _prepare_for_ocr(gray: "np.ndarray", upscale: float = 1.0) -> "np.ndarray":
+        """Converte uma captura em tons de cinza em uma imagem binária para o OCR.
+        
+        A imagem é binarizada com o limiar de Otsu, o que reduz
+        o trabalho do Tesseract e o tamanho da imagem repassada a ele. A
+        ampliação, se pedida, é feita antes da binarização para que as bordas
+        interpoladas também sejam limiarizadas.
+        """
+        if upscale != 1.0:
+            gray = cv2.resize(gray, None, fx=upscale, fy=upscale, interpolation=cv2.INTER_CUBIC)
+        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+        return binary
+    
     # Métodos auxiliares
+    @contextmanager
+    def _pause_block(self) -> Iterator[None]:
+        """Aplica as configurações do controlador ao PyAutoGUI durante uma ação.
+        
+        A pausa fixa do PyAutoGUI, aplicada após cada chamada, é desativada. Em
+        seu lugar, a ação só aguarda o necessário para que `self.pause` segundos
+        tenham passado desde o fim da ação anterior.
+        
+        Os valores globais anteriores de `FAILSAFE` e `PAUSE` são restaurados ao
+        final, para que outros usuários do PyAutoGUI não sejam afetados.
+        """
+        pyautogui = _lazy("pyautogui")
+        if self.pause > 0:
+            remaining = self._last_action + self.pause - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+        
+        previous = (pyautogui.FAILSAFE, pyautogui.PAUSE)
+        pyautogui.FAILSAFE = self.fail_safe
+        pyautogui.PAUSE = 0
+        try:
+            yield
+        finally:
+            pyautogui.FAILSAFE, pyautogui.PAUSE = previous
+            self._last_action = time.perf_counter()
+            # A ação pode ter movido o cursor
+            self._mouse_position = None
+    
+    @contextmanager
+    def batch(self, pause: float = 0.0) -> Iterator["DesktopController"]:
+        """Executa uma sequência de ações com outro intervalo mínimo entre elas.
+        
+        Exemplo:
+            with controller.batch():
+                controller.click(100, 100)
+                controller.type_text("texto")
+                controller.press_key("enter")
+        
+        Args:
+            pause: Intervalo mínimo entre as ações do bloco (padrão: nenhum).
+            
+        Returns:
+            O próprio controlador, com o intervalo anterior restaurado ao sair do bloco.
+        """
+        previous = self.pause
+        self.pause = pause
+        try:
+            yield self
+        finally:
+            self.pause = previous
+    
+    @staticmethod
+    def _wait_until(
+        predicate: Callable[[], bool],
+        timeout: float = 2.0,
+        initial: float = _POLL_INITIAL_INTERVAL,
+    ) -> bool:
+        """Aguarda até que uma condição seja satisfeita, com backoff exponencial.
+        
+        Substitui pausas fixas: a condição é verificada imediatamente e, enquanto
+        não for satisfeita, o intervalo entre verificações dobra até o limite de
+        50 ms.
+        
+        Args:
+            predicate: Função sem argumentos que retorna True quando a condição é atingida.
+            timeout: Tempo máximo de espera em segundos.
+            initial: Intervalo inicial entre as verificações em segundos.
+            
+        Returns:
+            True se a condição foi satisfeita antes do tempo limite, False caso contrário.
+        """
+        deadline = time.monotonic() + timeout
+        delay = initial
+        while True:
+            if predicate():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, _POLL_MAX_INTERVAL)
+    
+    @staticmethod
+    def _convert_to_window_info(
+        window: Any,
+        is_active: bool = False,
+        title: Optional[str] = None,
+    ) -> WindowInfo:
+        """Converte uma janela do PyGetWindow para WindowInfo.
+        
+        Args:
+            window: Janela do PyGetWindow.
+            is_active: Se a janela é a janela ativa.
+            title: Título já lido da janela, para evitar uma nova consulta ao sistema.
+        """
+        hwnd = getattr(window, "_hWnd", None)
+        if _win32.AVAILABLE and hwnd is not None:
+            # No Windows, cada propriedade do PyGetWindow é uma chamada Win32;
+            # lê retângulo e estado de uma vez só
+            return DesktopController._window_info_from_handle(hwnd, is_active, title)
+        
+        left, top, width, height, is_maximized, is_minimized = _WINDOW_ATTRS(window)
+        return WindowInfo(
+            window.title if title is None else title,
+            left, top, width, height,
+            is_active, is_maximized, is_minimized,
+        )
+    
     @staticmethod
-    def _convert_to_window_info(window: Any, is_active: bool = False) -> WindowInfo:
-        """Converte uma janela do PyGetWindow para WindowInfo."""
+    def _window_info_from_handle(
+        hwnd: int,
+        is_active: bool = False,
+        title: Optional[str] = None,
+    ) -> WindowInfo:
+        """Cria um WindowInfo a partir do handle Win32 de uma janela.
+        
+        Args:
+            hwnd: Handle da janela.
+            is_active: Se a janela é a janela ativa.
+            title: Título já lido da janela, para evitar uma nova consulta ao sistema.
+        """
+        left, top, width, height = _win32.get_window_rect(hwnd)
+        is_maximized, is_minimized = _win32.get_window_state(hwnd)
         return WindowInfo(
-            title=window.title,
-            left=window.left,
-            top=window.top,
-            width=window.width,
-            height=window.height,
+            title=_win32.get_window_title(hwnd) if title is None else title,
+            left=left,
+            top=top,
+            width=width,
+            height=height,
             is_active=is_active,
-            is_maximized=window.isMaximized,
-            is_minimized=window.isMinimized,
+            is_maximized=is_maximized,
+            is_minimized=is_minimized,
         )
     
     # Métodos de contexto
@@ -388,23 +1709,86 @@ class DesktopController:
         """Suporte ao gerenciador de contexto."""
         return self
     
+    def get_mouse_position(self) -> Tuple[int, int]:
+        """Obtém a posição do mouse, reaproveitando uma leitura recente.
+        
+        Leituras feitas há menos de `mouse_position_ttl` segundos são
+        reaproveitadas, de modo que laços que consultam o cursor várias vezes
+        por quadro fazem uma única chamada ao sistema. Ações do controlador
+        descartam a leitura anterior.
+        
+        Returns:
+            Tupla com as coordenadas (x, y) do mouse.
+        """
+        if (
+            self._mouse_position is not None
+            and time.monotonic() - self._mouse_position_time < self.mouse_position_ttl
+        ):
+            return self._mouse_position
+        return self._get_mouse_position()
+    
     def _get_mouse_position(self) -> Tuple[int, int]:
         """Obtém a posição atual do mouse.
         
+        No Windows a posição é lida diretamente com GetCursorPos, evitando o
+        PyAutoGUI em um caminho consultado repetidamente pelas esperas adaptativas.
+        A leitura sempre consulta o sistema e atualiza a usada por
+        `get_mouse_position`.
+        
         Returns:
             Tupla com as coordenadas (x, y) atuais do mouse.
         """
         try:
-            return pyautogui.position()
+            if _win32.AVAILABLE:
+                position = _win32.get_cursor_pos()
+            else:
+                position = tuple(_lazy("pyautogui").position())
         except Exception as e:
             raise DesktopAutomationError(f"Falha ao obter posição do mouse: {e}")
+        self._mouse_position = position
+        self._mouse_position_time = time.monotonic()
+        return position
     
     def close(self):
-        """Libera recursos utilizados pelo controlador."""
-        # Atualmente não há recursos para liberar, mas este método é mantido para compatibilidade
-        # com o gerenciador de contexto e testes.
-        pass
+        """Libera recursos utilizados pelo controlador.
+        
+        Não faz nada se nenhum recurso foi criado desde a última chamada, de
+        modo que chamá-lo novamente (por exemplo, em `__exit__` após um
+        `close()` explícito) não tem custo.
+        """
+        if not self._resources_open:
+            return
+        self._resources_open = False
+        
+        if self._io_pool is not None:
+            # Aguarda as gravações e o OCR pendentes antes de encerrar as threads
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
+            self._pending_saves = []
+        self._ocr_backend.close()
+        if self._mss is not None:
+            self._mss.close()
+            self._mss = None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Recursos do controlador de desktop liberados")
+    
+    async def aclose(self) -> None:
+        """Versão assíncrona de `close()`.
+        
+        A espera pelas gravações e pelo OCR pendentes ocorre em outra thread,
+        sem bloquear o laço de eventos.
+        """
+        if self._resources_open:
+            await asyncio.to_thread(self.close)
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Garante que os recursos sejam liberados ao sair do contexto."""
         self.close()
+    
+    async def __aenter__(self):
+        """Suporte ao gerenciador de contexto assíncrono."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Garante que os recursos sejam liberados ao sair do contexto assíncrono."""
+        await self.aclose()
@@ -5,9 +5,12 @@ Este módulo fornece funcionalidades para automação de navegadores web,
 incluindo navegação, preenchimento de formulários e extração de dados.
 """
 
-from .browser import BrowserManager, WebAutomationError
+from .browser import BrowserManager, WebAutomationError, shutdown_playwright
+from .pool import BrowserPool
 
 __all__ = [
     'BrowserManager',
+    'BrowserPool',
     'WebAutomationError',
+    'shutdown_playwright',
 ]
@@ -3,9 +3,15 @@ Módulo de automação web do Agente de Automação.
 Gerencia a interação com navegadores web de forma automatizada.
 """
 
+import asyncio
 import logging
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union,
+)
+from urllib.parse import urlparse
 
 from playwright.async_api import (
     Browser,
@@ -13,21 +19,299 @@ from playwright.async_api import (
     BrowserType,
     Page,
     Playwright,
+    Route,
     async_playwright,
 )
 
-from src.config import settings
+# Dependência opcional para extrair dados de uma cópia local do HTML
+try:
+    import lxml.html
+    from lxml.cssselect import CSSSelector, SelectorError
+except ImportError:  # pragma: no cover - usa apenas a extração no navegador
+    lxml = None
+    CSSSelector = None
+    SelectorError = None
+
+from src.config import get_settings
+
+if TYPE_CHECKING:
+    from src.automation.web.pool import BrowserPool
 
 logger = logging.getLogger(__name__)
 
+# Navegadores suportados pelo Playwright
+_BROWSER_TYPES = ("chromium", "firefox", "webkit")
+
+# Opções de linha de comando do Chromium que escondem a automação já no início do
+# processo, sem custo por página. Os demais navegadores não as reconhecem.
+_CHROMIUM_ARGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--disable-infobars",
+    "--start-maximized",
+)
+
+# Opções do Chromium para execução sem interface (ver `lean` em BrowserManager): cada
+# uma evita um processo ou uma tarefa em segundo plano desnecessários à automação
+_CHROMIUM_LEAN_ARGS = (
+    # Usa /tmp em vez de /dev/shm, pequeno demais em contêineres
+    "--disable-dev-shm-usage",
+    # Dispensa o processo da GPU
+    "--disable-gpu",
+    # Sem verificação de atualizações, métricas e outras requisições de fundo
+    "--disable-background-networking",
+    # Sem o processo de envio de relatórios de falha
+    "--disable-breakpad",
+    # Sem as páginas de fundo das extensões embutidas
+    "--disable-component-extensions-with-background-pages",
+    # Tradução, cache de voltar/avançar, Cast e sugestões de otimização
+    "--disable-features=Translate,BackForwardCache,AcceptCHFrame,MediaRouter,"
+    "OptimizationHints",
+)
+
+# Opção padrão do Playwright que exibe o aviso de "controlado por software de teste"
+# e define `navigator.webdriver`
+_CHROMIUM_IGNORED_DEFAULT_ARGS = ("--enable-automation",)
+
+# Ajuste executado em todas as páginas para o que as opções de lançamento não cobrem
+# (outros navegadores). Mantido em uma linha, pois é reenviado a cada novo documento.
+_STEALTH_SCRIPT = "Object.defineProperty(navigator,'webdriver',{get:()=>undefined});"
+
+# Tipos de recurso bloqueados com `disable_resources=True`: não são necessários para
+# ler o conteúdo da página e respondem pela maior parte do tráfego
+_BLOCKED_RESOURCE_TYPES = frozenset({
+    "image", "font", "media", "stylesheet", "beacon", "websocket",
+    "texttrack", "imageset", "object", "csp_report",
+})
+
+# Extrai todos os campos de `extract_data` em uma única chamada ao navegador. Os
+# campos cujo seletor não é CSS válido (ex.: "text=..." do Playwright) são
+# devolvidos em `failed` para serem extraídos com a API do Playwright.
+_EXTRACT_DATA_SCRIPT = """
+(selectors) => {
+    const values = {};
+    const failed = [];
+    for (const [field, selector] of Object.entries(selectors)) {
+        try {
+            const element = document.querySelector(selector);
+            if (!element) {
+                values[field] = null;
+                continue;
+            }
+            const text = element.textContent;
+            values[field] = text ? text.trim() : (element.getAttribute('value') || '').trim();
+        } catch (e) {
+            failed.push(field);
+        }
+    }
+    return {values, failed};
+}
+"""
+
+# Extrai os textos de todos os elementos de cada seletor de `extract_all`, no mesmo
+# formato de _EXTRACT_DATA_SCRIPT
+_EXTRACT_ALL_SCRIPT = """
+(selectors) => {
+    const values = {};
+    const failed = [];
+    for (const [field, selector] of Object.entries(selectors)) {
+        try {
+            values[field] = Array.from(
+                document.querySelectorAll(selector),
+                (element) => (element.textContent || element.getAttribute('value') || '').trim()
+            );
+        } catch (e) {
+            failed.push(field);
+        }
+    }
+    return {values, failed};
+}
+"""
+
+# Texto de um elemento ou, na falta dele, o atributo `value` (ver `_extract_field`)
+_ELEMENT_TEXT_SCRIPT = (
+    "(element) => (element.textContent || element.getAttribute('value') || '').trim()"
+)
+
+# Versão de _EXTRACT_ALL_SCRIPT para um único seletor do Playwright (`evaluate_all`)
+_ELEMENT_TEXTS_SCRIPT = """
+(elements) => elements.map(
+    (element) => (element.textContent || element.getAttribute('value') || '').trim()
+)
+"""
+
+# Extrai os campos de cada elemento de uma lista (linhas de tabela, resultados de
+# busca) em uma única chamada ao navegador. Os seletores dos campos são relativos ao
+# elemento; campos sem correspondência ficam como null.
+_EXTRACT_LIST_SCRIPT = """
+(elements, fields) => elements.map((element) => {
+    const row = {};
+    for (const [field, selector] of Object.entries(fields)) {
+        const target = element.querySelector(selector);
+        if (!target) {
+            row[field] = null;
+            continue;
+        }
+        const text = target.textContent;
+        row[field] = text ? text.trim() : (target.getAttribute('value') || '').trim();
+    }
+    return row;
+})
+"""
+
+# Instância do Playwright compartilhada por todos os gerenciadores. Cada instância
+# mantém um processo do driver Node.js, cujo início custa centenas de milissegundos.
+# Ela pertence ao laço de eventos em que foi criada.
+_shared_playwright: Optional[Playwright] = None
+_shared_playwright_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_playwright_lock: Optional[asyncio.Lock] = None
+
+# Navegadores compartilhados com `share_browser=True`, por (Playwright, tipo, headless,
+# opções extras). Guarda a tarefa de lançamento, para que chamadas simultâneas aguardem
+# o mesmo processo.
+_shared_browsers: Dict[
+    Tuple[Playwright, str, bool, Tuple[str, ...]], "asyncio.Task[Browser]"
+] = {}
+
+# Limita os gerenciadores iniciados ao mesmo tempo a MAX_CONCURRENT_TASKS; os demais
+# aguardam em start() até que algum seja fechado. Pertence ao laço de eventos atual.
+_browser_semaphore: Optional[asyncio.Semaphore] = None
+_browser_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def _get_playwright() -> Playwright:
+    """Retorna a instância compartilhada do Playwright, iniciando-a no primeiro uso."""
+    global _shared_playwright, _shared_playwright_loop, _shared_playwright_lock
+    
+    loop = asyncio.get_running_loop()
+    if _shared_playwright is not None and _shared_playwright_loop is loop:
+        return _shared_playwright
+    
+    if _shared_playwright_lock is None or _shared_playwright_loop is not loop:
+        _shared_playwright_lock = asyncio.Lock()
+        _shared_playwright_loop = loop
+        _shared_playwright = None
+        # Os navegadores do laço anterior não podem ser usados neste
+        _shared_browsers.clear()
+    
+    async with _shared_playwright_lock:
+        if _shared_playwright is None:
+            _shared_playwright = await async_playwright().start()
+            logger.debug("Playwright iniciado")
+    return _shared_playwright
+
+
+def _get_browser_semaphore() -> asyncio.Semaphore:
+    """Retorna o semáforo que limita os navegadores abertos no laço de eventos atual."""
+    global _browser_semaphore, _browser_semaphore_loop
+    
+    loop = asyncio.get_running_loop()
+    if _browser_semaphore is None or _browser_semaphore_loop is not loop:
+        _browser_semaphore = asyncio.Semaphore(get_settings().MAX_CONCURRENT_TASKS)
+        _browser_semaphore_loop = loop
+    return _browser_semaphore
+
+
+async def _launch_browser(
+    playwright: Playwright,
+    browser_type: str,
+    headless: bool,
+    extra_args: Tuple[str, ...] = (),
+) -> Browser:
+    """Lança um processo do navegador com as opções que escondem a automação."""
+    browser_launcher = getattr(playwright, browser_type)
+    if browser_type == "chromium":
+        return await browser_launcher.launch(
+            headless=headless,
+            args=[*_CHROMIUM_ARGS, *extra_args],
+            ignore_default_args=list(_CHROMIUM_IGNORED_DEFAULT_ARGS),
+        )
+    return await browser_launcher.launch(headless=headless, args=list(extra_args))
+
+
+async def _get_shared_browser(
+    playwright: Playwright,
+    browser_type: str,
+    headless: bool,
+    extra_args: Tuple[str, ...] = (),
+) -> Browser:
+    """Retorna o navegador compartilhado, lançando-o no primeiro uso.
+    
+    Se o processo do navegador caiu ou foi desconectado, outro é lançado no
+    lugar dele.
+    """
+    key = (playwright, browser_type, headless, extra_args)
+    task = _shared_browsers.get(key)
+    if (
+        task is not None and task.done() and not task.cancelled()
+        and task.exception() is None and not task.result().is_connected()
+    ):
+        logger.warning("Navegador compartilhado desconectado; iniciando outro")
+        task = None
+    if task is None or task.cancelled():
+        task = _shared_browsers[key] = asyncio.ensure_future(
+            _launch_browser(playwright, browser_type, headless, extra_args)
+        )
+    
+    try:
+        # O lançamento não é cancelado se quem o iniciou desistir da espera
+        return await asyncio.shield(task)
+    except Exception:
+        if _shared_browsers.get(key) is task:
+            del _shared_browsers[key]
+        raise
+
+
+async def shutdown_playwright() -> None:
+    """Encerra a instância compartilhada do Playwright e os navegadores compartilhados.
+    
+    Deve ser chamada ao final da aplicação, depois de fechados os gerenciadores.
+    Um novo uso após o encerramento inicia outra instância.
+    """
+    global _shared_playwright
+    
+    tasks = list(_shared_browsers.values())
+    _shared_browsers.clear()
+    for task in tasks:
+        try:
+            await (await task).close()
+        except Exception as e:
+            logger.warning(f"Erro ao fechar navegador compartilhado: {str(e)}")
+    
+    if _shared_playwright is not None:
+        playwright, _shared_playwright = _shared_playwright, None
+        await playwright.stop()
+        logger.debug("Playwright encerrado")
+
+
+def _name_selector(name: str) -> str:
+    """Monta o seletor CSS de um campo pelo atributo `name`, escapando aspas e barras."""
+    escaped = name.replace("\\", "\\\\").replace('"', '\\"')
+    return f'[name="{escaped}"]'
+
+
+@lru_cache(maxsize=256)
+def _css_selector(selector: str) -> "CSSSelector":
+    """Compila um seletor CSS para XPath uma única vez (ver `extract_data`)."""
+    return CSSSelector(selector)
+
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> None:
+    """Cria o diretório uma única vez por processo; as chamadas seguintes não tocam o disco."""
+    Path(path).mkdir(parents=True, exist_ok=True)
+
 
 class WebAutomationError(Exception):
     """Exceção para erros de automação web."""
     pass
 
 
-class BrowserManager:
-    """Gerenciador de navegador para automação web."""
+class BrowserManager(AbstractAsyncContextManager):
+    """Gerenciador de navegador para automação web.
+    
+    Pode ser usado com `async with`, que inicia o navegador na entrada e o
+    fecha na saída.
+    """
     
     def __init__(
         self,
@@ -36,6 +320,12 @@ class BrowserManager:
         viewport: Optional[Dict[str, int]] = None,
         user_agent: Optional[str] = None,
         downloads_path: Optional[Union[str, Path]] = None,
+        playwright: Optional[Playwright] = None,
+        disable_resources: bool = False,
+        blocked_domains: Optional[Iterable[str]] = None,
+        share_browser: Optional[bool] = None,
+        launch_args: Iterable[str] = (),
+        lean: Optional[bool] = None,
     ):
         """Inicializa o gerenciador de navegador.
         
@@ -44,77 +334,186 @@ class BrowserManager:
             browser_type: Tipo de navegador ('chromium', 'firefox', 'webkit').
             viewport: Dimensões da janela do navegador. Ex: {"width": 1280, "height": 800}
             user_agent: User agent personalizado.
-            downloads_path: Diretório para downloads.
+            downloads_path: Diretório para downloads. Se None, usa `downloads`
+                no diretório atual.
+            playwright: Instância do Playwright já iniciada a ser usada. Se None,
+                usa a instância compartilhada do módulo (ver `shutdown_playwright`).
+            disable_resources: Se True, bloqueia o download de imagens, fontes,
+                mídia, folhas de estilo e outros recursos dispensáveis para
+                extração de dados, acelerando o carregamento das páginas.
+            blocked_domains: Domínios cujas requisições são bloqueadas (inclui
+                os subdomínios). Ex: {"google-analytics.com"}
+            share_browser: Se True, usa um processo de navegador compartilhado
+                pelos gerenciadores do mesmo tipo e modo headless, e cria
+                apenas o contexto e a página. `close()` fecha só o contexto; o
+                navegador é fechado por `shutdown_playwright()`. Se None, usa
+                `SHARE_BROWSER` das configurações.
+            launch_args: Opções de linha de comando acrescentadas às padrão ao
+                lançar o navegador. Ex: ["--lang=pt-BR"]
+            lean: Se True, desativa no Chromium a GPU e os serviços em segundo
+                plano, reduzindo a memória e o tempo de inicialização. Se None,
+                ativado em modo headless.
         """
+        settings = get_settings()
         self.headless = headless if headless is not None else settings.HEADLESS
         self.browser_type = browser_type.lower()
+        if self.browser_type not in _BROWSER_TYPES:
+            # Falha antes de iniciar o Playwright, e não depois
+            raise WebAutomationError(
+                f"Navegador não suportado: {browser_type}. "
+                f"Use um destes: {', '.join(_BROWSER_TYPES)}"
+            )
         self.viewport = viewport or {"width": settings.WINDOW_WIDTH, "height": settings.WINDOW_HEIGHT}
         self.user_agent = user_agent
-        self.downloads_path = Path(downloads_path) if downloads_path else Path.cwd() / "downloads"
+        self.disable_resources = disable_resources
+        self.blocked_domains = frozenset(domain.lower() for domain in blocked_domains or ())
+        self.share_browser = (
+            share_browser if share_browser is not None else settings.SHARE_BROWSER
+        )
+        if lean is None:
+            lean = self.headless
+        lean_args = _CHROMIUM_LEAN_ARGS if lean and self.browser_type == "chromium" else ()
+        self.launch_args = (*lean_args, *launch_args)
+        self.downloads_path = Path(downloads_path or "downloads").resolve()
+        self._downloads_dir = str(self.downloads_path)
         
-        # Garante que o diretório de downloads existe
-        self.downloads_path.mkdir(parents=True, exist_ok=True)
+        # Garante que o diretório de downloads existe (ver `_ensure_dir`)
+        _ensure_dir(self._downloads_dir)
         
         # Atributos de instância
-        self.playwright: Optional[Playwright] = None
+        self.playwright: Optional[Playwright] = playwright
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
     
     async def start(self) -> None:
-        """Inicializa o navegador e configura o ambiente."""
+        """Inicializa o navegador e configura o ambiente.
+        
+        No máximo `MAX_CONCURRENT_TASKS` gerenciadores ficam iniciados ao mesmo
+        tempo; acima disso, aguarda até que outro seja fechado com `close()`.
+        """
         try:
-            self.playwright = await async_playwright().start()
-            
-            # Seleciona o tipo de navegador
-            browser_launcher = getattr(self.playwright, self.browser_type, None)
-            if not browser_launcher:
-                raise WebAutomationError(f"Navegador não suportado: {self.browser_type}")
-            
-            # Lança o navegador
-            self.browser = await browser_launcher.launch(
-                headless=self.headless,
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-infobars",
-                    "--start-maximized",
-                ],
-            )
+            if self._semaphore is None:
+                semaphore = _get_browser_semaphore()
+                if semaphore.locked():
+                    logger.debug("Limite de navegadores abertos atingido; aguardando")
+                await semaphore.acquire()
+                self._semaphore = semaphore
             
-            # Cria um novo contexto
-            self.context = await self.browser.new_context(
-                viewport=self.viewport,
-                user_agent=self.user_agent,
-                accept_downloads=True,
-                downloads_path=str(self.downloads_path.absolute()),
-            )
+            if self.playwright is None:
+                self.playwright = await _get_playwright()
             
-            # Adiciona injeção para evitar detecção de automação
-            await self.context.add_init_script(
-                """
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                """
-            )
+            # Lança o navegador (o tipo já foi validado no construtor)
+            if self.share_browser:
+                self.browser = await _get_shared_browser(
+                    self.playwright, self.browser_type, self.headless, self.launch_args
+                )
+            else:
+                self.browser = await _launch_browser(
+                    self.playwright, self.browser_type, self.headless, self.launch_args
+                )
             
-            # Cria uma nova página
-            self.page = await self.context.new_page()
+            await self._create_context()
             
             logger.info(f"Navegador {self.browser_type} inicializado com sucesso")
             
         except Exception as e:
             logger.error(f"Falha ao inicializar o navegador: {str(e)}")
-            await self.close()
+            try:
+                await self.close()
+            except WebAutomationError:
+                pass  # Já registrado por close(); o erro relevante é o da inicialização
             raise WebAutomationError(f"Falha ao inicializar o navegador: {str(e)}")
     
-    async def navigate(self, url: str, wait_until: str = "load") -> None:
+    async def _create_context(self) -> None:
+        """Cria um novo contexto e uma página no navegador já iniciado."""
+        self.context = await self.browser.new_context(
+            viewport=self.viewport,
+            user_agent=self.user_agent,
+            accept_downloads=True,
+            downloads_path=self._downloads_dir,
+        )
+        
+        # Adiciona injeção para evitar detecção de automação
+        await self.context.add_init_script(_STEALTH_SCRIPT)
+        
+        # Bloqueia os recursos dispensáveis antes que saiam do navegador
+        if self.disable_resources or self.blocked_domains:
+            await self.context.route("**/*", self._filter_request)
+        
+        # Cria uma nova página
+        self.page = await self.context.new_page()
+    
+    async def _filter_request(self, route: Route) -> None:
+        """Aborta as requisições de recursos ou domínios bloqueados."""
+        request = route.request
+        if self.disable_resources and request.resource_type in _BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+            return
+        
+        if self.blocked_domains:
+            hostname = (urlparse(request.url).hostname or "").lower()
+            if any(
+                hostname == domain or hostname.endswith("." + domain)
+                for domain in self.blocked_domains
+            ):
+                await route.abort()
+                return
+        
+        await route.continue_()
+    
+    async def reset(self, keep_context: bool = False) -> None:
+        """Prepara o navegador para uma nova tarefa, sem reiniciá-lo.
+        
+        Por padrão, descarta o contexto atual e cria um novo, removendo
+        cookies, armazenamento local, cache e páginas abertas, a um custo muito
+        menor que o de lançar o navegador novamente.
+        
+        Args:
+            keep_context: Se True, mantém o contexto: fecha as demais páginas,
+                remove os cookies e leva a página principal para `about:blank`.
+                É ainda mais barato, mas o armazenamento local, o cache e as
+                permissões da tarefa anterior são preservados; use apenas
+                entre tarefas que não dependam de isolamento.
+        """
+        if not self.browser:
+            raise WebAutomationError("Navegador não inicializado. Chame start() primeiro.")
+        
+        try:
+            if keep_context and self.context and self.page:
+                await asyncio.gather(
+                    *(page.close() for page in self.context.pages if page is not self.page)
+                )
+                await self.context.clear_cookies()
+                await self.page.goto("about:blank")
+                return
+            
+            if self.context:
+                await self.context.close()
+            await self._create_context()
+        except Exception as e:
+            logger.error(f"Erro ao reiniciar o contexto do navegador: {str(e)}")
+            raise WebAutomationError(f"Falha ao reiniciar o contexto do navegador: {str(e)}")
+    
+    async def navigate(
+        self,
+        url: str,
+        wait_until: str = "domcontentloaded",
+        network_idle: bool = False,
+    ) -> None:
         """Navega para uma URL.
         
+        Por padrão a navegação termina quando o DOM está pronto, sem aguardar
+        imagens e outros recursos. Use `wait_until="load"` para aguardar o
+        carregamento completo da página.
+        
         Args:
             url: URL para navegar.
             wait_until: Quando considerar a navegação concluída.
                       Pode ser 'load', 'domcontentloaded', 'networkidle'.
+            network_idle: Se True, aguarda também que a rede fique ociosa,
+                útil para páginas que carregam o conteúdo por JavaScript.
         """
         if not self.page:
             raise WebAutomationError("Página não inicializada. Chame start() primeiro.")
@@ -122,14 +521,56 @@ class BrowserManager:
         try:
             logger.info(f"Navegando para: {url}")
             await self.page.goto(url, wait_until=wait_until)
-            logger.info(f"Página carregada: {self.page.title()}")
+            if network_idle:
+                await self.page.wait_for_load_state("networkidle")
+            # O título exige mais uma chamada ao navegador; só é obtido se for registrado
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Página carregada: {await self.page.title()}")
         except Exception as e:
             logger.error(f"Erro ao navegar para {url}: {str(e)}")
             raise WebAutomationError(f"Falha ao navegar para {url}: {str(e)}")
     
+    @asynccontextmanager
+    async def use_page(
+        self,
+        url: str,
+        wait_until: str = "domcontentloaded",
+        blank: bool = True,
+    ) -> AsyncIterator[Page]:
+        """Navega para uma URL e empresta a página durante um bloco `async with`.
+        
+        A mesma página é reaproveitada a cada URL, em vez de criar uma nova
+        com `context.new_page()`, o que é vantajoso em extrações repetidas.
+        
+        Exemplo:
+            for url in urls:
+                async with browser.use_page(url):
+                    dados.append(await browser.extract_data(seletores))
+        
+        Args:
+            url: URL para navegar.
+            wait_until: Quando considerar a navegação concluída (ver `navigate`).
+            blank: Se True, navega para `about:blank` ao final do bloco,
+                liberando a memória usada pelo documento.
+        """
+        await self.navigate(url, wait_until=wait_until)
+        try:
+            yield self.page
+        finally:
+            if blank and self.page:
+                try:
+                    await self.page.goto("about:blank")
+                except Exception as e:
+                    logger.warning(f"Erro ao liberar a página após {url}: {str(e)}")
+    
     async def fill_form(self, selector: str, data: Dict[str, str]) -> None:
         """Preenche um formulário.
         
+        A espera para que os campos estejam visíveis é feita para todos ao
+        mesmo tempo. O preenchimento em si é sequencial: o Playwright digita o
+        texto no elemento com foco, e preenchimentos simultâneos na mesma
+        página poderiam escrever no campo errado.
+        
         Args:
             selector: Seletor CSS do formulário.
             data: Dicionário com os campos e valores a preencher.
@@ -138,100 +579,247 @@ class BrowserManager:
             raise WebAutomationError("Página não inicializada. Chame start() primeiro.")
         
         try:
-            for field, value in data.items():
-                field_selector = f"{selector} [name='{field}']"
-                await self.page.fill(field_selector, str(value))
+            # Os campos são buscados dentro do formulário, localizado uma única vez
+            form = self.page.locator(selector)
+            fields = [
+                (field, form.locator(_name_selector(field)), value)
+                for field, value in data.items()
+            ]
+            await asyncio.gather(*(locator.wait_for() for _, locator, _ in fields))
+            
+            for field, locator, value in fields:
+                await locator.fill(str(value))
                 logger.debug(f"Campo preenchido: {field} = {value}")
         except Exception as e:
             logger.error(f"Erro ao preencher formulário: {str(e)}")
             raise WebAutomationError(f"Falha ao preencher formulário: {str(e)}")
     
-    async def click(self, selector: str, wait_for_navigation: bool = False) -> None:
+    async def click(
+        self,
+        selector: str,
+        wait_for_navigation: bool = False,
+        url: Optional[str] = None,
+    ) -> None:
         """Clica em um elemento.
         
         Args:
             selector: Seletor CSS do elemento.
-            wait_for_navigation: Se True, aguarda a navegação após o clique.
+            wait_for_navigation: Se True, aguarda após o clique até que o DOM
+                da página esteja pronto.
+            url: URL (ou padrão glob) esperada após o clique. Se informada,
+                aguarda até que a página chegue a ela, o que é mais confiável
+                para navegações iniciadas por JavaScript com atraso.
         """
         if not self.page:
             raise WebAutomationError("Página não inicializada. Chame start() primeiro.")
         
         try:
-            if wait_for_navigation:
-                async with self.page.expect_navigation():
-                    await self.page.click(selector)
-            else:
-                await self.page.click(selector)
+            await self.page.click(selector)
+            if url is not None:
+                await self.page.wait_for_url(url, wait_until="domcontentloaded")
+            elif wait_for_navigation:
+                await self.page.wait_for_load_state("domcontentloaded")
             logger.debug(f"Clicado no elemento: {selector}")
         except Exception as e:
             logger.error(f"Erro ao clicar no elemento {selector}: {str(e)}")
             raise WebAutomationError(f"Falha ao clicar no elemento {selector}: {str(e)}")
     
-    async def extract_data(self, selectors: Dict[str, str]) -> Dict[str, Any]:
+    async def extract_data(
+        self, selectors: Dict[str, str], use_local_parse: bool = False
+    ) -> Dict[str, Any]:
         """Extrai dados da página usando seletores CSS.
         
+        Todos os campos são consultados em uma única chamada `page.evaluate`,
+        em vez de três chamadas ao navegador por campo. Seletores que não são
+        CSS válido, como os específicos do Playwright, são extraídos
+        individualmente.
+        
         Args:
             selectors: Dicionário com nomes de campos e seletores CSS.
+            use_local_parse: Se True, obtém o HTML da página uma única vez e
+                aplica os seletores localmente com o lxml, sem ocupar o
+                navegador. Indicado para muitos seletores em páginas
+                estáticas; o resultado reflete o HTML no momento da chamada.
+                Requer os pacotes `lxml` e `cssselect`.
             
         Returns:
             Dicionário com os dados extraídos.
         """
         if not self.page:
             raise WebAutomationError("Página não inicializada. Chame start() primeiro.")
+        if use_local_parse and lxml is None:
+            raise WebAutomationError("A extração local requer os pacotes lxml e cssselect")
         
+        try:
+            if use_local_parse:
+                extracted = self._parse_html(await self.page.content(), selectors)
+            else:
+                extracted = await self.page.evaluate(_EXTRACT_DATA_SCRIPT, selectors)
+        except Exception as e:
+            logger.warning(f"Erro ao extrair dados da página: {str(e)}")
+            extracted = {"values": {}, "failed": list(selectors)}
+        
+        values = extracted["values"]
+        failed = set(extracted["failed"])
         result = {}
         
         for field, selector in selectors.items():
-            try:
-                if await self.page.query_selector(selector):
-                    # Tenta extrair texto, valor ou atributo
-                    text = await self.page.text_content(selector)
-                    value = await self.page.get_attribute(selector, "value")
-                    
-                    result[field] = text.strip() if text else (value.strip() if value else "")
-                else:
-                    result[field] = None
-            except Exception as e:
-                logger.warning(f"Erro ao extrair dados do seletor {selector}: {str(e)}")
-                result[field] = None
+            if field in failed:
+                result[field] = await self._extract_field(selector)
+            else:
+                result[field] = values.get(field)
         
         return result
     
+    async def extract_all(self, selectors: Dict[str, str]) -> Dict[str, List[str]]:
+        """Extrai o texto de todos os elementos que correspondem a cada seletor.
+        
+        Ao contrário de `extract_data`, que lê apenas o primeiro elemento,
+        retorna uma lista por campo. Todos os campos são consultados em uma
+        única chamada ao navegador; seletores que não são CSS válido, como os
+        específicos do Playwright, são consultados individualmente.
+        
+        Args:
+            selectors: Dicionário com nomes de campos e seletores.
+            
+        Returns:
+            Dicionário com a lista de textos de cada campo, na ordem da página.
+        """
+        if not self.page:
+            raise WebAutomationError("Página não inicializada. Chame start() primeiro.")
+        
+        try:
+            extracted = await self.page.evaluate(_EXTRACT_ALL_SCRIPT, selectors)
+            result = extracted["values"]
+            for field in extracted["failed"]:
+                result[field] = await self.page.locator(selectors[field]).evaluate_all(
+                    _ELEMENT_TEXTS_SCRIPT
+                )
+            return {field: result[field] for field in selectors}
+        except Exception as e:
+            logger.error(f"Erro ao extrair dados da página: {str(e)}")
+            raise WebAutomationError(f"Falha ao extrair dados da página: {str(e)}")
+    
+    @staticmethod
+    def _parse_html(html: str, selectors: Dict[str, str]) -> Dict[str, Any]:
+        """Aplica os seletores ao HTML com o lxml, no formato de `_EXTRACT_DATA_SCRIPT`."""
+        tree = lxml.html.fromstring(html)
+        values = {}
+        failed = []
+        
+        for field, selector in selectors.items():
+            try:
+                matches = _css_selector(selector)(tree)
+            except SelectorError:
+                failed.append(field)
+                continue
+            
+            if not matches:
+                values[field] = None
+                continue
+            text = matches[0].text_content()
+            values[field] = text.strip() if text else (matches[0].get("value") or "").strip()
+        
+        return {"values": values, "failed": failed}
+    
+    async def extract_list(
+        self, selector: str, fields: Dict[str, str]
+    ) -> List[Dict[str, Optional[str]]]:
+        """Extrai dados de todos os elementos que correspondem a um seletor.
+        
+        Todas as linhas são lidas em uma única chamada ao navegador, qualquer
+        que seja o número de elementos e de campos.
+        
+        Exemplo:
+            await browser.extract_list("table tr", {"nome": "td.nome", "preco": "td.preco"})
+        
+        Args:
+            selector: Seletor dos elementos da lista (ex.: linhas de uma tabela).
+            fields: Dicionário com nomes de campos e seletores CSS relativos a
+                cada elemento.
+            
+        Returns:
+            Lista com um dicionário de dados por elemento, na ordem da página.
+        """
+        if not self.page:
+            raise WebAutomationError("Página não inicializada. Chame start() primeiro.")
+        
+        try:
+            return await self.page.eval_on_selector_all(selector, _EXTRACT_LIST_SCRIPT, fields)
+        except Exception as e:
+            logger.error(f"Erro ao extrair lista do seletor {selector}: {str(e)}")
+            raise WebAutomationError(f"Falha ao extrair lista do seletor {selector}: {str(e)}")
+    
+    async def _extract_field(self, selector: str) -> Optional[str]:
+        """Extrai o texto ou o valor de um elemento com a API do Playwright.
+        
+        O elemento é localizado uma única vez e lido em uma única chamada.
+        Erros são tratados por campo, para que um seletor inválido não impeça
+        a extração dos demais.
+        """
+        try:
+            element = await self.page.query_selector(selector)
+            if element is None:
+                return None
+            return await element.evaluate(_ELEMENT_TEXT_SCRIPT)
+        except Exception as e:
+            logger.warning(f"Erro ao extrair dados do seletor {selector}: {str(e)}")
+            return None
+    
     async def close(self) -> None:
-        """Fecha o navegador e libera recursos."""
+        """Fecha o navegador e libera recursos.
+        
+        Fecha o contexto inteiro, com todas as suas páginas (inclusive as
+        abertas além de `page`), sem fechá-las uma a uma.
+        """
         try:
             if self.context:
+                # Fechar o contexto já fecha as páginas
                 await self.context.close()
                 self.context = None
+                self.page = None
             
             if self.browser:
-                await self.browser.close()
+                # O navegador compartilhado continua disponível para os demais
+                if not self.share_browser:
+                    await self.browser.close()
                 self.browser = None
             
-            if self.playwright:
-                await self.playwright.stop()
-                self.playwright = None
-                
             logger.info("Navegador fechado com sucesso")
             
         except Exception as e:
             logger.error(f"Erro ao fechar o navegador: {str(e)}")
             raise WebAutomationError(f"Falha ao fechar o navegador: {str(e)}")
+        
+        finally:
+            # Libera a vaga mesmo que o fechamento falhe
+            if self._semaphore is not None:
+                self._semaphore.release()
+                self._semaphore = None
     
-    async def __aenter__(self):
-        """Suporte ao gerenciador de contexto assíncrono."""
+    async def __aenter__(self) -> "BrowserManager":
+        """Inicia o navegador ao entrar no contexto (a classe base apenas retorna self)."""
         await self.start()
         return self
     
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Garante que o navegador seja fechado ao sair do contexto."""
-        await self.close()
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Garante que o navegador seja fechado ao sair do contexto.
+        
+        Se o bloco terminou com uma exceção, uma falha ao fechar é apenas
+        registrada, para não substituir o erro original.
+        """
+        try:
+            await self.close()
+        except WebAutomationError:
+            if exc_type is None:
+                raise
 
 
 # Função de conveniência para criar uma instância do gerenciador de navegador
 async def create_browser(
     headless: Optional[bool] = None,
     browser_type: str = "chromium",
+    pool: Optional["BrowserPool"] = None,
     **kwargs
 ) -> BrowserManager:
     """Cria e inicializa uma instância do gerenciador de navegador.
@@ -239,11 +827,17 @@ async def create_browser(
     Args:
         headless: Se True, executa em modo headless.
         browser_type: Tipo de navegador ('chromium', 'firefox', 'webkit').
+        pool: Pool de navegadores já iniciados. Se informado, um navegador é
+            obtido dele com `pool.acquire()` (os demais argumentos são
+            ignorados) e deve ser devolvido com `pool.release()`.
         **kwargs: Argumentos adicionais para o BrowserManager.
         
     Returns:
         Instância inicializada do BrowserManager.
     """
+    if pool is not None:
+        return await pool.acquire()
+    
     browser = BrowserManager(headless=headless, browser_type=browser_type, **kwargs)
     await browser.start()
     return browser
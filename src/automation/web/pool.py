@@ -0,0 +1,203 @@
+"""
+Pool de navegadores do Agente de Automação.
+Mantém navegadores já iniciados para reaproveitá-los entre tarefas.
+"""
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Optional
+
+from src.automation.web.browser import BrowserManager, WebAutomationError
+from src.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """Pool de navegadores pré-iniciados para automação web.
+    
+    Lançar um navegador custa de centenas de milissegundos a alguns segundos.
+    O pool inicia `size` navegadores de uma vez e os empresta às tarefas com `acquire()` e
+    `release()`, de modo que esse custo é pago apenas na inicialização.
+    
+    Exemplo:
+        async with BrowserPool(size=4, headless=True) as pool:
+            async with pool.session() as browser:
+                await browser.navigate("https://example.com")
+    """
+    
+    def __init__(self, size: int = 2, max_launches: Optional[int] = None, **kwargs: Any):
+        """Inicializa o pool de navegadores.
+        
+        Args:
+            size: Número de navegadores mantidos no pool.
+            max_launches: Número máximo de navegadores lançados ao mesmo tempo.
+                Se None, usa o número de CPUs, para não saturar a máquina.
+            **kwargs: Argumentos repassados a cada BrowserManager
+                (ex.: headless, browser_type, viewport, disable_resources).
+        """
+        if size < 1:
+            raise WebAutomationError("O pool precisa de pelo menos um navegador")
+        self._check_limit(size)
+        
+        self.size = size
+        self.max_launches = max_launches or os.cpu_count() or 4
+        self._manager_kwargs = kwargs
+        self._browsers: List[BrowserManager] = []
+        self._available: Optional["asyncio.Queue[BrowserManager]"] = None
+    
+    async def start(self) -> None:
+        """Lança todos os navegadores do pool em paralelo."""
+        try:
+            self._available = asyncio.Queue()
+            await self._launch(self.size)
+            logger.info(f"Pool com {self.size} navegadores inicializado com sucesso")
+        
+        except Exception as e:
+            logger.error(f"Falha ao inicializar o pool de navegadores: {str(e)}")
+            await self.close()
+            raise WebAutomationError(f"Falha ao inicializar o pool de navegadores: {str(e)}")
+    
+    async def warm_up(self, count: int) -> None:
+        """Acrescenta navegadores ao pool já iniciado, lançando-os em paralelo.
+        
+        Útil para aumentar o pool antes de um pico de tarefas. Se algum
+        navegador não puder ser lançado, o pool mantém o tamanho anterior.
+        
+        Args:
+            count: Número de navegadores a acrescentar.
+        """
+        if self._available is None:
+            raise WebAutomationError("Pool não inicializado. Chame start() primeiro.")
+        
+        self._check_limit(self.size + count)
+        
+        try:
+            await self._launch(count)
+            self.size += count
+        except Exception as e:
+            logger.error(f"Falha ao aquecer o pool de navegadores: {str(e)}")
+            raise WebAutomationError(f"Falha ao aquecer o pool de navegadores: {str(e)}")
+    
+    @staticmethod
+    def _check_limit(size: int) -> None:
+        """Rejeita um pool maior que o limite de navegadores abertos ao mesmo tempo.
+        
+        Um pool assim nunca terminaria de iniciar, pois seus navegadores
+        permanecem abertos (ver `BrowserManager.start`).
+        """
+        limit = get_settings().MAX_CONCURRENT_TASKS
+        if size > limit:
+            raise WebAutomationError(
+                f"O pool de {size} navegadores excede MAX_CONCURRENT_TASKS ({limit})"
+            )
+    
+    async def _launch(self, count: int) -> None:
+        """Lança `count` navegadores, no máximo `max_launches` ao mesmo tempo.
+        
+        Os navegadores só entram no pool se todos forem lançados; caso
+        contrário, os que foram iniciados são fechados e o erro é propagado.
+        """
+        semaphore = asyncio.Semaphore(min(count, self.max_launches))
+        browsers = [BrowserManager(**self._manager_kwargs) for _ in range(count)]
+        
+        async def launch(browser: BrowserManager) -> None:
+            async with semaphore:
+                await browser.start()
+        
+        results = await asyncio.gather(
+            *(launch(browser) for browser in browsers), return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            await asyncio.gather(
+                *(browser.close() for browser in browsers), return_exceptions=True
+            )
+            raise errors[0]
+        
+        self._browsers.extend(browsers)
+        for browser in browsers:
+            self._available.put_nowait(browser)
+    
+    async def acquire(self, timeout: Optional[float] = None) -> BrowserManager:
+        """Obtém um navegador livre do pool, aguardando se todos estiverem em uso.
+        
+        Args:
+            timeout: Tempo máximo de espera em segundos. Se None, aguarda indefinidamente.
+        
+        Returns:
+            Navegador iniciado, que deve ser devolvido com `release()`.
+        """
+        if self._available is None:
+            raise WebAutomationError("Pool não inicializado. Chame start() primeiro.")
+        
+        try:
+            return await asyncio.wait_for(self._available.get(), timeout)
+        except asyncio.TimeoutError:
+            raise WebAutomationError("Nenhum navegador livre no pool dentro do tempo limite")
+    
+    async def release(self, browser: BrowserManager, reuse: bool = True) -> None:
+        """Devolve um navegador ao pool.
+        
+        Args:
+            browser: Navegador obtido com `acquire()`.
+            reuse: Se True, mantém o contexto e apenas remove os cookies e as
+                páginas da tarefa anterior (ver `BrowserManager.reset`); caso
+                contrário, o contexto é descartado e um novo é criado.
+        """
+        if browser not in self._browsers:
+            raise WebAutomationError("O navegador não pertence a este pool")
+        
+        try:
+            await browser.reset(keep_context=reuse)
+        except Exception as e:
+            logger.warning(f"Erro ao limpar o navegador devolvido ao pool: {str(e)}")
+            await browser.reset()
+        finally:
+            self._available.put_nowait(browser)
+    
+    @asynccontextmanager
+    async def session(
+        self, timeout: Optional[float] = None, reuse: bool = True
+    ) -> AsyncIterator[BrowserManager]:
+        """Empresta um navegador do pool durante um bloco `async with`.
+        
+        Args:
+            timeout: Tempo máximo de espera por um navegador livre em segundos.
+            reuse: Repassado a `release()` ao final do bloco.
+        """
+        browser = await self.acquire(timeout)
+        try:
+            yield browser
+        finally:
+            await self.release(browser, reuse=reuse)
+    
+    async def close(self) -> None:
+        """Fecha todos os navegadores do pool."""
+        try:
+            # Um navegador que falha ao fechar não impede o fechamento dos demais
+            results = await asyncio.gather(
+                *(browser.close() for browser in self._browsers), return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    logger.warning(f"Erro ao fechar navegador do pool: {str(result)}")
+            self._browsers = []
+            self._available = None
+            
+            logger.info("Pool de navegadores fechado com sucesso")
+        
+        except Exception as e:
+            logger.error(f"Erro ao fechar o pool de navegadores: {str(e)}")
+            raise WebAutomationError(f"Falha ao fechar o pool de navegadores: {str(e)}")
+    
+    async def __aenter__(self):
+        """Suporte ao gerenciador de contexto assíncrono."""
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Garante que os navegadores sejam fechados ao sair do contexto."""
+        await self.close()
@@ -3,17 +3,19 @@ Módulo de configuração do Agente de Automação.
 Centraliza o gerenciamento de configurações do sistema.
 """
 
+import atexit
+import logging
+import logging.config
 import os
+import queue
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from dotenv import load_dotenv
-from pydantic import Field, validator
+from pydantic import field_validator
 from pydantic.networks import AnyHttpUrl, PostgresDsn
-from pydantic_settings import BaseSettings
-
-# Carrega variáveis de ambiente do arquivo .env
-load_dotenv()
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Diretório base do projeto
 BASE_DIR = Path(__file__).parent.parent.absolute()
@@ -23,14 +25,14 @@ class Settings(BaseSettings):
     """Configurações da aplicação."""
 
     # Configurações básicas
-    DEBUG: bool = Field(default=False, env="DEBUG")
-    ENVIRONMENT: str = Field(default="development", env="ENVIRONMENT")
-    SECRET_KEY: str = Field(..., env="SECRET_KEY")
-    ENCRYPTION_KEY: str = Field(..., env="ENCRYPTION_KEY")
+    DEBUG: bool = False
+    ENVIRONMENT: str = "development"
+    SECRET_KEY: str
+    ENCRYPTION_KEY: str
 
     # Configurações de log
-    LOG_LEVEL: str = Field(default="INFO", env="LOG_LEVEL")
-    LOG_FILE: Path = Field(default=BASE_DIR / "logs" / "automation.log", env="LOG_FILE")
+    LOG_LEVEL: str = "INFO"
+    LOG_FILE: Path = BASE_DIR / "logs" / "automation.log"
 
     # Configurações de API
     API_PREFIX: str = "/api/v1"
@@ -42,49 +44,66 @@ class Settings(BaseSettings):
     SECURITY_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 dias
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    # Valida os usuários lidos do banco com o Pydantic (útil em desenvolvimento)
+    VALIDATE_USER_MODEL: bool = False
 
     # Configurações de banco de dados
-    DATABASE_URL: str = Field(..., env="DATABASE_URL")
-    TEST_DATABASE_URL: Optional[str] = Field(None, env="TEST_DATABASE_URL")
-    REDIS_URL: str = Field(..., env="REDIS_URL")
+    DATABASE_URL: str
+    TEST_DATABASE_URL: Optional[str] = None
+    REDIS_URL: str
 
     # Configurações de LLM
-    OPENAI_API_KEY: Optional[str] = Field(None, env="OPENAI_API_KEY")
-    ANTHROPIC_API_KEY: Optional[str] = Field(None, env="ANTHROPIC_API_KEY")
-    GOOGLE_API_KEY: Optional[str] = Field(None, env="GOOGLE_API_KEY")
-    LLM_PROVIDER: str = Field(default="openai", env="LLM_PROVIDER")
-    LLM_MODEL: str = Field(default="gpt-4", env="LLM_MODEL")
-    LLM_TEMPERATURE: float = Field(default=0.7, env="LLM_TEMPERATURE")
-    LLM_MAX_TOKENS: int = Field(default=2000, env="LLM_MAX_TOKENS")
+    OPENAI_API_KEY: Optional[str] = None
+    ANTHROPIC_API_KEY: Optional[str] = None
+    GOOGLE_API_KEY: Optional[str] = None
+    LLM_PROVIDER: str = "openai"
+    LLM_MODEL: str = "gpt-4"
+    LLM_TEMPERATURE: float = 0.7
+    LLM_MAX_TOKENS: int = 2000
 
     # Configurações de navegador
-    BROWSER: str = Field(default="chrome", env="BROWSER")  # chrome, firefox, edge
-    HEADLESS: bool = Field(default=False, env="HEADLESS")
-    WINDOW_WIDTH: int = Field(default=1280, env="WINDOW_WIDTH")
-    WINDOW_HEIGHT: int = Field(default=800, env="WINDOW_HEIGHT")
+    BROWSER: str = "chrome"  # chrome, firefox, edge
+    HEADLESS: bool = False
+    WINDOW_WIDTH: int = 1280
+    WINDOW_HEIGHT: int = 800
+    SHARE_BROWSER: bool = False
 
     # Configurações de segurança avançadas
-    MAX_CONCURRENT_TASKS: int = Field(default=5, env="MAX_CONCURRENT_TASKS")
-    BLOCK_DANGEROUS_COMMANDS: bool = Field(default=True, env="BLOCK_DANGEROUS_COMMANDS")
-    REQUIRE_AUTHENTICATION: bool = Field(default=True, env="REQUIRE_AUTHENTICATION")
-
-    # Configurações de voz
-    VOICE_LANGUAGE: str = Field(default="pt-BR", env="VOICE_LANGUAGE")
-    VOICE_RATE: int = Field(default=150, env="VOICE_RATE")
+    MAX_CONCURRENT_TASKS: int = 5
+    BLOCK_DANGEROUS_COMMANDS: bool = True
+    REQUIRE_AUTHENTICATION: bool = True
 
-    class Config:
-        case_sensitive = True
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    # Configurações de OCR
+    TESSERACT_CMD: Optional[str] = None
 
-    @validator("DATABASE_URL", pre=True)
+    # Configurações de voz
+    VOICE_LANGUAGE: str = "pt-BR"
+    VOICE_RATE: int = 150
+
+    # Configurações de proxy, lidas do ambiente por outras bibliotecas
+    # (exportadas por `get_settings`)
+    HTTP_PROXY: Optional[str] = None
+    HTTPS_PROXY: Optional[str] = None
+
+    # Cada campo é lido da variável de ambiente de mesmo nome. O .env do
+    # diretório atual é lido pelo próprio pydantic-settings, uma única vez, ao
+    # criar as configurações (ver `get_settings`)
+    model_config = SettingsConfigDict(
+        case_sensitive=True,
+        env_file=".env",
+        env_file_encoding="utf-8",
+    )
+
+    @field_validator("DATABASE_URL", mode="before")
+    @classmethod
     def validate_database_url(cls, v: Optional[str]) -> str:
         if not v:
             # SQLite como fallback
             return f"sqlite:///{BASE_DIR}/sqlite.db"
         return v
 
-    @validator("LOG_FILE")
+    @field_validator("LOG_FILE")
+    @classmethod
     def validate_log_file(cls, v: Path) -> Path:
         # Garante que o diretório de logs existe
         v.parent.mkdir(parents=True, exist_ok=True)
@@ -97,46 +116,132 @@ class Settings(BaseSettings):
         return self.DATABASE_URL
 
 
-# Instância única de configurações
-settings = Settings()
-
-# Configuração de logging
-LOGGING_CONFIG = {
-    "version": 1,
-    "disable_existing_loggers": False,
-    "formatters": {
-        "standard": {
-            "format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-            "datefmt": "%Y-%m-%d %H:%M:%S",
-        },
-    },
-    "handlers": {
-        "console": {
-            "level": settings.LOG_LEVEL,
-            "formatter": "standard",
-            "class": "logging.StreamHandler",
-            "stream": "ext://sys.stdout",
-        },
-        "file": {
-            "level": settings.LOG_LEVEL,
-            "formatter": "standard",
-            "class": "logging.handlers.RotatingFileHandler",
-            "filename": settings.LOG_FILE,
-            "maxBytes": 10 * 1024 * 1024,  # 10 MB
-            "backupCount": 5,
-            "encoding": "utf8",
+# Configurações lidas diretamente do ambiente por bibliotecas de terceiros
+_EXPORTED_ENV_VARS = ("HTTP_PROXY", "HTTPS_PROXY")
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Retorna a instância única de configurações, criada no primeiro uso.
+    
+    A leitura do `.env` e a validação só acontecem quando alguma configuração
+    é de fato usada, e não na importação do módulo.
+    
+    O `.env` não é carregado em `os.environ`: apenas as variáveis de
+    `_EXPORTED_ENV_VARS`, consumidas fora das configurações, são exportadas,
+    sem sobrescrever as já definidas no ambiente.
+    """
+    settings = Settings()
+    for name in _EXPORTED_ENV_VARS:
+        value = getattr(settings, name)
+        if value:
+            os.environ.setdefault(name, value)
+    return settings
+
+
+def get_logging_config() -> Dict[str, Any]:
+    """Monta a configuração de logging a partir das configurações atuais."""
+    settings = get_settings()
+    return {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "formatters": {
+            "standard": {
+                "format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+                "datefmt": "%Y-%m-%d %H:%M:%S",
+            },
         },
-    },
-    "loggers": {
-        "": {  # root logger
-            "handlers": ["console", "file"],
-            "level": settings.LOG_LEVEL,
-            "propagate": True,
+        "handlers": {
+            "console": {
+                "level": settings.LOG_LEVEL,
+                "formatter": "standard",
+                "class": "logging.StreamHandler",
+                "stream": "ext://sys.stdout",
+            },
+            "file": {
+                "level": settings.LOG_LEVEL,
+                "formatter": "standard",
+                "class": "logging.handlers.RotatingFileHandler",
+                "filename": settings.LOG_FILE,
+                "maxBytes": 10 * 1024 * 1024,  # 10 MB
+                "backupCount": 5,
+                "encoding": "utf8",
+            },
         },
-        "__main__": {
-            "handlers": ["console", "file"],
-            "level": settings.LOG_LEVEL,
-            "propagate": False,
+        "loggers": {
+            "": {  # root logger
+                "handlers": ["console", "file"],
+                "level": settings.LOG_LEVEL,
+                "propagate": True,
+            },
+            "__main__": {
+                "handlers": ["console", "file"],
+                "level": settings.LOG_LEVEL,
+                "propagate": False,
+            },
         },
-    },
-}
+    }
+
+
+# Listener iniciado por `setup_logging`, ou None se o logging não foi configurado
+_log_listener: Optional[QueueListener] = None
+
+
+def setup_logging() -> QueueListener:
+    """Aplica a configuração de logging com a escrita em uma thread separada.
+    
+    Os handlers de `get_logging_config()` passam a ser alimentados por uma
+    fila: quem registra a mensagem (por exemplo, o laço de eventos) apenas a
+    enfileira, e a escrita em disco, inclusive a rotação do arquivo, ocorre
+    na thread do `QueueListener`, encerrada automaticamente na saída.
+    
+    Chamadas seguintes retornam o listener já iniciado, sem reconfigurar o
+    logging.
+    
+    Returns:
+        O listener iniciado (ver `stop_logging`).
+    """
+    global _log_listener
+    
+    if _log_listener is not None:
+        return _log_listener
+    
+    config = get_logging_config()
+    logging.config.dictConfig(config)
+    
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    handlers: List[logging.Handler] = []
+    for name in config["loggers"]:
+        configured_logger = logging.getLogger(name or None)
+        for handler in configured_logger.handlers:
+            if handler not in handlers:
+                handlers.append(handler)
+        configured_logger.handlers = [queue_handler]
+    
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(stop_logging)
+    _log_listener = listener
+    return listener
+
+
+def stop_logging() -> None:
+    """Para o listener de `setup_logging`, depois de escritas as mensagens pendentes.
+    
+    Não faz nada se o listener não foi iniciado ou já foi parado.
+    """
+    global _log_listener
+    
+    if _log_listener is not None:
+        listener, _log_listener = _log_listener, None
+        listener.stop()
+
+
+def __getattr__(name: str) -> Any:
+    """Mantém `settings` e `LOGGING_CONFIG` acessíveis como atributos do módulo."""
+    if name == "settings":
+        return get_settings()
+    if name == "LOGGING_CONFIG":
+        return get_logging_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
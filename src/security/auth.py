@@ -3,23 +3,57 @@ Módulo de autenticação e autorização do Agente de Automação.
 Gerencia autenticação de usuários, tokens JWT e permissões.
 """
 
+import math
 import os
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Union
+import threading
+import time
+from datetime import timedelta
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any, Collection, Dict, Optional, Tuple, Union
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
 from pydantic import BaseModel, ValidationError
 
-from src.config import settings
+from src.config import get_settings
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+
+# O passlib (com o bcrypt) e o PyJWT são importados apenas no primeiro uso, para
+# não pesar na inicialização de quem importa este módulo sem autenticar ninguém
+@lru_cache(maxsize=1)
+def _get_pwd_context() -> "CryptContext":
+    """Retorna o contexto de hash de senha, criado no primeiro uso."""
+    from passlib.context import CryptContext
+    
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+# Tokens JWT já verificados mantidos em cache (ver `_decode_token`). Tokens maiores que
+# o limite são sempre decodificados, para limitar a memória ocupada pelo cache.
+_TOKEN_CACHE_SIZE = 4096
+_MAX_CACHED_TOKEN_LENGTH = 4096
+
+# Conteúdo e instante de expiração de cada (token, algoritmo) já verificado, e a chave
+# secreta usada nas verificações; o lock protege o cache das threads do servidor
+_token_cache: Dict[Tuple[str, str], Tuple[Dict[str, Any], float]] = {}
+_token_cache_secret: Optional[str] = None
+_token_cache_lock = threading.Lock()
+
+# Validade padrão dos tokens, em segundos, quando `expires_delta` não é informado
+_DEFAULT_ACCESS_TOKEN_EXPIRE = 15 * 60
+_DEFAULT_REFRESH_TOKEN_EXPIRE = 30 * 24 * 60 * 60
 
-# Configuração de hash de senha
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 # Modelos de dados
 class TokenData(BaseModel):
     username: Optional[str] = None
-    scopes: list[str] = []
+    scopes: tuple[str, ...] = ()
+    
+    @cached_property
+    def scope_set(self) -> frozenset:
+        """Escopos como conjunto, montado uma vez por token (ver `check_permissions`)."""
+        return frozenset(self.scopes)
 
 
 class User(BaseModel):
@@ -27,7 +61,7 @@ class User(BaseModel):
     email: Optional[str] = None
     full_name: Optional[str] = None
     disabled: Optional[bool] = None
-    scopes: list[str] = []
+    scopes: tuple[str, ...] = ()
 
 
 class UserInDB(User):
@@ -37,86 +71,152 @@ class UserInDB(User):
 # Funções de autenticação
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifica se a senha fornecida corresponde ao hash armazenado."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return _get_pwd_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """Gera o hash de uma senha."""
-    return pwd_context.hash(password)
+    return _get_pwd_context().hash(password)
 
 
 def create_access_token(
     data: dict, expires_delta: Optional[timedelta] = None
 ) -> str:
     """Cria um token JWT de acesso."""
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.SECURITY_ALGORITHM
+    import jwt
+    
+    # `exp` é um NumericDate (RFC 7519): segundos desde a época Unix
+    lifetime = expires_delta.total_seconds() if expires_delta else _DEFAULT_ACCESS_TOKEN_EXPIRE
+    expire = int(time.time() + lifetime)
+    settings = get_settings()
+    return jwt.encode(
+        {**data, "exp": expire}, settings.SECRET_KEY, algorithm=settings.SECURITY_ALGORITHM
     )
-    return encoded_jwt
 
 
 def create_refresh_token(
     data: dict, expires_delta: Optional[timedelta] = None
 ) -> str:
     """Cria um token de atualização JWT."""
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(days=30)
+    import jwt
     
+    lifetime = expires_delta.total_seconds() if expires_delta else _DEFAULT_REFRESH_TOKEN_EXPIRE
+    expire = int(time.time() + lifetime)
     to_encode = {"sub": data.get("sub"), "exp": expire, "type": "refresh"}
-    encoded_jwt = jwt.encode(
+    settings = get_settings()
+    return jwt.encode(
         to_encode, settings.SECRET_KEY, algorithm=settings.SECURITY_ALGORITHM
     )
-    return encoded_jwt
+
+
+def _cache_token(
+    cache_key: Tuple[str, str], payload: Dict[str, Any], expires_at: float
+) -> None:
+    """Guarda um token verificado, abrindo espaço se o cache estiver cheio.
+    
+    Com o cache cheio, os tokens expirados são descartados primeiro e, se
+    ainda faltar espaço, o mais antigo.
+    """
+    if len(_token_cache) >= _TOKEN_CACHE_SIZE:
+        now = time.time()
+        for stale in [key for key, (_, expiry) in _token_cache.items() if expiry <= now]:
+            del _token_cache[stale]
+        if len(_token_cache) >= _TOKEN_CACHE_SIZE:
+            # Os dicionários preservam a ordem de inserção
+            del _token_cache[next(iter(_token_cache))]
+    _token_cache[cache_key] = (payload, expires_at)
+
+
+def _decode_token(token: str) -> Dict[str, Any]:
+    """Decodifica e verifica um token JWT, reaproveitando tokens já verificados.
+    
+    A assinatura de um mesmo token é verificada uma única vez; nas chamadas
+    seguintes, apenas a expiração é conferida, e um token expirado é removido
+    do cache. Tokens inválidos não entram no cache, e uma troca da chave
+    secreta o esvazia. Cada chamada recebe uma cópia do conteúdo, para que
+    alterá-la não afete o cache.
+    """
+    import jwt
+    from jwt import ExpiredSignatureError
+    
+    global _token_cache_secret
+    
+    settings = get_settings()
+    key, algorithm = settings.SECRET_KEY, settings.SECURITY_ALGORITHM
+    if len(token) > _MAX_CACHED_TOKEN_LENGTH:
+        return jwt.decode(token, key, algorithms=[algorithm])
+    
+    cache_key = (token, algorithm)
+    with _token_cache_lock:
+        if key != _token_cache_secret:
+            _token_cache.clear()
+            _token_cache_secret = key
+        entry = _token_cache.get(cache_key)
+    
+    if entry is None:
+        payload = jwt.decode(token, key, algorithms=[algorithm])
+        entry = (payload, float(payload.get("exp", math.inf)))
+        with _token_cache_lock:
+            if key == _token_cache_secret:
+                _cache_token(cache_key, *entry)
+    
+    payload, expires_at = entry
+    if time.time() >= expires_at:
+        with _token_cache_lock:
+            _token_cache.pop(cache_key, None)
+        raise ExpiredSignatureError("Signature has expired.")
+    return dict(payload)
 
 
 def verify_token(token: str, credentials_exception) -> Dict[str, Any]:
     """Verifica e decodifica um token JWT."""
+    from jwt import InvalidTokenError
+    
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.SECURITY_ALGORITHM]
-        )
+        payload = _decode_token(token)
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
-        token_scopes = payload.get("scopes", [])
+        token_scopes = tuple(payload.get("scopes", ()))
         return {"sub": username, "scopes": token_scopes}
-    except JWTError:
+    except InvalidTokenError:
         raise credentials_exception
 
 
 # Funções de autorização
-def check_permissions(required_scopes: list[str], token_scopes: list[str]) -> bool:
-    """Verifica se o token tem as permissões necessárias."""
+def check_permissions(
+    required_scopes: Collection[str], token_scopes: Collection[str]
+) -> bool:
+    """Verifica se o token tem ao menos uma das permissões necessárias.
+    
+    Aceita `TokenData.scope_set` para não remontar o conjunto a cada verificação.
+    """
     if not required_scopes:
         return True
     
-    for scope in required_scopes:
-        if scope in token_scopes:
-            return True
-    return False
+    if not isinstance(token_scopes, (set, frozenset)):
+        token_scopes = frozenset(token_scopes)
+    # Percorre as permissões exigidas em C e para na primeira encontrada
+    return not token_scopes.isdisjoint(required_scopes)
 
 
 # Funções de usuário (simulando um banco de dados)
 # Em um ambiente real, isso seria substituído por consultas ao banco de dados
-def get_user(db, username: str) -> Optional[UserInDB]:
-    """Busca um usuário no banco de dados."""
-    # TODO: Implementar busca real no banco de dados
-    fake_users_db = {
+@lru_cache(maxsize=1)
+def _fake_users_db() -> Dict[str, Dict[str, Any]]:
+    """Monta os usuários simulados uma única vez.
+    
+    Cada hash bcrypt custa dezenas a centenas de milissegundos; calculá-los a
+    cada consulta dobrava o custo de `authenticate_user`.
+    """
+    return {
         "admin": {
             "username": "admin",
             "full_name": "Administrador",
             "email": "admin@example.com",
             "hashed_password": get_password_hash("admin"),
             "disabled": False,
-            "scopes": ["admin", "user"]
+            "scopes": ("admin", "user")
         },
         "user": {
             "username": "user",
@@ -124,13 +224,23 @@ def get_user(db, username: str) -> Optional[UserInDB]:
             "email": "user@example.com",
             "hashed_password": get_password_hash("user"),
             "disabled": False,
-            "scopes": ["user"]
+            "scopes": ("user",)
         },
     }
+
+
+def get_user(db, username: str) -> Optional[UserInDB]:
+    """Busca um usuário no banco de dados."""
+    # TODO: Implementar busca real no banco de dados
+    fake_users_db = _fake_users_db()
     
     if username in fake_users_db:
         user_dict = fake_users_db[username]
-        return UserInDB(**user_dict)
+        if get_settings().VALIDATE_USER_MODEL:
+            return UserInDB(**user_dict)
+        # Os dados vêm do próprio sistema e dispensam validação; os escopos são uma
+        # tupla, e o usuário retornado não pode alterar a tabela em cache
+        return UserInDB.model_construct(**user_dict)
     return None
 
 
@@ -14,7 +14,7 @@ from cryptography.hazmat.primitives import hashes, padding
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
-from src.config import settings
+from src.config import get_settings
 
 # Constantes
 SALT_LENGTH = 16
@@ -36,7 +36,7 @@ class EncryptionManager:
         Args:
             key: Chave de criptografia. Se não fornecida, usa a chave das configurações.
         """
-        self.key = key or settings.ENCRYPTION_KEY.encode()
+        self.key = key or get_settings().ENCRYPTION_KEY.encode()
         if len(self.key) != 32:
             self.key = self._derive_key(self.key)
     
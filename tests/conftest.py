@@ -5,6 +5,8 @@ Este arquivo contém configurações e fixtures que podem ser usadas em todos os
 """
 
 import os
+import shutil
+import subprocess
 import sys
 from pathlib import Path
 from typing import Generator
@@ -31,6 +33,24 @@ def mock_desktop_controller():
         from src.automation.desktop.controller import DesktopController
         return DesktopController()
 
+# Fixture para o controlador de desktop real, compartilhado por toda a sessão
+@pytest.fixture(scope="session")
+def desktop_controller():
+    """Retorna uma instância de DesktopController criada uma única vez por sessão."""
+    from src.automation.desktop import DesktopController
+    with DesktopController() as controller:
+        yield controller
+
+# Fixture que verifica a instalação do Tesseract OCR uma única vez
+@pytest.fixture(scope="session")
+def tesseract_ready():
+    """Pula os testes que dependem do Tesseract OCR se ele não estiver instalado."""
+    tesseract_cmd = shutil.which("tesseract") or r"C:\Program Files\Tesseract-OCR\tesseract.exe"
+    try:
+        subprocess.run([tesseract_cmd, "--version"], capture_output=True, check=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        pytest.skip("Tesseract OCR não está disponível")
+
 # Configuração para testes de integração
 def pytest_configure(config):
     """Configurações globais do pytest."""
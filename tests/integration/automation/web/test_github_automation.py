@@ -32,11 +32,9 @@ class TestGitHubAutomation:
     PROJECT_DESCRIPTION = "Sistema avançado de automação que combina navegação web complexa e controle local em Windows."
     
     @pytest.fixture(scope="class")
-    def controller(self):
-        """Inicializa o controlador de desktop."""
-        controller = DesktopController()
-        yield controller
-        controller.close()
+    def controller(self, desktop_controller):
+        """Retorna o controlador de desktop compartilhado pela sessão."""
+        return desktop_controller
     
     def test_github_automation(self, controller):
         """
@@ -4,4 +4,4 @@ Testes unitários para o pacote de automação.
 Este pacote contém testes unitários para os diferentes módulos de automação.
 """
 
-__all__ = ['desktop']
+__all__ = ['desktop', 'web']
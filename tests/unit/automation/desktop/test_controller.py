@@ -4,14 +4,21 @@ Testes unitários para o módulo de automação de desktop.
 Este módulo contém testes para a classe DesktopController e suas funcionalidades.
 """
 
+import asyncio
 import os
+import tempfile
+import threading
 import unittest
-from unittest.mock import MagicMock, patch, ANY
+from unittest.mock import MagicMock, PropertyMock, patch, ANY
 import pytest
-import pyautogui
 
 # Importa a classe a ser testada
-from src.automation.desktop.controller import DesktopController, MouseButton, KeyAction, WindowInfo
+from src.automation.desktop.controller import (
+    DesktopAutomationError, DesktopController, MouseButton, KeyAction, TextRegion, WindowInfo,
+    WindowTable,
+)
+from src.automation.desktop import _win32
+from src.automation.desktop.controller import _resolve_tesseract, cv2, np
 
 
 class TestDesktopController(unittest.TestCase):
@@ -32,6 +39,10 @@ class TestDesktopController(unittest.TestCase):
         self.pytesseract_patcher = patch('src.automation.desktop.controller.pytesseract')
         self.mock_pytesseract = self.pytesseract_patcher.start()
         
+        # Usa o pytesseract mesmo que o tesserocr esteja instalado
+        self.tesserocr_patcher = patch('src.automation.desktop.controller.tesserocr', None)
+        self.tesserocr_patcher.start()
+        
         # Configura mocks para o módulo pygetwindow
         self.mock_window = MagicMock()
         self.mock_window.title = "Janela de Teste"
@@ -51,26 +62,117 @@ class TestDesktopController(unittest.TestCase):
     
     def tearDown(self):
         """Limpa o ambiente de teste."""
+        self.controller.close()
         self.pyautogui_patcher.stop()
         self.gw_patcher.stop()
         self.pytesseract_patcher.stop()
+        self.tesserocr_patcher.stop()
     
     def test_initialization(self):
         """Testa a inicialização do controlador."""
         self.assertIsNotNone(self.controller)
-        # Verifica se as configurações do PyAutoGUI foram aplicadas
-        self.assertTrue(pyautogui.FAILSAFE)
-        self.assertEqual(pyautogui.PAUSE, 0.1)
+        # Verifica se as configurações do PyAutoGUI foram armazenadas
+        self.assertTrue(self.controller.fail_safe)
+        self.assertEqual(self.controller.pause, 0.0)
+    
+    def test_pause_block(self):
+        """Testa a aplicação temporária das configurações do PyAutoGUI."""
+        self.mock_pyautogui.FAILSAFE = False
+        self.mock_pyautogui.PAUSE = 0.1
+        
+        controller = DesktopController(fail_safe=True, pause=0.05)
+        with controller._pause_block():
+            self.assertTrue(self.mock_pyautogui.FAILSAFE)
+            # A pausa fixa do PyAutoGUI é substituída pelo espaçamento do controlador
+            self.assertEqual(self.mock_pyautogui.PAUSE, 0)
+        
+        # Os valores globais são restaurados ao final da ação
+        self.assertFalse(self.mock_pyautogui.FAILSAFE)
+        self.assertEqual(self.mock_pyautogui.PAUSE, 0.1)
+    
+    @patch('src.automation.desktop.controller.time')
+    def test_pause_block_pacing(self, mock_time):
+        """Testa o intervalo mínimo entre ações consecutivas."""
+        controller = DesktopController(pause=0.1)
+        mock_time.perf_counter.return_value = 10.0
+        with controller._pause_block():
+            pass
+        
+        # A próxima ação aguarda apenas o restante do intervalo
+        mock_time.perf_counter.return_value = 10.04
+        with controller._pause_block():
+            pass
+        mock_time.sleep.assert_called_once_with(ANY)
+        self.assertAlmostEqual(mock_time.sleep.call_args[0][0], 0.06)
+        
+        # Dentro de um lote o intervalo é ignorado e depois restaurado
+        mock_time.sleep.reset_mock()
+        with controller.batch():
+            with controller._pause_block():
+                pass
+        mock_time.sleep.assert_not_called()
+        self.assertEqual(controller.pause, 0.1)
     
     def test_move_mouse(self):
         """Testa o movimento do mouse."""
         x, y = 100, 200
+        self.mock_pyautogui.position.return_value = (x, y)
+        
+        # Movimento instantâneo (padrão)
         self.controller.move_mouse(x, y)
+        self.mock_pyautogui.moveTo.assert_called_once_with(x, y, duration=0)
+        
+        # Movimento animado
+        self.mock_pyautogui.moveTo.reset_mock()
+        self.controller.move_mouse(x, y, duration=0.5)
         self.mock_pyautogui.moveTo.assert_called_once_with(
             x, y, 
             duration=ANY,  # Não nos importamos com o valor exato
             tween=self.mock_pyautogui.easeInOutQuad
         )
+        
+        # Fora da tela, o cursor para na borda e a espera termina quando duas
+        # leituras seguidas coincidem
+        self.mock_pyautogui.position.reset_mock()
+        self.mock_pyautogui.position.return_value = (1919, 0)
+        self.controller.move_mouse(5000, -10)
+        self.assertEqual(self.mock_pyautogui.position.call_count, 2)
+    
+    @patch('src.automation.desktop.controller._win32')
+    def test_move_mouse_win32(self, mock_win32):
+        """Testa o movimento instantâneo do mouse pelo Win32."""
+        mock_win32.AVAILABLE = True
+        
+        self.controller.move_mouse(100, 200)
+        mock_win32.set_cursor_pos.assert_called_once_with(100, 200)
+        self.mock_pyautogui.moveTo.assert_not_called()
+        
+        # O SetCursorPos é síncrono: não há espera pela posição do cursor
+        mock_win32.get_cursor_pos.assert_not_called()
+    
+    @patch('src.automation.desktop.controller._win32')
+    def test_get_mouse_position_win32(self, mock_win32):
+        """Testa a leitura da posição do mouse diretamente pelo Win32."""
+        mock_win32.AVAILABLE = True
+        mock_win32.get_cursor_pos.return_value = (30, 40)
+        
+        self.assertEqual(self.controller._get_mouse_position(), (30, 40))
+        self.mock_pyautogui.position.assert_not_called()
+    
+    def test_wait_until(self):
+        """Testa a espera adaptativa por uma condição."""
+        # Condição já satisfeita retorna imediatamente
+        predicate = MagicMock(return_value=True)
+        self.assertTrue(self.controller._wait_until(predicate, timeout=1.0))
+        predicate.assert_called_once()
+        
+        # Condição satisfeita após algumas verificações
+        predicate = MagicMock(side_effect=[False, False, True])
+        self.assertTrue(self.controller._wait_until(predicate, timeout=1.0, initial=0.001))
+        self.assertEqual(predicate.call_count, 3)
+        
+        # Condição nunca satisfeita esgota o tempo limite
+        self.assertFalse(self.controller._wait_until(lambda: False, timeout=0.02))
     
     def test_click(self):
         """Testa o clique do mouse."""
@@ -81,8 +183,11 @@ class TestDesktopController(unittest.TestCase):
             x=x, y=y, 
             button=MouseButton.LEFT.value,
             clicks=1,
-            interval=0.1
+            interval=0.1,
+            duration=0.0
         )
+        # O movimento é feito pelo próprio clique
+        self.mock_pyautogui.moveTo.assert_not_called()
         
         # Testa clique com botão direito
         self.mock_pyautogui.reset_mock()
@@ -91,26 +196,52 @@ class TestDesktopController(unittest.TestCase):
             x=x, y=y,
             button=MouseButton.RIGHT.value,
             clicks=2,
-            interval=0.1
+            interval=0.1,
+            duration=0.0
         )
     
     def test_scroll(self):
         """Testa a rolagem da roda do mouse."""
         # Rola para cima
         self.controller.scroll(5)
-        self.mock_pyautogui.scroll.assert_called_once_with(5)
+        self.mock_pyautogui.scroll.assert_called_once_with(5, x=None, y=None)
         
-        # Rola para baixo
+        # Rola para baixo em uma posição específica
         self.mock_pyautogui.reset_mock()
-        self.controller.scroll(-3)
-        self.mock_pyautogui.scroll.assert_called_once_with(-3)
+        self.controller.scroll(-3, x=10, y=20)
+        self.mock_pyautogui.scroll.assert_called_once_with(-3, x=10, y=20)
+        self.mock_pyautogui.moveTo.assert_not_called()
     
     def test_type_text(self):
         """Testa a digitação de texto."""
-        text = "Olá, mundo!"
+        text = "Hello, world!"
         self.controller.type_text(text)
         self.mock_pyautogui.write.assert_called_once_with(text, interval=0.1)
     
+    @patch('src.automation.desktop.controller.pyperclip')
+    def test_type_text_clipboard(self, mock_pyperclip):
+        """Testa a digitação de texto pela área de transferência."""
+        # Texto não ASCII é sempre colado
+        text = "Olá, mundo!"
+        self.controller.type_text(text)
+        mock_pyperclip.copy.assert_called_once_with(text)
+        self.mock_pyautogui.hotkey.assert_called_once_with(ANY, "v")
+        self.mock_pyautogui.write.assert_not_called()
+        
+        # Texto longo sem intervalo também é colado
+        mock_pyperclip.reset_mock()
+        self.mock_pyautogui.reset_mock()
+        self.controller.type_text("Hello, world!", interval=0)
+        mock_pyperclip.copy.assert_called_once_with("Hello, world!")
+        self.mock_pyautogui.write.assert_not_called()
+        
+        # A área de transferência pode ser desativada
+        mock_pyperclip.reset_mock()
+        self.mock_pyautogui.reset_mock()
+        self.controller.type_text("Hello, world!", interval=0, use_clipboard=False)
+        mock_pyperclip.copy.assert_not_called()
+        self.mock_pyautogui.write.assert_called_once_with("Hello, world!", interval=0)
+    
     def test_press_key(self):
         """Testa o pressionamento de teclas."""
         # Configura os mocks para os métodos de teclado
@@ -120,7 +251,7 @@ class TestDesktopController(unittest.TestCase):
         
         # Testa tecla única com ação padrão (PRESS)
         self.controller.press_key("enter")
-        self.mock_pyautogui.hotkey.assert_called_once_with("enter")
+        self.mock_pyautogui.press.assert_called_once_with("enter", presses=1, interval=0.1)
         
         # Testa combinação de teclas
         self.mock_pyautogui.reset_mock()
@@ -136,6 +267,42 @@ class TestDesktopController(unittest.TestCase):
         self.mock_pyautogui.reset_mock()
         self.controller.press_key("shift", action=KeyAction.UP)
         self.mock_pyautogui.keyUp.assert_called_once_with("shift")
+        
+        # Testa pressões repetidas
+        self.mock_pyautogui.reset_mock()
+        self.controller.press_key("tab", presses=3, interval=0)
+        self.mock_pyautogui.press.assert_called_once_with("tab", presses=3, interval=0)
+        
+        self.mock_pyautogui.reset_mock()
+        self.controller.press_key(["ctrl", "z"], presses=2, interval=0)
+        self.assertEqual(self.mock_pyautogui.hotkey.call_count, 2)
+    
+    def test_virtual_keys(self):
+        """Testa a conversão de nomes de teclas em códigos VK do Windows."""
+        self.assertEqual(_win32.virtual_keys(["ctrl", "c", "f5"]), [0x11, 0x43, 0x74])
+        self.assertIsNone(_win32.virtual_keys(["ctrl", "volumeup"]))
+        
+        # Maiúsculas e símbolos com shift ficam com o PyAutoGUI, que pressiona shift
+        self.assertIsNone(_win32.virtual_keys(["A"]))
+        self.assertIsNone(_win32.virtual_keys(["ctrl", "A"]))
+        self.assertIsNone(_win32.virtual_keys(["!"]))
+    
+    @patch('src.automation.desktop.controller._win32')
+    def test_press_key_win32(self, mock_win32):
+        """Testa o envio de pressões repetidas com um único SendInput."""
+        mock_win32.AVAILABLE = True
+        mock_win32.virtual_keys.return_value = [0x11, 0x43]
+        
+        self.controller.press_key(["ctrl", "c"], presses=5, interval=0)
+        mock_win32.send_key_combo.assert_called_once_with([0x11, 0x43], 5)
+        self.mock_pyautogui.hotkey.assert_not_called()
+        
+        # Teclas sem código conhecido usam o PyAutoGUI
+        mock_win32.reset_mock()
+        mock_win32.virtual_keys.return_value = None
+        self.controller.press_key("volumeup")
+        mock_win32.send_key_combo.assert_not_called()
+        self.mock_pyautogui.press.assert_called_once_with("volumeup", presses=1, interval=0.1)
     
     def test_get_active_window(self):
         """Testa a obtenção da janela ativa."""
@@ -166,6 +333,133 @@ class TestDesktopController(unittest.TestCase):
         windows = self.controller.get_windows()
         self.assertEqual(len(windows), 2)
         self.assertEqual(windows[0].title, "Janela de Teste")
+        
+        # Janelas fechadas durante a enumeração são ignoradas
+        class ClosedWindowError(Exception):
+            pass
+        
+        closed_window = MagicMock()
+        type(closed_window).title = PropertyMock(side_effect=ClosedWindowError("janela fechada"))
+        self.mock_gw.PyGetWindowException = ClosedWindowError
+        self.mock_gw.getAllWindows.return_value = [self.mock_window, closed_window, mock_window2]
+        
+        windows = self.controller.get_windows()
+        self.assertEqual([w.title for w in windows], ["Janela de Teste", "Outra Janela"])
+    
+    @patch('src.automation.desktop.controller._win32')
+    def test_get_windows_win32(self, mock_win32):
+        """Testa a listagem de janelas diretamente pelo Win32."""
+        mock_win32.AVAILABLE = True
+        mock_win32.enum_windows.return_value = [1, 2, 3, 4]
+        mock_win32.get_foreground_window.return_value = 3
+        titles = {1: "Bloco de Notas", 2: "", 3: "Navegador", 4: "Janela Fechada"}
+        mock_win32.get_window_title.side_effect = titles.__getitem__
+        
+        def window_rect(hwnd):
+            if hwnd == 4:
+                raise OSError("janela fechada")
+            return (hwnd * 10, 0, 100, 50)
+        
+        mock_win32.get_window_rect.side_effect = window_rect
+        mock_win32.get_window_state.return_value = (False, False)
+        
+        windows = self.controller.get_windows()
+        self.assertEqual([w.title for w in windows], ["Bloco de Notas", "Navegador"])
+        self.assertEqual([w.is_active for w in windows], [False, True])
+        self.assertEqual(windows[1].left, 30)
+        self.mock_gw.getAllWindows.assert_not_called()
+        
+        # Filtro por trecho do título, sem diferenciar maiúsculas
+        windows = self.controller.get_windows("bloco")
+        self.assertEqual([w.title for w in windows], ["Bloco de Notas"])
+    
+    @unittest.skipIf(np is None, "NumPy não instalado")
+    @patch('src.automation.desktop.controller._win32')
+    def test_get_windows_rects(self, mock_win32):
+        """Testa a consulta espacial vetorizada sobre as janelas."""
+        mock_win32.AVAILABLE = True
+        mock_win32.enum_windows.return_value = [1, 2, 3]
+        titles = {1: "Diálogo", 2: "", 3: "Editor"}
+        mock_win32.get_window_title.side_effect = titles.__getitem__
+        rects = {1: (100, 100, 200, 100), 3: (0, 0, 800, 600)}
+        mock_win32.get_window_rect.side_effect = rects.__getitem__
+        
+        titles, array = self.controller.get_windows_rects()
+        self.assertEqual(titles, ["Diálogo", "Editor"])
+        np.testing.assert_array_equal(array, [[100, 100, 300, 200], [0, 0, 800, 600]])
+        self.assertEqual(array.dtype, np.int32)
+        
+        # A janela mais à frente que contém o ponto é retornada
+        self.assertEqual(self.controller.find_window_at(150, 150), "Diálogo")
+        self.assertEqual(self.controller.find_window_at(50, 50), "Editor")
+        self.assertIsNone(self.controller.find_window_at(900, 50))
+    
+    @unittest.skipIf(np is None, "NumPy não instalado")
+    def test_get_window_table(self):
+        """Testa a organização das janelas em colunas para filtros vetorizados."""
+        windows = [
+            WindowInfo("Editor", 0, 0, 800, 600, is_maximized=True),
+            WindowInfo("Diálogo", 100, 100, 200, 100, is_active=True),
+        ]
+        with patch.object(self.controller, 'get_windows', return_value=windows):
+            table = self.controller.get_window_table()
+        
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.left.dtype, np.int32)
+        np.testing.assert_array_equal(table.contains_point(150, 150), [True, True])
+        np.testing.assert_array_equal(table.contains_point(700, 150), [True, False])
+        np.testing.assert_array_equal(table.has_flag(WindowTable.ACTIVE), [False, True])
+        self.assertEqual(table.window(0), windows[0])
+        self.assertEqual(table.window(1), windows[1])
+    
+    def test_get_mouse_position(self):
+        """Testa o reaproveitamento de leituras recentes da posição do mouse."""
+        self.mock_pyautogui.position.return_value = (10, 20)
+        controller = DesktopController(mouse_position_ttl=60)
+        
+        self.assertEqual(controller.get_mouse_position(), (10, 20))
+        self.mock_pyautogui.position.return_value = (30, 40)
+        self.assertEqual(controller.get_mouse_position(), (10, 20))
+        self.mock_pyautogui.position.assert_called_once()
+        
+        # Uma ação do controlador descarta a leitura anterior
+        controller.scroll(1)
+        self.assertEqual(controller.get_mouse_position(), (30, 40))
+        
+        # Sem TTL, o sistema é sempre consultado
+        controller.mouse_position_ttl = 0
+        self.mock_pyautogui.position.return_value = (50, 60)
+        self.assertEqual(controller.get_mouse_position(), (50, 60))
+        controller.close()
+    
+    def test_window_info(self):
+        """Testa as propriedades derivadas e a imutabilidade de WindowInfo."""
+        window = WindowInfo(title="Janela", left=10, top=20, width=100, height=50)
+        self.assertEqual((window.right, window.bottom), (110, 70))
+        self.assertEqual(window.center, (60, 45))
+        self.assertTrue(window.contains_point(110, 20))
+        self.assertFalse(window.contains_point(111, 20))
+        self.assertTrue(window.contains_point(10, 70))
+        self.assertFalse(window.contains_point(10, 19))
+        self.assertFalse(window.contains_point(9, 71))
+        
+        with self.assertRaises(AttributeError):
+            window.left = 0
+    
+    @patch('src.automation.desktop.controller._win32')
+    def test_get_active_window_win32(self, mock_win32):
+        """Testa a leitura das informações da janela diretamente pelo Win32."""
+        mock_win32.AVAILABLE = True
+        mock_win32.get_window_title.return_value = "Janela Win32"
+        mock_win32.get_window_rect.return_value = (10, 20, 300, 200)
+        mock_win32.get_window_state.return_value = (True, False)
+        
+        window = self.controller.get_active_window()
+        mock_win32.get_window_rect.assert_called_once_with(self.mock_window._hWnd)
+        self.assertEqual(window.title, "Janela Win32")
+        self.assertEqual((window.left, window.top, window.width, window.height), (10, 20, 300, 200))
+        self.assertTrue(window.is_maximized)
+        self.assertFalse(window.is_minimized)
     
     def test_activate_window(self):
         """Testa a ativação de uma janela."""
@@ -185,17 +479,23 @@ class TestDesktopController(unittest.TestCase):
         self.mock_window.restore.assert_called_once()
         self.mock_window.activate.assert_called_once()
         
+        # Janela que não chega ao primeiro plano dentro do tempo limite
+        self.mock_window.isActive = False
+        self.assertFalse(self.controller.activate_window("Janela de Teste", timeout=0.02))
+        
         # Testa com janela não encontrada
         self.mock_gw.getWindowsWithTitle.return_value = []
         result = self.controller.activate_window("Janela Inexistente")
         self.assertFalse(result)
     
+    @patch('src.automation.desktop.controller.mss', None)
     @patch('src.automation.desktop.controller.ImageGrab')
     @patch('src.automation.desktop.controller.os')
     def test_capture_screen(self, mock_os, mock_image_grab):
         """Testa a captura de tela."""
         # Configura o mock para ImageGrab.grab()
         mock_screenshot = MagicMock()
+        mock_screenshot.copy.return_value = mock_screenshot
         mock_image_grab.grab.return_value = mock_screenshot
         
         # Configura o mock para os.path
@@ -205,6 +505,7 @@ class TestDesktopController(unittest.TestCase):
         # Testa captura de tela inteira com salvamento
         save_path = "screenshots/test.png"
         result = self.controller.capture_screen(save_path=save_path)
+        self.controller.flush_pending_saves()
         
         # Verifica se a imagem foi salva
         mock_screenshot.save.assert_called_once_with(save_path)
@@ -214,13 +515,17 @@ class TestDesktopController(unittest.TestCase):
         mock_screenshot.save.reset_mock()
         mock_os.makedirs.reset_mock()
         
-        region = (10, 10, 110, 110)  # left, top, right, bottom
+        region = (10, 10, 100, 100)  # left, top, width, height
         result = self.controller.capture_screen(region=region, save_path=save_path)
+        self.controller.flush_pending_saves()
         
         # Verifica se a região correta foi usada
-        mock_image_grab.grab.assert_called_with(bbox=region)
+        mock_image_grab.grab.assert_called_with(bbox=(10, 10, 110, 110))
         mock_screenshot.save.assert_called_once_with(save_path)
         
+        # O diretório já criado não é verificado novamente
+        mock_os.makedirs.assert_not_called()
+        
         # Testa captura sem salvar
         mock_image_grab.grab.reset_mock()
         mock_screenshot.save.reset_mock()
@@ -229,7 +534,190 @@ class TestDesktopController(unittest.TestCase):
         mock_image_grab.grab.assert_called_once_with(bbox=None)
         mock_screenshot.save.assert_not_called()
         self.assertEqual(result, mock_screenshot)
+        
+        # Testa gravação síncrona
+        result = self.controller.capture_screen(save_path=save_path, async_save=False)
+        mock_screenshot.save.assert_called_once_with(save_path)
+    
+    @patch('src.automation.desktop.controller.Image')
+    @patch('src.automation.desktop.controller.mss')
+    def test_capture_screen_mss(self, mock_mss, mock_image):
+        """Testa a captura de tela com o MSS."""
+        mock_sct = mock_mss.mss.return_value
+        mock_sct.monitors = [{"left": 0, "top": 0, "width": 1920, "height": 1080}]
+        
+        # Captura de região reaproveita a mesma instância do MSS
+        region = (10, 20, 100, 50)
+        result = self.controller.capture_screen(region=region)
+        self.controller.capture_screen()
+        mock_mss.mss.assert_called_once()
+        mock_sct.grab.assert_any_call({"left": 10, "top": 20, "width": 100, "height": 50})
+        mock_sct.grab.assert_called_with(mock_sct.monitors[0])
+        self.assertEqual(result, mock_image.frombytes.return_value)
+        
+        # A instância é liberada ao fechar o controlador, uma única vez
+        self.controller.close()
+        self.controller.close()
+        mock_sct.close.assert_called_once()
+        
+        # O fechamento assíncrono libera os recursos criados depois disso
+        async def use_async():
+            async with self.controller as controller:
+                controller.capture_screen()
+        
+        asyncio.run(use_async())
+        self.assertEqual(mock_sct.close.call_count, 2)
+    
+    @unittest.skipIf(cv2 is None, "OpenCV não instalado")
+    @patch('src.automation.desktop.controller.mss')
+    def test_capture_screen_gray(self, mock_mss):
+        """Testa a captura em tons de cinza a partir do buffer BGRA do MSS."""
+        mock_sct = mock_mss.mss.return_value
+        frame = np.zeros((50, 100, 4), dtype=np.uint8)
+        frame[..., :3] = 120
+        mock_sct.grab.return_value = frame
+        
+        gray = self.controller.capture_screen_gray((10, 20, 100, 50))
+        
+        mock_sct.grab.assert_called_once_with({"left": 10, "top": 20, "width": 100, "height": 50})
+        self.assertEqual(gray.shape, (50, 100))
+        self.assertEqual(gray.dtype, np.uint8)
+        self.assertTrue((gray == 120).all())
+    
+    @unittest.skipIf(np is None, "NumPy não instalado")
+    @patch('src.automation.desktop.controller.mss', None)
+    def test_capture_screen_and_regions(self):
+        """Testa o recorte de várias regiões a partir de uma única captura."""
+        frame = np.arange(50 * 80 * 4, dtype=np.uint32).astype(np.uint8).reshape(50, 80, 4)
+        
+        with patch.object(self.controller, 'capture_screen', return_value=frame) as mock_capture:
+            captures = self.controller.capture_screen_and_regions(
+                {"tela": None, "regiao": (10, 5, 20, 15)}, return_pil=False
+            )
+        
+        mock_capture.assert_called_once_with(return_pil=False)
+        self.assertIs(captures["tela"], frame)
+        np.testing.assert_array_equal(captures["regiao"], frame[5:20, 10:30])
+    
+    @unittest.skipIf(cv2 is None, "OpenCV não instalado")
+    def test_find_image_on_screen(self):
+        """Testa a localização de imagens na tela com OpenCV."""
+        # Cria uma tela sintética com um padrão conhecido
+        rng = np.random.default_rng(0)
+        screen = rng.integers(0, 255, size=(200, 300), dtype=np.uint8)
+        template = screen[50:90, 120:180].copy()
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            image_path = os.path.join(tmp_dir, "template.png")
+            cv2.imwrite(image_path, template)
+            
+            with patch.object(self.controller, '_grab_screen_array', return_value=(screen, (10, 20))), \
+                    patch('src.automation.desktop.controller._pyramid_down') as mock_down:
+                # A posição retornada é o centro da imagem, deslocado pela origem da captura
+                self.assertEqual(self.controller.find_image_on_screen(image_path), (10 + 150, 20 + 70))
+                
+                # Sem a busca em pirâmide, a versão reduzida da imagem não é calculada
+                mock_down.assert_not_called()
+            
+            # Imagem ausente na tela
+            other = rng.integers(0, 255, size=(200, 300), dtype=np.uint8)
+            with patch.object(self.controller, '_grab_screen_array', return_value=(other, (0, 0))):
+                self.assertIsNone(self.controller.find_image_on_screen(image_path, confidence=0.9))
+            
+            # Com o filtro por histograma, a tela sem as cores da imagem é
+            # descartada sem template matching
+            dark = np.zeros((200, 300), dtype=np.uint8)
+            with patch.object(self.controller, '_grab_screen_array', return_value=(dark, (0, 0))), \
+                    patch.object(cv2, 'matchTemplate') as mock_match:
+                self.assertIsNone(
+                    self.controller.find_image_on_screen(image_path, histogram_filter=True)
+                )
+                mock_match.assert_not_called()
+            
+            # Um arquivo alterado é decodificado novamente
+            cv2.imwrite(image_path, dark[:40, :60])
+            stat = os.stat(image_path)
+            os.utime(image_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            with patch.object(self.controller, '_grab_screen_array', return_value=(dark, (0, 0))):
+                self.assertEqual(self.controller.find_image_on_screen(image_path), (30, 20))
+    
+    @unittest.skipIf(cv2 is None, "OpenCV não instalado")
+    def test_find_image_on_screen_brightness(self):
+        """Testa a localização de uma imagem com o brilho da tela alterado."""
+        rng = np.random.default_rng(3)
+        screen = rng.integers(0, 200, size=(200, 300), dtype=np.uint8)
+        template = screen[50:90, 120:180].copy()
+        brighter = screen + np.uint8(50)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            image_path = os.path.join(tmp_dir, "template.png")
+            cv2.imwrite(image_path, template)
+            
+            with patch.object(
+                self.controller, '_grab_screen_array', return_value=(brighter, (0, 0))
+            ):
+                # O TM_CCOEFF_NORMED ignora a mudança de brilho
+                self.assertEqual(
+                    self.controller.find_image_on_screen(image_path, confidence=0.9), (150, 70)
+                )
+                
+                # O filtro por histograma compara intensidades absolutas e a descarta
+                self.assertIsNone(
+                    self.controller.find_image_on_screen(
+                        image_path, confidence=0.9, histogram_filter=True
+                    )
+                )
+    
+    @unittest.skipIf(cv2 is None, "OpenCV não instalado")
+    def test_find_image_on_screen_pyramid(self):
+        """Testa a busca em pirâmide antes do template matching completo."""
+        rng = np.random.default_rng(2)
+        noise = rng.integers(0, 255, size=(400, 600), dtype=np.uint8)
+        screen = cv2.GaussianBlur(noise, (0, 0), 6)
+        screen = cv2.normalize(screen, None, 0, 255, cv2.NORM_MINMAX)
+        template = screen[100:180, 240:360].copy()
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            image_path = os.path.join(tmp_dir, "template.png")
+            cv2.imwrite(image_path, template)
+            
+            with patch.object(self.controller, '_grab_screen_array', return_value=(screen, (0, 0))):
+                self.assertEqual(
+                    self.controller.find_image_on_screen(image_path, pyramid=True), (300, 140)
+                )
+            
+            # Uma correspondência grosseira fraca descarta a imagem sem a busca completa
+            other = np.ascontiguousarray(screen[::-1, ::-1])
+            with patch.object(self.controller, '_grab_screen_array', return_value=(other, (0, 0))), \
+                    patch.object(cv2, 'matchTemplate', wraps=cv2.matchTemplate) as mock_match:
+                self.assertIsNone(
+                    self.controller.find_image_on_screen(image_path, confidence=0.95, pyramid=True)
+                )
+                mock_match.assert_called_once()
     
+    @unittest.skipIf(cv2 is None, "OpenCV não instalado")
+    def test_find_images_on_screen(self):
+        """Testa a localização de várias imagens com uma única captura."""
+        rng = np.random.default_rng(1)
+        screen = rng.integers(0, 255, size=(200, 300), dtype=np.uint8)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            first = os.path.join(tmp_dir, "primeira.png")
+            second = os.path.join(tmp_dir, "segunda.png")
+            missing = os.path.join(tmp_dir, "ausente.png")
+            cv2.imwrite(first, screen[10:40, 20:60])
+            cv2.imwrite(second, screen[100:140, 200:260])
+            cv2.imwrite(missing, rng.integers(0, 255, size=(30, 30), dtype=np.uint8))
+            
+            with patch.object(
+                self.controller, '_grab_screen_array', return_value=(screen, (0, 0))
+            ) as mock_grab:
+                found = self.controller.find_images_on_screen([first, second, missing])
+            
+            mock_grab.assert_called_once()
+            self.assertEqual(found, {first: (40, 25), second: (230, 120), missing: None})
+    
+    @patch('src.automation.desktop.controller.mss', None)
     @patch('src.automation.desktop.controller.ImageGrab')
     def test_extract_text_from_screen(self, mock_image_grab):
         """Testa a extração de texto da tela."""
@@ -237,11 +725,169 @@ class TestDesktopController(unittest.TestCase):
         self.mock_pytesseract.image_to_string.return_value = "Texto extraído"
         
         # Testa extração de texto
-        text = self.controller.extract_text_from_screen()
+        text = self.controller.extract_text_from_screen(preprocess=False)
         self.assertEqual(text, "Texto extraído")
         
         # Verifica se o OCR foi chamado com a imagem correta
         self.mock_pytesseract.image_to_string.assert_called_once()
+    
+    @patch('src.automation.desktop.controller.mss', None)
+    @patch('src.automation.desktop.controller.ImageGrab')
+    def test_extract_text_from_screen_async(self, mock_image_grab):
+        """Testa a extração de texto em segundo plano."""
+        self.mock_pytesseract.image_to_string.return_value = " Texto extraído \n"
+        
+        future = self.controller.extract_text_from_screen_async(preprocess=False)
+        
+        # A captura ocorre imediatamente; o OCR roda no executor
+        mock_image_grab.grab.assert_called_once_with(bbox=None)
+        self.assertEqual(future.result(timeout=5), "Texto extraído")
+        
+        self.controller.close()
+        self.assertIsNone(self.controller._io_pool)
+    
+    def test_stream_text(self):
+        """Testa a extração contínua de texto com captura em outra thread."""
+        frames = iter(["quadro 1", "quadro 2", "quadro 3", "quadro 4", "quadro 5"])
+        with patch.object(self.controller, '_capture_for_ocr', side_effect=lambda *a: next(frames)), \
+                patch.object(self.controller, '_run_ocr', side_effect=lambda image, *a: f"texto {image}"):
+            stream = self.controller.stream_text(fps=1000)
+            self.assertEqual(next(stream), "texto quadro 1")
+            self.assertEqual(next(stream), "texto quadro 2")
+            stream.close()
+        
+        # A thread de captura é encerrada junto com o gerador
+        names = [thread.name for thread in threading.enumerate()]
+        self.assertNotIn("desktop-stream-capture", names)
+        
+        # Falhas na captura são repassadas a quem consome o gerador
+        with patch.object(self.controller, '_capture_for_ocr', side_effect=OSError("sem tela")):
+            with self.assertRaises(DesktopAutomationError):
+                next(self.controller.stream_text())
+        
+        with self.assertRaises(DesktopAutomationError):
+            next(self.controller.stream_text(fps=0))
+    
+    @patch('src.automation.desktop.controller.os.path.isfile')
+    @patch('src.automation.desktop.controller.shutil.which')
+    @patch('src.automation.desktop.controller.get_settings')
+    def test_resolve_tesseract(self, mock_get_settings, mock_which, mock_isfile):
+        """Testa a localização do executável do Tesseract."""
+        self.addCleanup(_resolve_tesseract.cache_clear)
+        mock_settings = mock_get_settings.return_value
+        
+        # O caminho configurado tem prioridade e o resultado fica em cache
+        _resolve_tesseract.cache_clear()
+        mock_settings.TESSERACT_CMD = "/opt/tesseract"
+        self.assertEqual(_resolve_tesseract(), "/opt/tesseract")
+        mock_settings.TESSERACT_CMD = None
+        self.assertEqual(_resolve_tesseract(), "/opt/tesseract")
+        
+        # Em seguida, o executável no PATH
+        _resolve_tesseract.cache_clear()
+        mock_which.return_value = "/usr/bin/tesseract"
+        self.assertEqual(_resolve_tesseract(), "/usr/bin/tesseract")
+        
+        # Por fim, a instalação padrão do Windows, se existir
+        _resolve_tesseract.cache_clear()
+        mock_which.return_value = None
+        mock_isfile.return_value = False
+        self.assertIsNone(_resolve_tesseract())
+    
+    def test_run_ocr_tesserocr(self):
+        """Testa o reaproveitamento do Tesseract em processo pelo tesserocr."""
+        from PIL import Image as PILImage
+        image = PILImage.new("L", (40, 20))
+        
+        with patch('src.automation.desktop.controller.tesserocr') as mock_tesserocr:
+            api = mock_tesserocr.PyTessBaseAPI.return_value
+            api.GetUTF8Text.return_value = " Texto extraído \n"
+            
+            self.assertEqual(self.controller._run_ocr(image, 'por+eng', '--psm 6'), "Texto extraído")
+            self.controller._run_ocr(image, 'por+eng', '--psm 6')
+            
+            # A instância é criada uma única vez e encerrada no close()
+            mock_tesserocr.PyTessBaseAPI.assert_called_once_with(lang='por+eng', psm=6)
+            api.SetImage.assert_called_with(image)
+            self.mock_pytesseract.image_to_string.assert_not_called()
+            
+            # Configurações não suportadas pelo tesserocr usam o pytesseract
+            self.controller._run_ocr(image, 'por+eng', '--psm 6 --oem 1')
+            self.mock_pytesseract.image_to_string.assert_called_once()
+            
+            self.controller.close()
+            api.End.assert_called_once()
+    
+    @unittest.skipIf(cv2 is None, "OpenCV não instalado")
+    def test_extract_text_regions(self):
+        """Testa a extração de trechos de texto com as posições na tela."""
+        self.mock_pytesseract.image_to_data.return_value = {
+            "text": ["", "Olá", "mundo"],
+            "left": [0, 4, 20],
+            "top": [0, 6, 6],
+            "width": [40, 10, 12],
+            "height": [20, 8, 8],
+            "conf": ["-1", "91.5", "80"],
+        }
+        frame = np.zeros((20, 40), dtype=np.uint8)
+        
+        with patch.object(self.controller, 'capture_screen_gray', return_value=frame):
+            regions = self.controller.extract_text_regions(region=(100, 50, 40, 20), upscale=2)
+        
+        # Coordenadas convertidas para a tela, desfazendo a ampliação
+        self.assertEqual(regions, [
+            TextRegion("Olá", 102, 53, 5, 4, 0.915),
+            TextRegion("mundo", 110, 53, 6, 4, 0.8),
+        ])
+    
+    @unittest.skipIf(cv2 is None, "OpenCV não instalado")
+    @patch('src.automation.desktop.controller.paddleocr')
+    def test_paddle_backend(self, mock_paddleocr):
+        """Testa o OCR com o PaddleOCR, carregando o modelo uma única vez."""
+        engine = mock_paddleocr.PaddleOCR.return_value
+        engine.ocr.return_value = [[
+            [[[4, 6], [14, 6], [14, 14], [4, 14]], ("Olá", 0.98)],
+            [[[20, 6], [32, 6], [32, 14], [20, 14]], ("mundo", 0.9)],
+        ]]
+        controller = DesktopController(ocr_backend="paddle")
+        image = np.zeros((20, 40), dtype=np.uint8)
+        
+        self.assertEqual(controller._run_ocr(image, 'por+eng', '--psm 6'), "Olá\nmundo")
+        regions = controller._ocr_backend.extract_regions(image, 'por+eng', '--psm 6')
+        self.assertEqual(regions[1], TextRegion("mundo", 20, 6, 12, 8, 0.9))
+        
+        mock_paddleocr.PaddleOCR.assert_called_once()
+        self.assertEqual(engine.ocr.call_args[0][0].shape, (20, 40, 3))
+        self.mock_pytesseract.image_to_string.assert_not_called()
+        controller.close()
+        
+        with self.assertRaises(DesktopAutomationError):
+            DesktopController(ocr_backend="inexistente")
+    
+    @unittest.skipIf(cv2 is None, "OpenCV não instalado")
+    def test_extract_text_from_screen_preprocess(self):
+        """Testa o pré-processamento da captura antes do OCR."""
+        self.mock_pytesseract.image_to_string.return_value = " Texto extraído \n"
+        frame = np.zeros((20, 40), dtype=np.uint8)
+        frame[5:15, 10:30] = 200
+        
+        with patch.object(self.controller, 'capture_screen_gray', return_value=frame) as mock_capture:
+            text = self.controller.extract_text_from_screen(region=(0, 0, 40, 20))
+        
+        self.assertEqual(text, "Texto extraído")
+        mock_capture.assert_called_once_with((0, 0, 40, 20))
+        
+        # O OCR recebe uma imagem binária em tons de cinza
+        image = self.mock_pytesseract.image_to_string.call_args[0][0]
+        self.assertEqual(image.shape, (20, 40))
+        self.assertEqual(set(np.unique(image)), {0, 255})
+        
+        # Ampliação antes da binarização
+        with patch.object(self.controller, 'capture_screen_gray', return_value=frame):
+            self.controller.extract_text_from_screen(region=(0, 0, 40, 20), upscale=2)
+        image = self.mock_pytesseract.image_to_string.call_args[0][0]
+        self.assertEqual(image.shape, (40, 80))
+        self.assertEqual(set(np.unique(image)), {0, 255})
 
 
 if __name__ == '__main__':
@@ -0,0 +1,8 @@
+"""
+Testes unitários para o módulo de automação web.
+
+Este pacote contém testes para o gerenciador de navegador e o pool de
+navegadores, com o Playwright substituído por mocks.
+"""
+
+__all__ = ['test_browser']
@@ -0,0 +1,476 @@
+"""
+Testes unitários para o módulo de automação web.
+
+Este módulo contém testes para as classes BrowserManager e BrowserPool, com o
+Playwright substituído por mocks.
+"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+from contextlib import AbstractAsyncContextManager
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
+
+from src.automation.web import browser as browser_module
+from src.automation.web.browser import (
+    BrowserManager, WebAutomationError, create_browser, shutdown_playwright
+)
+from src.automation.web.pool import BrowserPool
+
+
+def _mock_playwright() -> MagicMock:
+    """Cria um mock do Playwright cujos navegadores, contextos e páginas são assíncronos."""
+    playwright = MagicMock()
+    playwright.stop = AsyncMock()
+    browser = playwright.chromium.launch = AsyncMock()
+    browser.return_value.new_context = AsyncMock()
+    context = browser.return_value.new_context.return_value
+    context.add_init_script = AsyncMock()
+    context.clear_cookies = AsyncMock()
+    context.route = AsyncMock()
+    context.close = AsyncMock()
+    context.new_page = AsyncMock()
+    context.new_page.return_value.goto = AsyncMock()
+    browser.return_value.close = AsyncMock()
+    browser.return_value.is_connected = MagicMock(return_value=True)
+    return playwright
+
+
+class TestBrowserManager(unittest.IsolatedAsyncioTestCase):
+    """Testes para as classes BrowserManager e BrowserPool."""
+    
+    def setUp(self):
+        """Configura o ambiente de teste."""
+        self.playwright = _mock_playwright()
+        patcher = patch('src.automation.web.browser.async_playwright')
+        self.mock_async_playwright = patcher.start()
+        self.mock_async_playwright.return_value.start = AsyncMock(return_value=self.playwright)
+        self.addCleanup(patcher.stop)
+        
+        # Cada teste começa sem a instância compartilhada do Playwright
+        patcher = patch.object(browser_module, '_shared_playwright', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(browser_module, '_shared_browsers', {})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(browser_module, '_browser_semaphore', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+    
+    async def test_acquire_release(self):
+        """Testa o empréstimo e a devolução de navegadores pré-iniciados."""
+        async with BrowserPool(size=2, headless=True, downloads_path=self.tmp_dir.name) as pool:
+            # Os navegadores compartilham uma única instância do Playwright
+            self.assertEqual(self.playwright.chromium.launch.await_count, 2)
+            
+            first = await pool.acquire()
+            second = await pool.acquire()
+            self.assertIsNot(first, second)
+            self.assertIs(first.playwright, self.playwright)
+            
+            # Sem navegadores livres, a espera respeita o tempo limite
+            with self.assertRaises(WebAutomationError):
+                await pool.acquire(timeout=0.01)
+            
+            # A devolução limpa os cookies, fecha as páginas extras e libera o navegador
+            popup = MagicMock(close=AsyncMock())
+            first.context.pages = [first.page, popup]
+            await pool.release(first)
+            first.context.clear_cookies.assert_awaited_once()
+            popup.close.assert_awaited_once()
+            first.page.goto.assert_awaited_once_with("about:blank")
+            first.context.close.assert_not_awaited()
+            self.assertIs(await create_browser(pool=pool), first)
+            
+            await pool.release(first)
+            await pool.release(second)
+            async with pool.session() as browser:
+                self.assertIsInstance(browser, BrowserManager)
+            
+            # O pool pode crescer depois de iniciado
+            await pool.warm_up(3)
+            self.assertEqual(pool.size, 5)
+            self.assertEqual(self.playwright.chromium.launch.await_count, 5)
+            third = [await pool.acquire(timeout=1) for _ in range(5)][-1]
+            self.assertIsInstance(third, BrowserManager)
+        
+        # O Playwright continua disponível até ser encerrado explicitamente
+        self.playwright.stop.assert_not_awaited()
+        await shutdown_playwright()
+        self.playwright.stop.assert_awaited_once()
+    
+    async def test_shared_playwright(self):
+        """Testa o compartilhamento de uma única instância do Playwright."""
+        first = BrowserManager(downloads_path=self.tmp_dir.name)
+        second = BrowserManager(downloads_path=self.tmp_dir.name)
+        await first.start()
+        await second.start()
+        await first.close()
+        await second.close()
+        
+        self.mock_async_playwright.return_value.start.assert_awaited_once()
+        self.assertIs(first.playwright, second.playwright)
+        
+        # As opções que escondem a automação são passadas ao Chromium no lançamento
+        launch_kwargs = self.playwright.chromium.launch.call_args.kwargs
+        self.assertIn("--disable-blink-features=AutomationControlled", launch_kwargs["args"])
+        self.assertEqual(launch_kwargs["ignore_default_args"], ["--enable-automation"])
+        self.playwright.stop.assert_not_awaited()
+        
+        await shutdown_playwright()
+        self.playwright.stop.assert_awaited_once()
+    
+    async def test_share_browser(self):
+        """Testa o compartilhamento de um único processo de navegador entre gerenciadores."""
+        managers = [
+            BrowserManager(share_browser=True, headless=True, downloads_path=self.tmp_dir.name)
+            for _ in range(3)
+        ]
+        await asyncio.gather(*(manager.start() for manager in managers))
+        
+        # Um único lançamento, com um contexto por gerenciador
+        launch = self.playwright.chromium.launch
+        launch.assert_awaited_once()
+        self.assertEqual(launch.return_value.new_context.await_count, 3)
+        self.assertTrue(all(manager.browser is launch.return_value for manager in managers))
+        
+        # Fechar um gerenciador fecha só o seu contexto
+        await managers[0].close()
+        launch.return_value.close.assert_not_awaited()
+        
+        # Um navegador compartilhado que caiu é substituído por outro
+        launch.return_value.is_connected.return_value = False
+        manager = BrowserManager(
+            share_browser=True, headless=True, downloads_path=self.tmp_dir.name
+        )
+        await manager.start()
+        self.assertEqual(launch.await_count, 2)
+        launch.return_value.is_connected.return_value = True
+        
+        await shutdown_playwright()
+        launch.return_value.close.assert_awaited_once()
+        
+        # Opções extras são acrescentadas às padrão
+        manager = BrowserManager(
+            share_browser=True, launch_args=["--lang=pt-BR"], downloads_path=self.tmp_dir.name
+        )
+        await manager.start()
+        args = launch.await_args.kwargs["args"]
+        self.assertEqual(args[-1], "--lang=pt-BR")
+        self.assertIn("--disable-blink-features=AutomationControlled", args)
+        
+        # Em modo headless, os serviços dispensáveis do Chromium são desativados
+        cases = ((True, None, True), (True, False, False), (False, None, False))
+        for headless, lean, expected in cases:
+            manager = BrowserManager(headless=headless, lean=lean, downloads_path=self.tmp_dir.name)
+            self.assertEqual("--disable-gpu" in manager.launch_args, expected)
+    
+    async def test_async_context_manager(self):
+        """Testa o uso do gerenciador com `async with`."""
+        async with BrowserManager(downloads_path=self.tmp_dir.name) as browser:
+            self.assertIsInstance(browser, AbstractAsyncContextManager)
+            self.assertIsNotNone(browser.page)
+            launched = browser.browser
+        
+        launched.close.assert_awaited_once()
+        self.assertIsNone(browser.browser)
+        
+        # Uma falha ao fechar não substitui o erro do bloco
+        with self.assertRaisesRegex(ValueError, "erro da tarefa"):
+            async with BrowserManager(downloads_path=self.tmp_dir.name) as browser:
+                browser.browser.close.side_effect = RuntimeError("erro ao fechar")
+                raise ValueError("erro da tarefa")
+        
+        # Sem erro no bloco, a falha ao fechar é propagada
+        with self.assertRaises(WebAutomationError):
+            async with BrowserManager(downloads_path=self.tmp_dir.name):
+                pass
+        launched.close.side_effect = None
+    
+    @patch('src.automation.web.pool.get_settings')
+    @patch('src.automation.web.browser.get_settings')
+    async def test_max_concurrent_browsers(self, mock_get_settings, mock_pool_settings):
+        """Testa o limite de navegadores abertos ao mesmo tempo."""
+        mock_get_settings.return_value.MAX_CONCURRENT_TASKS = 1
+        mock_pool_settings.return_value.MAX_CONCURRENT_TASKS = 1
+        first = BrowserManager(headless=True, downloads_path=self.tmp_dir.name)
+        second = BrowserManager(headless=True, downloads_path=self.tmp_dir.name)
+        await first.start()
+        
+        # O segundo só inicia depois que o primeiro é fechado
+        pending = asyncio.ensure_future(second.start())
+        await asyncio.sleep(0)
+        self.assertFalse(pending.done())
+        await first.close()
+        await asyncio.wait_for(pending, 1)
+        self.assertIsNotNone(second.page)
+        await second.close()
+        
+        # Um pool acima do limite é rejeitado em vez de aguardar para sempre
+        with self.assertRaises(WebAutomationError):
+            BrowserPool(size=2, downloads_path=self.tmp_dir.name)
+    
+    async def test_invalid_browser_type(self):
+        """Testa a validação do navegador antes de iniciar o Playwright."""
+        with self.assertRaises(WebAutomationError):
+            BrowserManager(browser_type="netscape", downloads_path=self.tmp_dir.name)
+        self.mock_async_playwright.assert_not_called()
+        self.assertEqual(
+            BrowserManager(browser_type="Firefox", downloads_path=self.tmp_dir.name).browser_type,
+            "firefox"
+        )
+    
+    async def test_downloads_path(self):
+        """Testa a criação do diretório de downloads uma única vez por diretório."""
+        path = os.path.join(self.tmp_dir.name, "a", "downloads")
+        BrowserManager(downloads_path=path)
+        self.assertTrue(os.path.isdir(path))
+        
+        # O caminho é resolvido na criação e é repassado assim ao contexto
+        browser = BrowserManager(downloads_path=os.path.relpath(path))
+        self.assertEqual(str(browser.downloads_path), os.path.realpath(path))
+        await browser.start()
+        self.assertEqual(
+            browser.browser.new_context.await_args.kwargs["downloads_path"],
+            os.path.realpath(path),
+        )
+        
+        with patch('src.automation.web.browser.Path.mkdir') as mock_mkdir:
+            BrowserManager(downloads_path=path)
+        mock_mkdir.assert_not_called()
+        
+        # O diretório padrão é resolvido a partir do diretório atual na criação
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.tmp_dir.name)
+        browser = BrowserManager()
+        self.assertEqual(
+            str(browser.downloads_path),
+            os.path.realpath(os.path.join(self.tmp_dir.name, "downloads")),
+        )
+    
+    async def test_extract_data(self):
+        """Testa a extração de todos os campos em uma única chamada ao navegador."""
+        browser = BrowserManager(downloads_path=self.tmp_dir.name)
+        browser.page = MagicMock()
+        browser.page.evaluate = AsyncMock(return_value={
+            "values": {"titulo": "Python", "ausente": None},
+            "failed": ["botao"],
+        })
+        element = MagicMock(evaluate=AsyncMock(return_value="Enviar"))
+        browser.page.query_selector = AsyncMock(return_value=element)
+        
+        selectors = {"titulo": "h1", "ausente": "#nada", "botao": "text=Enviar"}
+        data = await browser.extract_data(selectors)
+        
+        self.assertEqual(data, {"titulo": "Python", "ausente": None, "botao": "Enviar"})
+        browser.page.evaluate.assert_awaited_once_with(ANY, selectors)
+        
+        # Somente o seletor que não é CSS é consultado individualmente
+        browser.page.query_selector.assert_awaited_once_with("text=Enviar")
+        element.evaluate.assert_awaited_once()
+    
+    async def test_extract_data_local_parse_unavailable(self):
+        """Testa o erro da extração local sem o lxml instalado."""
+        browser = BrowserManager(downloads_path=self.tmp_dir.name)
+        browser.page = MagicMock()
+        with patch.object(browser_module, 'lxml', None):
+            with self.assertRaises(WebAutomationError):
+                await browser.extract_data({"titulo": "h1"}, use_local_parse=True)
+    
+    @unittest.skipIf(browser_module.lxml is None, "lxml não instalado")
+    async def test_extract_data_local_parse(self):
+        """Testa a extração a partir de uma cópia local do HTML."""
+        browser = BrowserManager(downloads_path=self.tmp_dir.name)
+        browser.page = MagicMock()
+        browser.page.content = AsyncMock(return_value=(
+            "<html><body><h1> Python </h1><input name='q' value=' busca '></body></html>"
+        ))
+        browser.page.evaluate = AsyncMock()
+        browser.page.query_selector = AsyncMock(return_value=None)
+        
+        data = await browser.extract_data(
+            {"titulo": "h1", "campo": "input", "ausente": "#nada", "botao": "text=Enviar"},
+            use_local_parse=True,
+        )
+        
+        self.assertEqual(
+            data, {"titulo": "Python", "campo": "busca", "ausente": None, "botao": None}
+        )
+        browser.page.evaluate.assert_not_awaited()
+        browser.page.query_selector.assert_awaited_once_with("text=Enviar")
+    
+    async def test_extract_all(self):
+        """Testa a extração de todos os elementos de cada seletor."""
+        browser = BrowserManager(downloads_path=self.tmp_dir.name)
+        browser.page = MagicMock()
+        browser.page.evaluate = AsyncMock(return_value={
+            "values": {"itens": ["A", "B"], "ausente": []},
+            "failed": ["botoes"],
+        })
+        browser.page.locator.return_value.evaluate_all = AsyncMock(return_value=["Enviar"])
+        
+        selectors = {"botoes": "text=Enviar", "itens": "li", "ausente": "#nada"}
+        data = await browser.extract_all(selectors)
+        
+        self.assertEqual(data, {"botoes": ["Enviar"], "itens": ["A", "B"], "ausente": []})
+        self.assertEqual(list(data), list(selectors))
+        browser.page.locator.assert_called_once_with("text=Enviar")
+        
+        browser.page.evaluate.side_effect = RuntimeError("página fechada")
+        with self.assertRaises(WebAutomationError):
+            await browser.extract_all(selectors)
+    
+    async def test_extract_list(self):
+        """Testa a extração de todas as linhas de uma lista em uma única chamada."""
+        browser = BrowserManager(downloads_path=self.tmp_dir.name)
+        await browser.start()
+        rows = [{"nome": "A", "preco": "1"}, {"nome": "B", "preco": None}]
+        browser.page.eval_on_selector_all = AsyncMock(return_value=rows)
+        
+        fields = {"nome": "td.nome", "preco": "td.preco"}
+        self.assertEqual(await browser.extract_list("table tr", fields), rows)
+        browser.page.eval_on_selector_all.assert_awaited_once_with("table tr", ANY, fields)
+        
+        browser.page.eval_on_selector_all.side_effect = RuntimeError("seletor inválido")
+        with self.assertRaises(WebAutomationError):
+            await browser.extract_list("table tr", fields)
+    
+    async def test_navigate(self):
+        """Testa a navegação, aguardando apenas o DOM por padrão."""
+        browser = BrowserManager(downloads_path=self.tmp_dir.name)
+        browser.page = MagicMock(
+            goto=AsyncMock(), wait_for_load_state=AsyncMock(), title=AsyncMock(return_value="Início")
+        )
+        
+        await browser.navigate("https://example.com")
+        browser.page.goto.assert_awaited_once_with("https://example.com", wait_until="domcontentloaded")
+        browser.page.wait_for_load_state.assert_not_awaited()
+        
+        await browser.navigate("https://example.com", network_idle=True)
+        browser.page.wait_for_load_state.assert_awaited_once_with("networkidle")
+        
+        # O título é aguardado para o log, e não consultado se o nível INFO estiver desativado
+        browser.page.title.reset_mock()
+        with patch.object(browser_module.logger, 'isEnabledFor', return_value=True):
+            await browser.navigate("https://example.com")
+        browser.page.title.assert_awaited_once()
+        with patch.object(browser_module.logger, 'isEnabledFor', return_value=False):
+            await browser.navigate("https://example.com")
+        browser.page.title.assert_awaited_once()
+        
+        browser.page.goto.side_effect = RuntimeError("sem rede")
+        with self.assertRaises(WebAutomationError):
+            await browser.navigate("https://example.com")
+    
+    async def test_use_page(self):
+        """Testa o reaproveitamento da página entre URLs."""
+        browser = BrowserManager(headless=True, downloads_path=self.tmp_dir.name)
+        await browser.start()
+        page = browser.page
+        page.goto = AsyncMock()
+        
+        for url in ("https://example.com/1", "https://example.com/2"):
+            async with browser.use_page(url) as current:
+                self.assertIs(current, page)
+        
+        self.assertEqual(page.goto.await_args_list[-1].args, ("about:blank",))
+        self.assertEqual(page.goto.await_count, 4)
+        browser.context.new_page.assert_awaited_once()
+        
+        # Sem `blank`, a página permanece no último endereço
+        page.goto.reset_mock()
+        async with browser.use_page("https://example.com/3", blank=False):
+            pass
+        page.goto.assert_awaited_once_with("https://example.com/3", wait_until="domcontentloaded")
+    
+    async def test_click(self):
+        """Testa o clique com espera opcional pela navegação."""
+        browser = BrowserManager(downloads_path=self.tmp_dir.name)
+        browser.page = MagicMock(
+            click=AsyncMock(), wait_for_load_state=AsyncMock(), wait_for_url=AsyncMock()
+        )
+        
+        await browser.click("#enviar")
+        browser.page.wait_for_load_state.assert_not_awaited()
+        
+        await browser.click("#enviar", wait_for_navigation=True)
+        browser.page.wait_for_load_state.assert_awaited_once_with("domcontentloaded")
+        
+        await browser.click("#enviar", url="**/painel")
+        browser.page.wait_for_url.assert_awaited_once_with("**/painel", wait_until="domcontentloaded")
+        self.assertEqual(browser.page.click.await_count, 3)
+    
+    async def test_fill_form(self):
+        """Testa o preenchimento de formulário após esperar todos os campos."""
+        browser = BrowserManager(downloads_path=self.tmp_dir.name)
+        browser.page = MagicMock()
+        locators = {}
+        
+        def locator(field_selector):
+            mock = locators[field_selector] = MagicMock()
+            mock.wait_for = AsyncMock()
+            mock.fill = AsyncMock()
+            return mock
+        
+        form = browser.page.locator.return_value
+        form.locator.side_effect = locator
+        await browser.fill_form("#login", {"usuario": "ana", "idade": 30, 'e"mail': "x"})
+        
+        browser.page.locator.assert_called_once_with("#login")
+        self.assertEqual(
+            list(locators), ['[name="usuario"]', '[name="idade"]', '[name="e\\"mail"]']
+        )
+        for mock in locators.values():
+            mock.wait_for.assert_awaited_once()
+        locators['[name="idade"]'].fill.assert_awaited_once_with("30")
+        
+        # Falhas do Playwright são convertidas em WebAutomationError
+        form.locator.side_effect = None
+        form.locator.return_value.wait_for = AsyncMock(side_effect=TimeoutError("tempo"))
+        with self.assertRaises(WebAutomationError):
+            await browser.fill_form("#login", {"usuario": "ana"})
+    
+    async def test_filter_request(self):
+        """Testa o bloqueio de recursos e domínios nas requisições."""
+        browser = BrowserManager(
+            downloads_path=self.tmp_dir.name,
+            disable_resources=True,
+            blocked_domains={"Analytics.com"},
+        )
+        await browser.start()
+        browser.context.route.assert_awaited_once_with("**/*", browser._filter_request)
+        
+        async def handle(resource_type, url):
+            route = MagicMock(abort=AsyncMock(), continue_=AsyncMock())
+            route.request.resource_type = resource_type
+            route.request.url = url
+            await browser._filter_request(route)
+            return route.abort.await_count == 1
+        
+        self.assertTrue(await handle("image", "https://example.com/logo.png"))
+        self.assertTrue(await handle("script", "https://cdn.analytics.com/a.js"))
+        self.assertFalse(await handle("script", "https://example.com/app.js"))
+        self.assertFalse(await handle("document", "https://notanalytics.com/"))
+        await browser.close()
+    
+    async def test_start_failure(self):
+        """Testa o encerramento do pool quando um navegador não inicia."""
+        launch = self.playwright.chromium.launch
+        launch.side_effect = [launch.return_value, RuntimeError("falhou")]
+        pool = BrowserPool(size=2, downloads_path=self.tmp_dir.name)
+        
+        with self.assertRaises(WebAutomationError):
+            await pool.start()
+        launch.return_value.close.assert_awaited_once()
+        
+        with self.assertRaises(WebAutomationError):
+            await pool.acquire()
+
+
+if __name__ == '__main__':
+    unittest.main()
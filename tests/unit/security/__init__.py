@@ -0,0 +1,7 @@
+"""
+Testes unitários para o módulo de segurança.
+
+Este pacote contém testes para a autenticação, os tokens JWT e as permissões.
+"""
+
+__all__ = ['test_auth']
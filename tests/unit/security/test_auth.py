@@ -0,0 +1,165 @@
+"""
+Testes unitários para o módulo de autenticação.
+
+Este módulo contém testes para a criação e a verificação de tokens JWT, para o
+cache de tokens já verificados, para as permissões e para a busca de usuários.
+"""
+
+import time
+import unittest
+from datetime import timedelta
+from unittest.mock import patch
+
+try:
+    import jwt
+    from src.security import auth
+    from src.config import get_settings
+except ImportError:
+    # O PyJWT e o cryptography (usado pelo módulo de criptografia) são opcionais nos testes
+    jwt = auth = None
+
+
+@unittest.skipIf(auth is None, "PyJWT ou cryptography não instalados")
+class TestAuth(unittest.TestCase):
+    """Testes para os tokens JWT do módulo de autenticação."""
+    
+    def setUp(self):
+        """Esvazia o cache de tokens antes e depois de cada teste."""
+        auth._token_cache.clear()
+        self.addCleanup(auth._token_cache.clear)
+        self.credentials_exception = ValueError("Credenciais inválidas")
+    
+    def test_token_round_trip(self):
+        """Testa a criação e a verificação de um token de acesso."""
+        token = auth.create_access_token({"sub": "ana", "scopes": ["user"]})
+        
+        self.assertEqual(
+            auth.verify_token(token, self.credentials_exception),
+            {"sub": "ana", "scopes": ("user",)},
+        )
+        
+        # `exp` é um inteiro em segundos desde a época Unix
+        payload = jwt.decode(token, options={"verify_signature": False})
+        self.assertIsInstance(payload["exp"], int)
+        self.assertAlmostEqual(payload["exp"], time.time() + 15 * 60, delta=5)
+    
+    def test_verify_token_errors(self):
+        """Testa que tokens expirados ou inválidos geram a exceção de credenciais."""
+        expired = auth.create_access_token({"sub": "ana"}, timedelta(seconds=-10))
+        forged = jwt.encode({"sub": "ana"}, "outra_chave", algorithm="HS256")
+        without_sub = auth.create_access_token({"scopes": ["user"]})
+        
+        for token in (expired, forged, "nao.e.um.token", without_sub):
+            with self.subTest(token=token):
+                with self.assertRaises(ValueError) as context:
+                    auth.verify_token(token, self.credentials_exception)
+                self.assertIs(context.exception, self.credentials_exception)
+    
+    def test_decode_token_cache_hit(self):
+        """Testa que um token repetido não tem a assinatura verificada de novo."""
+        token = auth.create_access_token({"sub": "ana"})
+        
+        with patch("jwt.decode", wraps=jwt.decode) as mock_decode:
+            payload = auth._decode_token(token)
+            self.assertEqual(auth._decode_token(token), payload)
+        
+        mock_decode.assert_called_once()
+        
+        # O chamador recebe uma cópia: alterá-la não afeta o cache
+        payload["sub"] = "outro"
+        self.assertEqual(auth._decode_token(token)["sub"], "ana")
+    
+    def test_decode_token_cached_expiry(self):
+        """Testa que um token em cache é rejeitado e removido ao expirar."""
+        token = auth.create_access_token({"sub": "ana"}, timedelta(seconds=60))
+        auth._decode_token(token)
+        self.assertEqual(len(auth._token_cache), 1)
+        
+        with patch.object(auth, "time") as mock_time:
+            mock_time.time.return_value = time.time() + 120
+            with self.assertRaises(jwt.ExpiredSignatureError):
+                auth._decode_token(token)
+            self.assertEqual(len(auth._token_cache), 0)
+            
+            with self.assertRaises(ValueError):
+                auth.verify_token(token, self.credentials_exception)
+    
+    def test_decode_token_secret_rotation(self):
+        """Testa que a troca da chave secreta esvazia o cache de tokens."""
+        token = auth.create_access_token({"sub": "ana"})
+        auth._decode_token(token)
+        
+        with patch.object(get_settings(), "SECRET_KEY", "nova_chave_secreta_1234567890"):
+            with self.assertRaises(jwt.InvalidSignatureError):
+                auth._decode_token(token)
+            self.assertEqual(len(auth._token_cache), 0)
+    
+    @patch("src.security.auth._TOKEN_CACHE_SIZE", 2)
+    def test_decode_token_cache_full(self):
+        """Testa que o cache cheio descarta o token mais antigo."""
+        tokens = [auth.create_access_token({"sub": name}) for name in ("ana", "bia", "caio")]
+        for token in tokens:
+            auth._decode_token(token)
+        
+        self.assertEqual([token for token, _ in auth._token_cache], tokens[1:])
+    
+    def test_decode_token_not_cached_when_invalid(self):
+        """Testa que um token com assinatura inválida não entra no cache."""
+        token = jwt.encode({"sub": "ana"}, "outra_chave", algorithm="HS256")
+        
+        with self.assertRaises(jwt.InvalidSignatureError):
+            auth._decode_token(token)
+        self.assertEqual(len(auth._token_cache), 0)
+    
+    def test_decode_token_long_token_bypasses_cache(self):
+        """Testa que tokens maiores que o limite são sempre decodificados."""
+        token = auth.create_access_token({"sub": "ana", "dados": "x" * 5000})
+        self.assertGreater(len(token), auth._MAX_CACHED_TOKEN_LENGTH)
+        
+        with patch("jwt.decode", wraps=jwt.decode) as mock_decode:
+            auth._decode_token(token)
+            auth._decode_token(token)
+        
+        self.assertEqual(mock_decode.call_count, 2)
+        self.assertEqual(len(auth._token_cache), 0)
+    
+    def test_check_permissions(self):
+        """Testa a verificação de permissões com listas, tuplas e conjuntos."""
+        self.assertTrue(auth.check_permissions(["admin"], ["user", "admin"]))
+        self.assertTrue(auth.check_permissions(("admin", "user"), ("user",)))
+        self.assertTrue(auth.check_permissions(frozenset({"user"}), frozenset({"user"})))
+        self.assertFalse(auth.check_permissions(["admin"], ("user",)))
+        self.assertFalse(auth.check_permissions(("admin",), frozenset()))
+        
+        # Sem permissões exigidas, qualquer token é aceito
+        self.assertTrue(auth.check_permissions([], ()))
+        
+        token_data = auth.TokenData(username="ana", scopes=("user",))
+        self.assertIs(token_data.scope_set, token_data.scope_set)
+        self.assertTrue(auth.check_permissions(["user"], token_data.scope_set))
+    
+    @patch("src.security.auth.get_password_hash", lambda password: f"hash-{password}")
+    def test_get_user(self):
+        """Testa a busca de usuários com e sem validação do modelo."""
+        auth._fake_users_db.cache_clear()
+        self.addCleanup(auth._fake_users_db.cache_clear)
+        settings = get_settings()
+        
+        for validate in (False, True):
+            with self.subTest(validate=validate), \
+                 patch.object(settings, "VALIDATE_USER_MODEL", validate), \
+                 patch.object(
+                     auth.UserInDB, "model_construct", wraps=auth.UserInDB.model_construct
+                 ) as mock_construct:
+                user = auth.get_user(None, "admin")
+                
+                self.assertIsInstance(user, auth.UserInDB)
+                self.assertEqual(user.username, "admin")
+                self.assertEqual(user.hashed_password, "hash-admin")
+                self.assertEqual(user.scopes, ("admin", "user"))
+                self.assertEqual(mock_construct.called, not validate)
+                self.assertIsNone(auth.get_user(None, "desconhecido"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Testes unitários para o módulo de configuração.
+
+Este módulo contém testes para a leitura das configurações e para a
+configuração do logging com QueueListener.
+"""
+
+import logging
+import os
+import tempfile
+import unittest
+from logging.handlers import QueueHandler
+from pathlib import Path
+from unittest.mock import patch
+
+from src.config import get_settings, setup_logging, stop_logging
+
+
+class TestSettings(unittest.TestCase):
+    """Testes para a função get_settings."""
+    
+    def test_get_settings_env_file(self):
+        """Testa a leitura do .env do diretório atual e a exportação dos proxies."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        Path(tmp_dir.name, ".env").write_text(
+            "HTTP_PROXY=http://proxy:3128\nWINDOW_WIDTH=1600\n", encoding="utf-8"
+        )
+        
+        patcher = patch.dict(os.environ)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        os.environ.pop("HTTP_PROXY", None)
+        
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp_dir.name)
+        get_settings.cache_clear()
+        self.addCleanup(get_settings.cache_clear)
+        
+        settings = get_settings()
+        self.assertEqual(settings.WINDOW_WIDTH, 1600)
+        self.assertEqual(settings.HTTP_PROXY, "http://proxy:3128")
+        self.assertEqual(os.environ["HTTP_PROXY"], "http://proxy:3128")
+        
+        # Chaves sem campo correspondente não são exportadas
+        self.assertNotIn("WINDOW_WIDTH", os.environ)
+
+
+class TestSetupLogging(unittest.TestCase):
+    """Testes para a função setup_logging."""
+    
+    def setUp(self):
+        """Grava o log em um diretório temporário e restaura os loggers ao final."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.log_file = Path(self.tmp_dir.name) / "automation.log"
+        
+        loggers = [logging.getLogger(), logging.getLogger("__main__")]
+        saved = [(logger, logger.handlers[:], logger.level, logger.propagate) for logger in loggers]
+        
+        def restore():
+            for logger, handlers, level, propagate in saved:
+                logger.handlers = handlers
+                logger.setLevel(level)
+                logger.propagate = propagate
+        
+        self.addCleanup(restore)
+        self.addCleanup(stop_logging)
+        
+        patcher = patch.object(get_settings(), "LOG_FILE", self.log_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_setup_logging(self):
+        """Testa que as mensagens passam pela fila e chegam ao arquivo."""
+        listener = setup_logging()
+        self.addCleanup(lambda: [handler.close() for handler in listener.handlers])
+        
+        # Uma segunda chamada não inicia outro listener
+        self.assertIs(setup_logging(), listener)
+        
+        root = logging.getLogger()
+        self.assertEqual(len(root.handlers), 1)
+        self.assertIsInstance(root.handlers[0], QueueHandler)
+        
+        logging.getLogger("teste").warning("mensagem enfileirada")
+        
+        # Parar o listener escreve as mensagens pendentes
+        stop_logging()
+        self.assertIn("mensagem enfileirada", self.log_file.read_text(encoding="utf-8"))
+        stop_logging()
+
+
+if __name__ == "__main__":
+    unittest.main()